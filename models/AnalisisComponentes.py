@@ -0,0 +1,263 @@
+"""Módulo que implementa el análisis del grafo de dependencias por componentes débilmente conexas.
+   Los módulos de componentes distintas no comparten aristas, así que la detección de ciclos, el
+   ordenamiento topológico y las estadísticas de cada componente son independientes. Las componentes
+   se reparten en lotes entre los procesos de un ProcessPoolExecutor y los resultados parciales se
+   combinan en los mismos formatos que devuelve GrafoDependencias.
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _analizar_lote(modulos, aristas):
+    """
+    Reconstruye un lote de componentes como grafo y lo analiza. Es una
+    función de módulo para que pueda enviarse a un pool de procesos.
+    
+    Args:
+        modulos (list): Módulos del lote en el orden de inserción del grafo
+        aristas (list): Tuplas (origen, destino) del lote
+    
+    Returns:
+        tuple: Resultado de _analizar
+    """
+    # Importación diferida: models.Grafo importa este módulo
+    from models.Grafo import GrafoDependencias
+    
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(modulos)
+    grafo.agregar_dependencias_lote(aristas)
+    
+    return _analizar(grafo)
+
+
+def _analizar(grafo):
+    """
+    Detecta ciclos, ordena y calcula estadísticas de un grafo
+    
+    Args:
+        grafo (GrafoDependencias): Grafo (o lote de componentes) a analizar
+    
+    Returns:
+        tuple: (list, list, list, bool, dict) - (ciclos, raíz del recorrido
+               en profundidad de cada ciclo, orden topológico de los módulos
+               que pueden ordenarse, si quedaron módulos pendientes,
+               estadísticas)
+    """
+    orden, pendientes = grafo.orden_kahn()
+    _, ciclos = grafo.detectar_ciclos()
+    
+    return (ciclos, _raices(grafo, ciclos), orden, bool(pendientes), grafo.obtener_estadisticas())
+
+
+def _raices(grafo, ciclos):
+    """
+    Obtiene la raíz del árbol del recorrido en profundidad (el de Tarjan en
+    detectar_ciclos) que encontró cada ciclo. Los recorridos empiezan en los
+    módulos en orden de inserción, así que la raíz de un módulo es el primer
+    módulo insertado que lo alcanza; se calcula con un barrido en anchura
+    por raíz en O(V + E).
+    
+    Args:
+        grafo (GrafoDependencias): Grafo analizado
+        ciclos (list): Ciclos de detectar_ciclos
+    
+    Returns:
+        list: Raíz de cada ciclo
+    """
+    if not ciclos:
+        return []
+    
+    raiz_de = {}
+    for raiz in grafo.modulos:
+        if raiz in raiz_de:
+            continue
+        raiz_de[raiz] = raiz
+        cola = [raiz]
+        for modulo in cola:
+            for dependencia in grafo.dependencias[modulo]:
+                if dependencia not in raiz_de:
+                    raiz_de[dependencia] = raiz
+                    cola.append(dependencia)
+    
+    return [raiz_de[ciclo[0]] for ciclo in ciclos]
+
+
+class AnalisisComponentes:
+    """Clase que analiza en paralelo las componentes débilmente conexas de un grafo"""
+    
+    def __init__(self, grafo, max_trabajadores=None):
+        """
+        Divide el grafo en componentes débilmente conexas en O(V + E)
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a analizar
+            max_trabajadores (int): Cantidad de procesos (None = núcleos
+                                    disponibles; 1 = analizar en este proceso)
+        """
+        self.grafo = grafo
+        self.max_trabajadores = max_trabajadores
+        # Componentes (listas de módulos en orden de inserción), numeradas
+        # por la posición de su primer módulo en el grafo
+        self.componentes = self._dividir(grafo)
+    
+    def analizar(self):
+        """
+        Detecta ciclos, ordena topológicamente y calcula estadísticas de cada
+        componente y combina los resultados. Los ciclos quedan en el orden de
+        detectar_ciclos y el orden topológico es el de ordenamiento_topologico
+        fuera del modo acíclico (el desempate alfabético se conserva al mezclar
+        los órdenes parciales).
+        
+        Returns:
+            dict: Reporte con "ciclos" (formato de detectar_ciclos), "orden"
+                  (formato de ordenamiento_topologico), "estadisticas" (formato
+                  de obtener_estadisticas), la cantidad de componentes, los
+                  trabajadores usados y el tiempo de análisis
+        """
+        inicio = time.perf_counter()
+        resultados = self._repartir()
+        
+        ciclos = []
+        raices = []
+        ordenes = []
+        hay_pendientes = False
+        estadisticas = {
+            "total_modulos": 0,
+            "total_dependencias": 0,
+            "modulos_independientes": 0,
+            "modulos_sin_dependientes": 0,
+            "tiene_ciclos": False,
+            "cantidad_ciclos": 0
+        }
+        
+        for ciclos_lote, raices_lote, orden_lote, pendientes_lote, estadisticas_lote in resultados:
+            ciclos.extend(ciclos_lote)
+            raices.extend(raices_lote)
+            ordenes.append(orden_lote)
+            hay_pendientes = hay_pendientes or pendientes_lote
+            for clave, valor in estadisticas_lote.items():
+                if clave == "tiene_ciclos":
+                    estadisticas[clave] = estadisticas[clave] or valor
+                else:
+                    estadisticas[clave] += valor
+        
+        # detectar_ciclos reporta los ciclos de cada árbol del recorrido en
+        # profundidad en el orden de inserción de su raíz. Los árboles no
+        # cruzan componentes, así que basta con ordenar por la posición de la
+        # raíz; el ordenamiento estable conserva el orden dentro de cada árbol
+        if len(resultados) > 1 and ciclos:
+            posicion = {modulo: indice for indice, modulo in enumerate(self.grafo.modulos)}
+            indices = sorted(range(len(ciclos)), key=lambda indice: posicion[raices[indice]])
+            ciclos = [ciclos[indice] for indice in indices]
+        
+        # Cada orden parcial saca siempre el menor módulo disponible, así que
+        # mezclarlos da el mismo resultado que el algoritmo de Kahn completo
+        orden = None if hay_pendientes else list(heapq.merge(*ordenes))
+        
+        return {
+            "ciclos": (len(ciclos) > 0, ciclos),
+            "orden": orden,
+            "estadisticas": estadisticas,
+            "componentes": len(self.componentes),
+            "trabajadores": len(resultados),
+            "tiempo": time.perf_counter() - inicio
+        }
+    
+    def _dividir(self, grafo):
+        """
+        Calcula las componentes débilmente conexas (recorrido en anchura
+        siguiendo dependencias y dependientes)
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a dividir
+        
+        Returns:
+            list: Lista de componentes, cada una con sus módulos en el orden
+                  de inserción del grafo
+        """
+        componente_de = {}
+        cantidad = 0
+        
+        for raiz in grafo.modulos:
+            if raiz in componente_de:
+                continue
+            componente_de[raiz] = cantidad
+            cola = [raiz]
+            for modulo in cola:
+                for adyacencia in (grafo.dependencias, grafo.dependientes):
+                    for vecino in adyacencia[modulo]:
+                        if vecino not in componente_de:
+                            componente_de[vecino] = cantidad
+                            cola.append(vecino)
+            cantidad += 1
+        
+        componentes = [[] for _ in range(cantidad)]
+        for modulo in grafo.modulos:
+            componentes[componente_de[modulo]].append(modulo)
+        
+        return componentes
+    
+    def _armar_lotes(self):
+        """
+        Agrupa las componentes en un lote por trabajador, equilibrando la
+        cantidad de módulos y aristas (la componente más grande pendiente va
+        al lote más liviano)
+        
+        Returns:
+            list: Lotes no vacíos como tuplas (modulos, aristas)
+        """
+        dependencias = self.grafo.dependencias
+        trabajadores = self._cantidad_trabajadores(len(self.componentes))
+        
+        tamanos = [
+            len(componente) + sum(len(dependencias[modulo]) for modulo in componente)
+            for componente in self.componentes
+        ]
+        livianos = [(0, indice) for indice in range(trabajadores)]
+        asignadas = [[] for _ in range(trabajadores)]
+        for indice in sorted(range(len(self.componentes)), key=lambda i: -tamanos[i]):
+            carga, lote = heapq.heappop(livianos)
+            asignadas[lote].append(indice)
+            heapq.heappush(livianos, (carga + tamanos[indice], lote))
+        
+        lotes = []
+        for indices in asignadas:
+            if not indices:
+                continue
+            # Conservar el orden de inserción para que cada lote encuentre los
+            # mismos ciclos (y raíces) que detectar_ciclos sobre el grafo completo
+            indices.sort()
+            modulos = [modulo for indice in indices for modulo in self.componentes[indice]]
+            aristas = [
+                (modulo, dependencia)
+                for modulo in modulos
+                for dependencia in dependencias[modulo]
+            ]
+            lotes.append((modulos, aristas))
+        
+        return lotes
+    
+    def _repartir(self):
+        """
+        Analiza cada lote en un proceso del pool (o el grafo completo en
+        este proceso si hay un solo trabajador)
+        
+        Returns:
+            list: Resultado de _analizar para cada lote, en orden
+        """
+        if self._cantidad_trabajadores(len(self.componentes)) <= 1:
+            # Sin reconstruir: el grafo completo es un único lote
+            return [_analizar(self.grafo)]
+        
+        lotes = self._armar_lotes()
+        with ProcessPoolExecutor(max_workers=len(lotes)) as pool:
+            futuros = [pool.submit(_analizar_lote, modulos, aristas) for modulos, aristas in lotes]
+            return [futuro.result() for futuro in futuros]
+    
+    def _cantidad_trabajadores(self, cantidad_componentes):
+        """Calcula la cantidad de procesos a usar (nunca más que componentes)"""
+        trabajadores = self.max_trabajadores or os.cpu_count() or 1
+        return max(1, min(trabajadores, cantidad_componentes))
@@ -0,0 +1,159 @@
+"""Módulo que implementa una caché LRU de clausuras transitivas para el grafo de dependencias.
+   Guarda las dependencias transitivas (clausura directa) y los módulos afectados
+   (clausura inversa) de cada módulo consultado, e invalida solo las entradas que
+   una modificación del grafo puede cambiar.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class CacheClausuras:
+    """Clase que representa una caché LRU de clausuras directas e inversas"""
+    
+    def __init__(self, capacidad=1024):
+        """
+        Inicializa la caché vacía
+        
+        Args:
+            capacidad (int): Cantidad máxima de clausuras guardadas (sumando
+                             directas e inversas)
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        
+        self.capacidad = capacidad
+        # Clausuras: modulo -> dict (conjunto ordenado) de módulos alcanzados
+        self.directas = OrderedDict()
+        self.inversas = OrderedDict()
+        # Contadores para dimensionar la caché
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.invalidaciones = 0
+        # Las consultas de varios hilos (modo concurrente del grafo) pueden
+        # actualizar el orden LRU al mismo tiempo
+        self._bloqueo = threading.Lock()
+    
+    def obtener_directa(self, modulo):
+        """
+        Obtiene la clausura directa (dependencias transitivas) guardada
+        
+        Args:
+            modulo (str): Nombre del módulo
+        
+        Returns:
+            dict: Módulos alcanzados, o None si no está en caché
+        """
+        return self._obtener(self.directas, modulo)
+    
+    def obtener_inversa(self, modulo):
+        """
+        Obtiene la clausura inversa (módulos afectados) guardada
+        
+        Args:
+            modulo (str): Nombre del módulo
+        
+        Returns:
+            dict: Módulos que lo alcanzan, o None si no está en caché
+        """
+        return self._obtener(self.inversas, modulo)
+    
+    def guardar_directa(self, modulo, clausura):
+        """Guarda la clausura directa de un módulo"""
+        self._guardar(self.directas, modulo, clausura)
+    
+    def guardar_inversa(self, modulo, clausura):
+        """Guarda la clausura inversa de un módulo"""
+        self._guardar(self.inversas, modulo, clausura)
+    
+    def invalidar_arista(self, modulo_origen, modulo_destino):
+        """
+        Invalida las clausuras que pueden cambiar al agregar o eliminar la
+        arista modulo_origen -> modulo_destino
+        
+        Solo cambia la clausura directa de los módulos que alcanzan al origen
+        y la clausura inversa de los módulos alcanzables desde el destino; se
+        comprueba con la propia clausura guardada, en O(1) por entrada.
+        
+        Args:
+            modulo_origen (str): Módulo que depende
+            modulo_destino (str): Módulo del que depende
+        """
+        self._invalidar(self.directas, modulo_origen)
+        self._invalidar(self.inversas, modulo_destino)
+    
+    def invalidar_modulo(self, nombre):
+        """
+        Invalida las clausuras que pueden cambiar al eliminar un módulo
+        (las que lo contienen y las del propio módulo)
+        
+        Args:
+            nombre (str): Nombre del módulo eliminado
+        """
+        self._invalidar(self.directas, nombre)
+        self._invalidar(self.inversas, nombre)
+    
+    def limpiar(self):
+        """Elimina todas las entradas de la caché (los contadores se conservan)"""
+        with self._bloqueo:
+            self.invalidaciones += len(self.directas) + len(self.inversas)
+            self.directas.clear()
+            self.inversas.clear()
+    
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas de uso de la caché
+        
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        consultas = self.aciertos + self.fallos
+        
+        return {
+            "capacidad": self.capacidad,
+            "entradas": len(self.directas) + len(self.inversas),
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "invalidaciones": self.invalidaciones,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0
+        }
+    
+    def _obtener(self, tabla, modulo):
+        """Busca una clausura y la marca como usada recientemente"""
+        with self._bloqueo:
+            clausura = tabla.get(modulo)
+            
+            if clausura is None:
+                self.fallos += 1
+                return None
+            
+            tabla.move_to_end(modulo)
+            self.aciertos += 1
+            return clausura
+    
+    def _guardar(self, tabla, modulo, clausura):
+        """Guarda una clausura desalojando la menos usada si se excede la capacidad"""
+        with self._bloqueo:
+            tabla[modulo] = clausura
+            tabla.move_to_end(modulo)
+            
+            while len(self.directas) + len(self.inversas) > self.capacidad:
+                # Desalojar de la tabla más grande para repartir la capacidad
+                victima = self.directas if len(self.directas) >= len(self.inversas) else self.inversas
+                victima.popitem(last=False)
+                self.desalojos += 1
+    
+    def _invalidar(self, tabla, modulo):
+        """Elimina las clausuras del módulo y las que lo contienen"""
+        with self._bloqueo:
+            obsoletas = [
+                clave for clave, clausura in tabla.items()
+                if clave == modulo or modulo in clausura
+            ]
+            
+            for clave in obsoletas:
+                del tabla[clave]
+            
+            self.invalidaciones += len(obsoletas)
@@ -0,0 +1,230 @@
+"""Módulo que implementa la centralidad de intermediación aproximada del grafo de dependencias.
+   Se ejecuta el algoritmo de Brandes solo desde una muestra de módulos de origen, repartida
+   entre los procesos de un ProcessPoolExecutor, y se extrapola el resultado con una cota de
+   error por módulo. Los módulos con mayor centralidad están en más cadenas de dependencias
+   (cuellos de botella de la arquitectura).
+"""
+
+import heapq
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+
+def _acumular_dependencias(desplazamientos, destinos, fuentes):
+    """
+    Ejecuta el algoritmo de Brandes (grafo no ponderado) desde cada fuente y
+    acumula la dependencia de cada módulo. Es una función de módulo para que
+    pueda enviarse a un pool de procesos.
+    
+    Args:
+        desplazamientos (array): Desplazamientos CSR de las dependencias
+        destinos (array): Destinos CSR de las dependencias
+        fuentes (list): Identificadores de los módulos de origen
+    
+    Returns:
+        tuple: (list, list) - (suma de las dependencias de cada módulo, suma
+               de sus cuadrados) sobre todas las fuentes
+    """
+    n = len(desplazamientos) - 1
+    suma = [0.0] * n
+    cuadrados = [0.0] * n
+    # Arreglos reutilizados entre fuentes; solo se limpian los visitados
+    distancia = [-1] * n
+    caminos = [0] * n
+    dependencia = [0.0] * n
+    
+    for fuente in fuentes:
+        distancia[fuente] = 0
+        caminos[fuente] = 1
+        orden = [fuente]
+        
+        # Recorrido en anchura contando caminos más cortos
+        for modulo in orden:
+            siguiente = distancia[modulo] + 1
+            for posicion in range(desplazamientos[modulo], desplazamientos[modulo + 1]):
+                vecino = destinos[posicion]
+                if distancia[vecino] < 0:
+                    distancia[vecino] = siguiente
+                    orden.append(vecino)
+                if distancia[vecino] == siguiente:
+                    caminos[vecino] += caminos[modulo]
+        
+        # Acumulación hacia atrás: cada módulo recibe la parte de los caminos
+        # que pasan por él hacia los módulos más lejanos
+        for modulo in reversed(orden):
+            siguiente = distancia[modulo] + 1
+            acumulado = 0.0
+            for posicion in range(desplazamientos[modulo], desplazamientos[modulo + 1]):
+                vecino = destinos[posicion]
+                if distancia[vecino] == siguiente:
+                    acumulado += (1.0 + dependencia[vecino]) / caminos[vecino]
+            acumulado *= caminos[modulo]
+            dependencia[modulo] = acumulado
+            
+            if modulo != fuente:
+                suma[modulo] += acumulado
+                cuadrados[modulo] += acumulado * acumulado
+        
+        for modulo in orden:
+            distancia[modulo] = -1
+            caminos[modulo] = 0
+            dependencia[modulo] = 0.0
+    
+    return (suma, cuadrados)
+
+
+class CentralidadIntermediacion:
+    """Clase que estima la centralidad de intermediación de los módulos por muestreo"""
+    
+    def __init__(self, grafo, muestras=256, max_trabajadores=None, semilla=None):
+        """
+        Inicializa el cálculo sobre una instantánea compacta del grafo
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a analizar
+            muestras (int): Cantidad de módulos de origen a muestrear; si es
+                            mayor o igual que la cantidad de módulos el
+                            resultado es exacto
+            max_trabajadores (int): Cantidad de procesos (None = núcleos
+                                    disponibles; 1 = calcular en este proceso)
+            semilla (int): Semilla del muestreo, para resultados reproducibles
+        
+        Raises:
+            ValueError: Si la cantidad de muestras no es positiva
+        """
+        if muestras < 1:
+            raise ValueError("La cantidad de muestras debe ser positiva")
+        
+        self.compacto = grafo.congelar()
+        self.muestras = muestras
+        self.max_trabajadores = max_trabajadores
+        self.semilla = semilla
+    
+    def calcular(self, top_k=10, confianza=0.95):
+        """
+        Estima la centralidad de todos los módulos y devuelve los más centrales.
+        La centralidad de un módulo es la cantidad (fraccionaria) de pares
+        (origen, destino) cuyos caminos más cortos de dependencias pasan por
+        él. Se extrapola multiplicando el promedio por fuente por la cantidad
+        de módulos; el margen de error usa la varianza observada entre las
+        fuentes muestreadas (aproximación normal con corrección por población
+        finita, ya que se muestrea sin reemplazo).
+        
+        Args:
+            top_k (int): Cantidad de módulos del ranking
+            confianza (float): Nivel de confianza del margen de error (0 a 1)
+        
+        Returns:
+            dict: Reporte con el ranking (lista de diccionarios con modulo,
+                  centralidad, normalizada y error), la cantidad de muestras,
+                  si el resultado es exacto, la confianza, los trabajadores
+                  usados y el tiempo de cálculo
+        """
+        compacto = self.compacto
+        n = compacto.cantidad_modulos()
+        k = min(self.muestras, n)
+        inicio = time.perf_counter()
+        
+        fuentes = random.Random(self.semilla).sample(range(n), k)
+        suma, cuadrados = self._repartir(fuentes)
+        
+        exacto = k == n
+        escala = n / k if k else 0.0
+        # Pares (origen, destino) posibles sin contar al propio módulo
+        pares = (n - 1) * (n - 2)
+        z = NormalDist().inv_cdf((1 + confianza) / 2)
+        
+        # Mayor centralidad primero; los empates se resuelven alfabéticamente
+        mayores = heapq.nlargest(
+            top_k, range(n),
+            key=lambda id_modulo: (suma[id_modulo], -compacto.rango[id_modulo])
+        )
+        
+        ranking = []
+        for id_modulo in mayores:
+            centralidad = suma[id_modulo] * escala
+            ranking.append({
+                "modulo": compacto.nombres[id_modulo],
+                "centralidad": centralidad,
+                "normalizada": centralidad / pares if pares else 0.0,
+                "error": self._margen_error(suma[id_modulo], cuadrados[id_modulo], n, k, z)
+            })
+        
+        return {
+            "ranking": ranking,
+            "muestras": k,
+            "total_modulos": n,
+            "exacto": exacto,
+            "confianza": confianza,
+            "trabajadores": self._cantidad_trabajadores(k),
+            "tiempo": time.perf_counter() - inicio
+        }
+    
+    def _repartir(self, fuentes):
+        """
+        Divide las fuentes en un bloque por trabajador y suma los resultados
+        
+        Args:
+            fuentes (list): Identificadores de los módulos de origen
+        
+        Returns:
+            tuple: (list, list) - sumas y sumas de cuadrados por módulo
+        """
+        compacto = self.compacto
+        trabajadores = self._cantidad_trabajadores(len(fuentes))
+        
+        if trabajadores <= 1:
+            return _acumular_dependencias(compacto.desplazamientos, compacto.destinos, fuentes)
+        
+        bloques = [fuentes[indice::trabajadores] for indice in range(trabajadores)]
+        suma = [0.0] * compacto.cantidad_modulos()
+        cuadrados = [0.0] * compacto.cantidad_modulos()
+        
+        with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+            futuros = [
+                pool.submit(_acumular_dependencias, compacto.desplazamientos,
+                            compacto.destinos, bloque)
+                for bloque in bloques
+            ]
+            for futuro in futuros:
+                parcial, parcial_cuadrados = futuro.result()
+                for id_modulo, valor in enumerate(parcial):
+                    if valor:
+                        suma[id_modulo] += valor
+                        cuadrados[id_modulo] += parcial_cuadrados[id_modulo]
+        
+        return (suma, cuadrados)
+    
+    def _cantidad_trabajadores(self, cantidad_fuentes):
+        """Calcula la cantidad de procesos a usar (nunca más que fuentes)"""
+        trabajadores = self.max_trabajadores or os.cpu_count() or 1
+        return max(1, min(trabajadores, cantidad_fuentes))
+    
+    def _margen_error(self, suma, cuadrados, n, k, z):
+        """
+        Calcula el margen de error de la centralidad estimada de un módulo
+        
+        Args:
+            suma (float): Suma de las dependencias del módulo sobre las fuentes
+            cuadrados (float): Suma de sus cuadrados
+            n (int): Cantidad de módulos del grafo
+            k (int): Cantidad de fuentes muestreadas
+            z (float): Cuantil normal del nivel de confianza
+        
+        Returns:
+            float: Semiancho del intervalo de confianza (0.0 si es exacto,
+                   infinito si una sola muestra no permite estimarlo)
+        """
+        if k >= n:
+            return 0.0
+        if k < 2:
+            return math.inf
+        
+        varianza = max(0.0, (cuadrados - suma * suma / k) / (k - 1))
+        error_promedio = math.sqrt(varianza / k * (n - k) / (n - 1))
+        
+        return z * n * error_promedio
@@ -0,0 +1,183 @@
+"""Módulo que implementa la comparación entre dos versiones de un grafo de dependencias.
+   Las aristas de cada versión se comparan como conjuntos con hash, y el alcance
+   transitivo solo se verifica para los módulos que pueden llegar a una arista cambiada,
+   usando filas de bits sobre las componentes fuertemente conexas de cada versión.
+"""
+
+
+class DiferenciaGrafos:
+    """Clase que representa los cambios entre dos versiones de un GrafoDependencias"""
+    
+    def __init__(self, anterior, nuevo):
+        """
+        Compara dos versiones del grafo en O(V + E) más la verificación del
+        alcance de la región afectada por los cambios
+        
+        Args:
+            anterior (GrafoDependencias): Versión anterior
+            nuevo (GrafoDependencias): Versión nueva
+        """
+        # Módulos agregados y eliminados (en orden de inserción de cada versión)
+        self.modulos_agregados = [
+            modulo for modulo in nuevo.modulos if modulo not in anterior.modulos
+        ]
+        self.modulos_eliminados = [
+            modulo for modulo in anterior.modulos if modulo not in nuevo.modulos
+        ]
+        
+        aristas_anteriores = self._aristas(anterior)
+        aristas_nuevas = self._aristas(nuevo)
+        # Dependencias agregadas y eliminadas como tuplas (origen, destino)
+        self.dependencias_agregadas = [
+            arista for arista in aristas_nuevas if arista not in aristas_anteriores
+        ]
+        self.dependencias_eliminadas = [
+            arista for arista in aristas_anteriores if arista not in aristas_nuevas
+        ]
+        
+        cambiadas = self.dependencias_agregadas + self.dependencias_eliminadas
+        comunes = {modulo: None for modulo in anterior.modulos if modulo in nuevo.modulos}
+        
+        # Solo puede cambiar la clausura directa de un módulo que llega (en
+        # alguna de las versiones) al origen de una arista cambiada, y la
+        # inversa de uno alcanzable desde su destino
+        candidatos_directos = self._alcanzados(
+            [origen for origen, _ in cambiadas], comunes,
+            (anterior.dependientes, nuevo.dependientes)
+        )
+        candidatos_inversos = self._alcanzados(
+            [destino for _, destino in cambiadas], comunes,
+            (anterior.dependencias, nuevo.dependencias)
+        )
+        
+        # Identificador de bit compartido por ambas versiones
+        ids = {}
+        for modulo in anterior.modulos:
+            ids[modulo] = len(ids)
+        for modulo in self.modulos_agregados:
+            ids[modulo] = len(ids)
+        
+        # Módulos comunes cuyas dependencias transitivas cambiaron
+        self.alcance_directo_cambiado = self._comparar(
+            anterior, nuevo, candidatos_directos, ids, inverso=False
+        )
+        # Módulos comunes cuyo análisis de impacto (dependientes transitivos) cambió
+        self.alcance_inverso_cambiado = self._comparar(
+            anterior, nuevo, candidatos_inversos, ids, inverso=True
+        )
+    
+    def hay_cambios(self):
+        """Retorna True si las versiones tienen módulos o dependencias distintas"""
+        return bool(
+            self.modulos_agregados or self.modulos_eliminados
+            or self.dependencias_agregadas or self.dependencias_eliminadas
+        )
+    
+    def obtener_resumen(self):
+        """
+        Obtiene la cantidad de cambios de cada tipo
+        
+        Returns:
+            dict: Diccionario con el resumen
+        """
+        return {
+            "modulos_agregados": len(self.modulos_agregados),
+            "modulos_eliminados": len(self.modulos_eliminados),
+            "dependencias_agregadas": len(self.dependencias_agregadas),
+            "dependencias_eliminadas": len(self.dependencias_eliminadas),
+            "alcance_directo_cambiado": len(self.alcance_directo_cambiado),
+            "alcance_inverso_cambiado": len(self.alcance_inverso_cambiado)
+        }
+    
+    def _aristas(self, grafo):
+        """Conjunto ordenado (dict) de las aristas (origen, destino) de un grafo"""
+        return {
+            (origen, destino): None
+            for origen, deps in grafo.dependencias.items()
+            for destino in deps
+        }
+    
+    def _alcanzados(self, inicios, comunes, adyacencias):
+        """
+        Recorrido en anchura desde varios módulos siguiendo las aristas de
+        ambas versiones
+        
+        Args:
+            inicios (list): Módulos de inicio (incluidos en el resultado)
+            comunes (dict): Módulos presentes en ambas versiones
+            adyacencias (tuple): Adyacencia de cada versión a seguir
+        
+        Returns:
+            dict: Módulos comunes alcanzados (conjunto ordenado)
+        """
+        visitados = dict.fromkeys(inicios)
+        cola = list(visitados)
+        
+        for modulo in cola:
+            for adyacencia in adyacencias:
+                for vecino in adyacencia.get(modulo, ()):
+                    if vecino not in visitados:
+                        visitados[vecino] = None
+                        cola.append(vecino)
+        
+        return {modulo: None for modulo in visitados if modulo in comunes}
+    
+    def _comparar(self, anterior, nuevo, candidatos, ids, inverso):
+        """
+        Compara el alcance de los candidatos en ambas versiones
+        
+        Args:
+            anterior (GrafoDependencias): Versión anterior
+            nuevo (GrafoDependencias): Versión nueva
+            candidatos (dict): Módulos comunes cuyo alcance puede haber cambiado
+            ids (dict): Bit de cada módulo
+            inverso (bool): True para comparar dependientes transitivos
+        
+        Returns:
+            list: Candidatos cuyo alcance cambió, en orden alfabético
+        """
+        if not candidatos:
+            return []
+        
+        filas_anteriores = self._filas_alcance(anterior, candidatos, ids, inverso)
+        filas_nuevas = self._filas_alcance(nuevo, candidatos, ids, inverso)
+        
+        return sorted(
+            modulo for modulo in candidatos
+            if filas_anteriores[modulo] != filas_nuevas[modulo]
+        )
+    
+    def _filas_alcance(self, grafo, candidatos, ids, inverso):
+        """
+        Calcula como entero de bits el alcance de cada candidato en una versión.
+        Se recorren (con recorrer_alcance) solo las componentes alcanzables
+        desde los candidatos.
+        
+        Args:
+            grafo (GrafoDependencias): Versión a analizar
+            candidatos (dict): Módulos cuyo alcance se necesita
+            ids (dict): Bit de cada módulo
+            inverso (bool): True para seguir dependientes en lugar de dependencias
+        
+        Returns:
+            dict: {modulo: bits de los módulos alcanzables}
+        """
+        adyacencia = grafo.dependientes if inverso else grafo.dependencias
+        
+        # Región alcanzable desde los candidatos: es cerrada bajo la adyacencia,
+        # así que sus componentes fuertemente conexas son las del grafo completo
+        region = dict.fromkeys(candidatos)
+        cola = list(region)
+        for modulo in cola:
+            for vecino in adyacencia[modulo]:
+                if vecino not in region:
+                    region[vecino] = None
+                    cola.append(vecino)
+        
+        resultado = {}
+        for _, componente, _, _, alcance in grafo.recorrer_alcance(region, inverso, ids):
+            for modulo in componente:
+                if modulo in candidatos:
+                    resultado[modulo] = alcance
+        
+        return resultado
@@ -0,0 +1,190 @@
+"""Módulo que implementa un ejecutor paralelo de compilación sobre el grafo de dependencias.
+   Cada módulo se ejecuta en un pool de hilos o procesos en cuanto terminan todas sus
+   dependencias; si un módulo falla solo se omiten los módulos que dependen de él.
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+
+def _ejecutar_cronometrado(tarea, nombre):
+    """
+    Ejecuta la tarea de un módulo midiendo su tiempo de pared. Es una función
+    de módulo para que pueda enviarse a un pool de procesos.
+    
+    Args:
+        tarea (callable): Función que recibe el nombre del módulo
+        nombre (str): Nombre del módulo
+    
+    Returns:
+        tuple: (bool, float, object) - (éxito, duración en segundos,
+               resultado de la tarea o excepción producida)
+    """
+    inicio = time.perf_counter()
+    try:
+        resultado = tarea(nombre)
+        return (True, time.perf_counter() - inicio, resultado)
+    except Exception as error:
+        return (False, time.perf_counter() - inicio, error)
+
+
+class EjecutorCompilacion:
+    """Clase que ejecuta una tarea por módulo respetando las dependencias del grafo"""
+    
+    # Estados posibles de un módulo al terminar la ejecución
+    EXITO = "exito"
+    FALLO = "fallo"
+    OMITIDO = "omitido"      # Depende (directa o indirectamente) de un módulo fallido
+    BLOQUEADO = "bloqueado"  # Está en un ciclo o depende de uno
+    
+    def __init__(self, grafo, max_trabajadores=None, usar_procesos=False):
+        """
+        Inicializa el ejecutor
+        
+        Args:
+            grafo (GrafoDependencias): Grafo de dependencias a compilar
+            max_trabajadores (int): Tamaño del pool (None = valor por defecto del pool)
+            usar_procesos (bool): True para usar procesos en lugar de hilos; la
+                                  tarea debe poder serializarse con pickle
+        """
+        self.grafo = grafo
+        self.max_trabajadores = max_trabajadores
+        self.usar_procesos = usar_procesos
+    
+    def ejecutar(self, tarea):
+        """
+        Ejecuta la tarea de cada módulo tan pronto como sus dependencias
+        terminaron con éxito. Los módulos listos se envían en orden alfabético.
+        
+        Args:
+            tarea (callable): Función que recibe el nombre del módulo; se
+                              considera fallida si lanza una excepción
+        
+        Returns:
+            dict: Reporte con el estado, duración y resultado de cada módulo,
+                  el orden de finalización y las métricas de paralelismo
+        """
+        grafo = self.grafo
+        pendientes = {modulo: len(deps) for modulo, deps in grafo.dependencias.items()}
+        modulos = {}
+        orden_finalizacion = []
+        listos = [modulo for modulo, cantidad in pendientes.items() if cantidad == 0]
+        heapq.heapify(listos)
+        
+        tipo_pool = ProcessPoolExecutor if self.usar_procesos else ThreadPoolExecutor
+        trabajadores = self._cantidad_trabajadores()
+        inicio = time.perf_counter()
+        
+        with tipo_pool(max_workers=trabajadores) as pool:
+            en_curso = {}
+            
+            while listos or en_curso:
+                while listos:
+                    modulo = heapq.heappop(listos)
+                    futuro = pool.submit(_ejecutar_cronometrado, tarea, modulo)
+                    en_curso[futuro] = modulo
+                
+                terminados, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                
+                for futuro in terminados:
+                    modulo = en_curso.pop(futuro)
+                    exito, duracion, resultado = futuro.result()
+                    orden_finalizacion.append(modulo)
+                    
+                    if exito:
+                        modulos[modulo] = {
+                            "estado": self.EXITO,
+                            "duracion": duracion,
+                            "resultado": resultado
+                        }
+                        for dependiente in grafo.dependientes[modulo]:
+                            pendientes[dependiente] -= 1
+                            if pendientes[dependiente] == 0:
+                                heapq.heappush(listos, dependiente)
+                    else:
+                        modulos[modulo] = {
+                            "estado": self.FALLO,
+                            "duracion": duracion,
+                            "error": resultado
+                        }
+                        self._omitir_dependientes(modulo, modulos)
+        
+        tiempo_total = time.perf_counter() - inicio
+        
+        # Los módulos que nunca quedaron listos están en un ciclo o dependen de uno
+        for modulo in grafo.modulos:
+            if modulo not in modulos:
+                modulos[modulo] = {"estado": self.BLOQUEADO, "duracion": 0.0}
+        
+        return self._generar_reporte(modulos, orden_finalizacion, tiempo_total, trabajadores)
+    
+    def _cantidad_trabajadores(self):
+        """Calcula el tamaño del pool con los mismos valores por defecto de concurrent.futures"""
+        if self.max_trabajadores is not None:
+            return self.max_trabajadores
+        
+        nucleos = os.cpu_count() or 1
+        if self.usar_procesos:
+            return nucleos
+        return min(32, nucleos + 4)
+    
+    def _omitir_dependientes(self, modulo_fallido, modulos):
+        """
+        Marca como omitidos todos los módulos que dependen de un módulo fallido
+        
+        Args:
+            modulo_fallido (str): Nombre del módulo que falló
+            modulos (dict): Estados registrados hasta ahora (se actualiza)
+        """
+        cola = [modulo_fallido]
+        
+        for modulo in cola:
+            for dependiente in self.grafo.dependientes[modulo]:
+                if dependiente not in modulos:
+                    modulos[dependiente] = {
+                        "estado": self.OMITIDO,
+                        "duracion": 0.0,
+                        "causa": modulo_fallido
+                    }
+                    cola.append(dependiente)
+    
+    def _generar_reporte(self, modulos, orden_finalizacion, tiempo_total, trabajadores):
+        """
+        Resume la ejecución y calcula las métricas de paralelismo
+        
+        Args:
+            modulos (dict): Estado de cada módulo
+            orden_finalizacion (list): Módulos ejecutados en orden de término
+            tiempo_total (float): Tiempo de pared de toda la ejecución
+            trabajadores (int): Tamaño del pool utilizado
+        
+        Returns:
+            dict: Reporte de la ejecución
+        """
+        por_estado = {
+            self.EXITO: [],
+            self.FALLO: [],
+            self.OMITIDO: [],
+            self.BLOQUEADO: []
+        }
+        for modulo, datos in modulos.items():
+            por_estado[datos["estado"]].append(modulo)
+        
+        tiempo_acumulado = sum(datos["duracion"] for datos in modulos.values())
+        aceleracion = tiempo_acumulado / tiempo_total if tiempo_total > 0 else 0.0
+        
+        return {
+            "modulos": modulos,
+            "orden_finalizacion": orden_finalizacion,
+            "exitosos": sorted(por_estado[self.EXITO]),
+            "fallidos": sorted(por_estado[self.FALLO]),
+            "omitidos": sorted(por_estado[self.OMITIDO]),
+            "bloqueados": sorted(por_estado[self.BLOQUEADO]),
+            "trabajadores": trabajadores,
+            "tiempo_total": tiempo_total,
+            "tiempo_acumulado": tiempo_acumulado,
+            "aceleracion": aceleracion,
+            "eficiencia_paralela": aceleracion / trabajadores if trabajadores else 0.0
+        }
@@ -2,19 +2,40 @@
    Representa módulos/paquetes y sus dependencias.
 """
 
+import heapq
+
+from models.AnalisisComponentes import AnalisisComponentes
+from models.CacheClausuras import CacheClausuras
+from models.CentralidadIntermediacion import CentralidadIntermediacion
+from models.DiferenciaGrafos import DiferenciaGrafos
+from models.GrafoCompacto import GrafoCompacto
+from models.IndiceAlcanzabilidad import IndiceAlcanzabilidad
+
+# Eventos emitidos por el recorrido en profundidad iterativo
+_ENTRADA = 0   # Se descubre un módulo por primera vez
+_ARISTA = 1    # Arista hacia un módulo ya visitado
+_SALIDA = 2    # Se terminaron de explorar los vecinos de un módulo
+
+
 class Modulo:
     """Clase que representa un módulo de software"""
     
-    def __init__(self, nombre, descripcion=""):
+    # Sin __dict__ por instancia: en grafos con millones de módulos el
+    # diccionario de atributos era la mayor parte de la memoria de cada uno
+    __slots__ = ("nombre", "descripcion", "costo")
+    
+    def __init__(self, nombre, descripcion="", costo=1.0):
         """
         Inicializa un módulo
         
         Args:
             nombre (str): Nombre del módulo
             descripcion (str): Descripción del módulo
+            costo (float): Tiempo de compilación estimado (no negativo)
         """
         self.nombre = nombre
         self.descripcion = descripcion
+        self.costo = costo
     
     def __str__(self):
         return f"Módulo: {self.nombre}"
@@ -33,28 +54,122 @@ class GrafoDependencias:
     
     def __init__(self):
         """Inicializa el grafo vacío"""
-        # Diccionario que mapea nombre de módulo -> objeto Modulo
+        # Diccionario que mapea nombre de módulo -> objeto Modulo. Modulo.nombre
+        # es la copia canónica del nombre: las demás estructuras guardan ese
+        # mismo objeto en lugar de la cadena recibida en cada llamada
         self.modulos = {}
-        # Lista de adyacencia: modulo -> lista de módulos de los que depende
+        # Lista de adyacencia: modulo -> módulos de los que depende.
+        # Cada conjunto de aristas es un dict usado como conjunto ordenado
+        # (claves = módulos, valores = None): pertenencia, inserción y
+        # eliminación en O(1) conservando el orden de inserción.
         self.dependencias = {}
+        # Índice inverso: modulo -> módulos que dependen de él (mismo formato)
+        self.dependientes = {}
+        # Caché opcional de clausuras transitivas (ver activar_cache)
+        self.cache = None
+        # Modo acíclico (ver activar_modo_aciclico): orden topológico
+        # mantenido incrementalmente. _orden es la lista por posición (con
+        # huecos None de módulos eliminados) y _posicion el índice inverso.
+        self._orden = None
+        self._posicion = None
+        self._huecos = 0
+        # Último ciclo que el modo acíclico impidió crear
+        self.ciclo_rechazado = None
+        # Estadísticas mantenidas en cada modificación: cantidad de aristas y
+        # conjuntos ordenados de módulos sin dependencias y sin dependientes
+        self.total_dependencias = 0
+        self._sin_dependencias = {}
+        self._sin_dependientes = {}
+        # Resultado de detectar_ciclos guardado hasta la próxima modificación
+        # que pueda cambiarlo (None = hay que recalcular)
+        self._ciclos = None
+        # Diario opcional de modificaciones (ver utils/DiarioGrafo.py): recibe
+        # cada modificación aplicada con registrar(operacion, *argumentos)
+        self.diario = None
+    
+    def activar_cache(self, capacidad=1024):
+        """
+        Activa la caché LRU de dependencias transitivas y análisis de impacto
+        
+        Args:
+            capacidad (int): Cantidad máxima de clausuras guardadas
+            
+        Returns:
+            CacheClausuras: La caché activada (expone aciertos, fallos y desalojos)
+        """
+        self.cache = CacheClausuras(capacidad)
+        return self.cache
+    
+    def desactivar_cache(self):
+        """Desactiva y descarta la caché de clausuras transitivas"""
+        self.cache = None
     
-    def agregar_modulo(self, nombre, descripcion=""):
+    def activar_modo_aciclico(self):
+        """
+        Activa el modo acíclico: se mantiene un orden topológico de forma
+        incremental (algoritmo de Pearce-Kelly) y agregar_dependencia rechaza
+        las dependencias que crearían un ciclo, revisando solo la región del
+        orden afectada por la nueva arista
+        
+        Returns:
+            bool: True si se activó, False si el grafo ya tiene ciclos
+        """
+        orden, pendientes = self.orden_kahn()
+        if pendientes:
+            return False
+        
+        self._orden = orden
+        self._posicion = {modulo: posicion for posicion, modulo in enumerate(orden)}
+        self._huecos = 0
+        self.ciclo_rechazado = None
+        
+        return True
+    
+    def desactivar_modo_aciclico(self):
+        """Desactiva el modo acíclico y descarta el orden mantenido"""
+        self._orden = None
+        self._posicion = None
+        self._huecos = 0
+    
+    def es_modo_aciclico(self):
+        """Retorna True si el modo acíclico está activo"""
+        return self._posicion is not None
+    
+    def agregar_modulo(self, nombre, descripcion="", costo=1.0):
         """
         Agrega un nuevo módulo al grafo
         
         Args:
             nombre (str): Nombre del módulo
             descripcion (str): Descripción del módulo
+            costo (float): Tiempo de compilación estimado (no negativo)
             
         Returns:
             bool: True si se agregó correctamente, False si ya existía
+            
+        Raises:
+            ValueError: Si el costo es negativo
         """
+        if costo < 0:
+            raise ValueError("El costo de un módulo no puede ser negativo")
+        
         if nombre in self.modulos:
             return False
         
-        modulo = Modulo(nombre, descripcion)
+        modulo = Modulo(nombre, descripcion, costo)
         self.modulos[nombre] = modulo
-        self.dependencias[nombre] = []
+        self.dependencias[nombre] = {}
+        self.dependientes[nombre] = {}
+        self._sin_dependencias[nombre] = None
+        self._sin_dependientes[nombre] = None
+        
+        # Un módulo nuevo no tiene aristas: puede ir al final del orden
+        if self._posicion is not None:
+            self._posicion[nombre] = len(self._orden)
+            self._orden.append(nombre)
+        
+        if self.diario is not None:
+            self.diario.registrar("agregar_modulo", nombre, descripcion, costo)
         
         return True
     
@@ -62,6 +177,9 @@ class GrafoDependencias:
         """
         Agrega una dependencia dirigida: modulo_origen depende de modulo_destino
         
+        En modo acíclico se rechaza la dependencia si crearía un ciclo; el
+        ciclo queda disponible en self.ciclo_rechazado.
+        
         Args:
             modulo_origen (str): Nombre del módulo que depende
             modulo_destino (str): Nombre del módulo del que depende
@@ -81,7 +199,25 @@ class GrafoDependencias:
         if modulo_origen == modulo_destino:
             return False
         
-        self.dependencias[modulo_origen].append(modulo_destino)
+        # En modo acíclico, reordenar o rechazar si se formaría un ciclo
+        if self._posicion is not None and not self._reordenar(modulo_origen, modulo_destino):
+            return False
+        
+        modulo_origen = self.modulos[modulo_origen].nombre
+        modulo_destino = self.modulos[modulo_destino].nombre
+        self.dependencias[modulo_origen][modulo_destino] = None
+        self.dependientes[modulo_destino][modulo_origen] = None
+        self.total_dependencias += 1
+        self._sin_dependencias.pop(modulo_origen, None)
+        self._sin_dependientes.pop(modulo_destino, None)
+        # Una arista nueva puede crear un ciclo
+        self._ciclos = None
+        
+        if self.cache is not None:
+            self.cache.invalidar_arista(modulo_origen, modulo_destino)
+        
+        if self.diario is not None:
+            self.diario.registrar("agregar_dependencia", modulo_origen, modulo_destino)
         
         return True
     
@@ -102,7 +238,20 @@ class GrafoDependencias:
         if modulo_destino not in self.dependencias[modulo_origen]:
             return False
         
-        self.dependencias[modulo_origen].remove(modulo_destino)
+        del self.dependencias[modulo_origen][modulo_destino]
+        del self.dependientes[modulo_destino][modulo_origen]
+        self.total_dependencias -= 1
+        if not self.dependencias[modulo_origen]:
+            self._sin_dependencias[modulo_origen] = None
+        if not self.dependientes[modulo_destino]:
+            self._sin_dependientes[modulo_destino] = None
+        self._invalidar_ciclos_por_eliminacion()
+        
+        if self.cache is not None:
+            self.cache.invalidar_arista(modulo_origen, modulo_destino)
+        
+        if self.diario is not None:
+            self.diario.registrar("eliminar_dependencia", modulo_origen, modulo_destino)
         
         return True
     
@@ -119,17 +268,340 @@ class GrafoDependencias:
         if nombre not in self.modulos:
             return False
         
+        # Eliminar las referencias usando el índice inverso, sin recorrer
+        # todas las listas de adyacencia
+        for dependencia in self.dependencias[nombre]:
+            del self.dependientes[dependencia][nombre]
+            if not self.dependientes[dependencia]:
+                self._sin_dependientes[dependencia] = None
+        for dependiente in self.dependientes[nombre]:
+            del self.dependencias[dependiente][nombre]
+            if not self.dependencias[dependiente]:
+                self._sin_dependencias[dependiente] = None
+        
+        self.total_dependencias -= len(self.dependencias[nombre]) + len(self.dependientes[nombre])
+        self._sin_dependencias.pop(nombre, None)
+        self._sin_dependientes.pop(nombre, None)
+        self._invalidar_ciclos_por_eliminacion()
+        
         # Eliminar el módulo
         del self.modulos[nombre]
         del self.dependencias[nombre]
+        del self.dependientes[nombre]
+        
+        if self.cache is not None:
+            self.cache.invalidar_modulo(nombre)
+        
+        if self._posicion is not None:
+            self._quitar_del_orden(nombre)
+        
+        if self.diario is not None:
+            self.diario.registrar("eliminar_modulo", nombre)
+        
+        return True
+    
+    def establecer_costo(self, nombre, costo):
+        """
+        Cambia el tiempo de compilación estimado de un módulo
+        
+        Args:
+            nombre (str): Nombre del módulo
+            costo (float): Nuevo costo (no negativo)
+            
+        Returns:
+            bool: True si se actualizó, False si el módulo no existe
+            
+        Raises:
+            ValueError: Si el costo es negativo
+        """
+        if costo < 0:
+            raise ValueError("El costo de un módulo no puede ser negativo")
+        
+        if nombre not in self.modulos:
+            return False
+        
+        self.modulos[nombre].costo = costo
+        
+        if self.diario is not None:
+            self.diario.registrar("establecer_costo", nombre, costo)
+        
+        return True
+    
+    def agregar_modulos_lote(self, modulos):
+        """
+        Agrega muchos módulos en una sola pasada. Si algún elemento es
+        inválido no se agrega ninguno.
+        
+        Args:
+            modulos (iterable): Nombres de módulos o tuplas (nombre, descripcion)
+                                o (nombre, descripcion, costo)
+            
+        Returns:
+            dict: Reporte con la cantidad de procesados, exitosos y fallidos, y
+                  la lista de resultados (nombre, estado) donde estado es
+                  "agregado" o "duplicado"
+            
+        Raises:
+            ValueError: Si algún costo es negativo o una tupla está mal formada
+        """
+        tabla_modulos = self.modulos
+        adyacencia = self.dependencias
+        inversa = self.dependientes
+        sin_dependencias = self._sin_dependencias
+        sin_dependientes = self._sin_dependientes
+        resultados = []
+        agregados = 0
+        
+        # Se valida todo el lote antes de insertar para no dejarlo a medias
+        elementos = []
+        for elemento in modulos:
+            if isinstance(elemento, tuple):
+                if len(elemento) == 3:
+                    nombre, descripcion, costo = elemento
+                    if costo < 0:
+                        raise ValueError("El costo de un módulo no puede ser negativo")
+                else:
+                    nombre, descripcion = elemento
+                    costo = 1.0
+            else:
+                nombre, descripcion, costo = elemento, "", 1.0
+            elementos.append((nombre, descripcion, costo))
+        
+        try:
+            for nombre, descripcion, costo in elementos:
+                if nombre in tabla_modulos:
+                    resultados.append((nombre, "duplicado"))
+                    continue
+                
+                tabla_modulos[nombre] = Modulo(nombre, descripcion, costo)
+                adyacencia[nombre] = {}
+                inversa[nombre] = {}
+                sin_dependencias[nombre] = None
+                sin_dependientes[nombre] = None
+                if self._posicion is not None:
+                    self._posicion[nombre] = len(self._orden)
+                    self._orden.append(nombre)
+                agregados += 1
+                resultados.append((nombre, "agregado"))
+        finally:
+            # Los módulos ya insertados se registran aunque el lote falle
+            if agregados and self.diario is not None:
+                self.diario.registrar("agregar_modulos_lote", [
+                    (nombre, tabla_modulos[nombre].descripcion, tabla_modulos[nombre].costo)
+                    for nombre, estado in resultados if estado == "agregado"
+                ])
+        
+        return self._reporte_lote(resultados, agregados)
+    
+    def agregar_dependencias_lote(self, dependencias):
+        """
+        Agrega muchas dependencias en una sola pasada: valida existencia y
+        auto-dependencias, descarta duplicados por hash y actualiza contadores
+        y cachés una sola vez al final. En modo acíclico cada arista sigue
+        pasando por el reordenamiento incremental.
+        
+        Args:
+            dependencias (iterable): Tuplas (modulo_origen, modulo_destino)
+            
+        Returns:
+            dict: Reporte con la cantidad de procesados, exitosos y fallidos, y
+                  la lista de resultados (origen, destino, estado) donde estado
+                  es "agregada", "modulo_inexistente", "auto_dependencia",
+                  "duplicada" o "ciclo"
+        """
+        tabla_modulos = self.modulos
+        adyacencia = self.dependencias
+        inversa = self.dependientes
+        sin_dependencias = self._sin_dependencias
+        sin_dependientes = self._sin_dependientes
+        aciclico = self._posicion is not None
+        resultados = []
+        agregadas = 0
+        
+        try:
+            for origen, destino in dependencias:
+                salientes = adyacencia.get(origen)
+                if salientes is None or destino not in tabla_modulos:
+                    estado = "modulo_inexistente"
+                elif origen == destino:
+                    estado = "auto_dependencia"
+                elif destino in salientes:
+                    estado = "duplicada"
+                elif aciclico and not self._reordenar(origen, destino):
+                    estado = "ciclo"
+                else:
+                    origen = tabla_modulos[origen].nombre
+                    destino = tabla_modulos[destino].nombre
+                    # Solo se tocan los conjuntos de fuentes/sumideros cuando el
+                    # módulo recibe su primera arista
+                    if not salientes:
+                        del sin_dependencias[origen]
+                    entrantes = inversa[destino]
+                    if not entrantes:
+                        del sin_dependientes[destino]
+                    salientes[destino] = None
+                    entrantes[origen] = None
+                    agregadas += 1
+                    estado = "agregada"
+                resultados.append((origen, destino, estado))
+        finally:
+            # Aunque el iterable falle a mitad de camino, las aristas ya
+            # aplicadas deben quedar contabilizadas y registradas en el diario
+            if agregadas:
+                self.total_dependencias += agregadas
+                self._ciclos = None
+                # Una invalidación selectiva por arista costaría más que recalcular
+                if self.cache is not None:
+                    self.cache.limpiar()
+                if self.diario is not None:
+                    self.diario.registrar("agregar_dependencias_lote", [
+                        (origen, destino)
+                        for origen, destino, estado in resultados if estado == "agregada"
+                    ])
+        
+        return self._reporte_lote(resultados, agregadas)
+    
+    def eliminar_dependencias_lote(self, dependencias):
+        """
+        Elimina muchas dependencias en una sola pasada
+        
+        Args:
+            dependencias (iterable): Tuplas (modulo_origen, modulo_destino)
+            
+        Returns:
+            dict: Reporte con la cantidad de procesados, exitosos y fallidos, y
+                  la lista de resultados (origen, destino, estado) donde estado
+                  es "eliminada" o "inexistente"
+        """
+        adyacencia = self.dependencias
+        inversa = self.dependientes
+        resultados = []
+        eliminadas = 0
+        
+        try:
+            for origen, destino in dependencias:
+                salientes = adyacencia.get(origen)
+                if salientes is None or destino not in salientes:
+                    resultados.append((origen, destino, "inexistente"))
+                    continue
+                
+                del salientes[destino]
+                del inversa[destino][origen]
+                if not salientes:
+                    self._sin_dependencias[origen] = None
+                if not inversa[destino]:
+                    self._sin_dependientes[destino] = None
+                eliminadas += 1
+                resultados.append((origen, destino, "eliminada"))
+        finally:
+            if eliminadas:
+                self.total_dependencias -= eliminadas
+                self._invalidar_ciclos_por_eliminacion()
+                if self.cache is not None:
+                    self.cache.limpiar()
+                if self.diario is not None:
+                    self.diario.registrar("eliminar_dependencias_lote", [
+                        (origen, destino)
+                        for origen, destino, estado in resultados if estado == "eliminada"
+                    ])
+        
+        return self._reporte_lote(resultados, eliminadas)
+    
+    def _reporte_lote(self, resultados, exitosos):
+        """
+        Arma el reporte de una operación por lotes
+        
+        Args:
+            resultados (list): Resultado de cada elemento procesado
+            exitosos (int): Cantidad de elementos aplicados
+            
+        Returns:
+            dict: Diccionario con el reporte
+        """
+        return {
+            "procesados": len(resultados),
+            "exitosos": exitosos,
+            "fallidos": len(resultados) - exitosos,
+            "resultados": resultados
+        }
+    
+    def _reordenar(self, modulo_origen, modulo_destino):
+        """
+        Actualiza el orden topológico mantenido para la nueva arista
+        modulo_origen -> modulo_destino (Pearce-Kelly). El destino debe quedar
+        antes que el origen; si ya lo está no se hace nada. Si no, solo se
+        recorren los módulos cuya posición está entre ambos.
+        
+        Args:
+            modulo_origen (str): Módulo que depende
+            modulo_destino (str): Módulo del que depende
+            
+        Returns:
+            bool: True si la arista es válida, False si crearía un ciclo
+        """
+        posicion = self._posicion
+        limite_inferior = posicion[modulo_origen]
+        limite_superior = posicion[modulo_destino]
+        
+        if limite_superior < limite_inferior:
+            return True
+        
+        # Hacia adelante: dependientes del origen dentro de la región afectada.
+        # Si se alcanza el destino, la nueva arista cerraría un ciclo.
+        padres = {modulo_origen: None}
+        adelante = [modulo_origen]
+        for modulo in adelante:
+            for dependiente in self.dependientes[modulo]:
+                if dependiente == modulo_destino:
+                    # Ciclo: origen -> destino -> ... -> modulo -> ... -> origen
+                    ciclo = [modulo_origen, modulo_destino]
+                    while modulo is not None:
+                        ciclo.append(modulo)
+                        modulo = padres[modulo]
+                    self.ciclo_rechazado = ciclo
+                    return False
+                if dependiente not in padres and posicion[dependiente] < limite_superior:
+                    padres[dependiente] = modulo
+                    adelante.append(dependiente)
+        
+        # Hacia atrás: dependencias del destino dentro de la región afectada
+        vistos = {modulo_destino}
+        atras = [modulo_destino]
+        for modulo in atras:
+            for dependencia in self.dependencias[modulo]:
+                if dependencia not in vistos and posicion[dependencia] > limite_inferior:
+                    vistos.add(dependencia)
+                    atras.append(dependencia)
+        
+        # Reasignar las mismas posiciones: primero lo que debe ir antes (el
+        # destino y sus dependencias), luego el origen y sus dependientes
+        atras.sort(key=posicion.__getitem__)
+        adelante.sort(key=posicion.__getitem__)
+        afectados = atras + adelante
+        posiciones = sorted(posicion[modulo] for modulo in afectados)
         
-        # Eliminar todas las referencias a este módulo en otras dependencias
-        for modulo in self.dependencias:
-            if nombre in self.dependencias[modulo]:
-                self.dependencias[modulo].remove(nombre)
+        for modulo, nueva_posicion in zip(afectados, posiciones):
+            posicion[modulo] = nueva_posicion
+            self._orden[nueva_posicion] = modulo
         
         return True
     
+    def _quitar_del_orden(self, nombre):
+        """
+        Quita un módulo del orden mantenido dejando un hueco; cuando los
+        huecos superan a los módulos, el orden se compacta
+        
+        Args:
+            nombre (str): Nombre del módulo eliminado
+        """
+        self._orden[self._posicion.pop(nombre)] = None
+        self._huecos += 1
+        
+        if self._huecos > len(self._posicion):
+            self._orden = [modulo for modulo in self._orden if modulo is not None]
+            self._posicion = {modulo: posicion for posicion, modulo in enumerate(self._orden)}
+            self._huecos = 0
+    
     def obtener_dependencias_directas(self, nombre_modulo):
         """
         Obtiene las dependencias directas de un módulo
@@ -143,7 +615,7 @@ class GrafoDependencias:
         if nombre_modulo not in self.dependencias:
             return []
         
-        return self.dependencias[nombre_modulo].copy()
+        return list(self.dependencias[nombre_modulo])
     
     def obtener_dependientes(self, nombre_modulo):
         """
@@ -155,88 +627,648 @@ class GrafoDependencias:
         Returns:
             list: Lista de nombres de módulos que dependen de este
         """
-        dependientes = []
-        
-        for modulo, deps in self.dependencias.items():
-            if nombre_modulo in deps:
-                dependientes.append(modulo)
+        if nombre_modulo not in self.dependientes:
+            return []
         
-        return dependientes
+        return list(self.dependientes[nombre_modulo])
     
     def detectar_ciclos(self):
         """
-        Detecta ciclos en el grafo de dependencias usando DFS
+        Detecta ciclos en el grafo de dependencias. Se reporta un ciclo por
+        cada grupo de dependencias circulares (componente fuertemente conexa
+        con más de un módulo), de modo que ningún grupo queda sin reportar.
         
         Returns:
             tuple: (bool, list) - (tiene_ciclos, lista de ciclos encontrados)
         """
-        visitados = set()
-        en_pila = set()
-        ciclos_encontrados = []
-        
-        def dfs(modulo, camino):
-            visitados.add(modulo)
-            en_pila.add(modulo)
-            camino.append(modulo)
-            
-            for dependencia in self.dependencias.get(modulo, []):
-                if dependencia not in visitados:
-                    if dfs(dependencia, camino.copy()):
-                        return True
-                elif dependencia in en_pila:
-                    # Ciclo encontrado
-                    indice = camino.index(dependencia)
-                    ciclo = camino[indice:] + [dependencia]
-                    ciclos_encontrados.append(ciclo)
-                    return True
-            
-            en_pila.remove(modulo)
-            return False
+        ciclos_encontrados = self._obtener_ciclos()
+        
+        return (len(ciclos_encontrados) > 0, list(ciclos_encontrados))
+    
+    def _obtener_ciclos(self):
+        """
+        Obtiene la lista de ciclos, recalculándola solo si el grafo cambió
+        de forma que pueda afectarla
+        
+        Returns:
+            list: Lista de ciclos guardada (no debe modificarse)
+        """
+        # En modo acíclico el grafo no puede tener ciclos
+        if self._posicion is not None:
+            return []
+        
+        if self._ciclos is None:
+            self._ciclos = [
+                self._ciclo_en_componente(componente)
+                for componente in self.componentes_fuertes(self.modulos)
+                if len(componente) > 1
+            ]
+        
+        return self._ciclos
+    
+    def _invalidar_ciclos_por_eliminacion(self):
+        """
+        Marca los ciclos como pendientes de recalcular tras eliminar aristas.
+        Si el grafo no tenía ciclos, quitar aristas no puede crearlos.
+        """
+        if self._ciclos:
+            self._ciclos = None
+    
+    def obtener_componentes_fuertes(self):
+        """
+        Obtiene las componentes fuertemente conexas del grafo. Cada componente
+        con más de un módulo es un grupo de dependencias circulares.
+        
+        Returns:
+            list: Lista de componentes (listas ordenadas de módulos); cada
+                  componente aparece después de aquellas de las que depende
+        """
+        return [
+            sorted(componente)
+            for componente in self.componentes_fuertes(self.modulos)
+        ]
+    
+    def obtener_componentes_debiles(self):
+        """
+        Obtiene las componentes débilmente conexas del grafo: grupos de
+        módulos sin ninguna dependencia (en ningún sentido) con otros grupos
+        
+        Returns:
+            list: Lista de componentes (listas ordenadas de módulos), en el
+                  orden en que se agregó su primer módulo
+        """
+        return [
+            sorted(componente)
+            for componente in AnalisisComponentes(self).componentes
+        ]
+    
+    def analisis_por_componentes(self, max_trabajadores=None):
+        """
+        Detecta ciclos, ordena topológicamente y calcula estadísticas de cada
+        componente débilmente conexa en un pool de procesos, combinando los
+        resultados en los formatos de detectar_ciclos, ordenamiento_topologico
+        y obtener_estadisticas
+        
+        Args:
+            max_trabajadores (int): Cantidad de procesos (None = núcleos
+                                    disponibles; 1 = analizar en este proceso)
+        
+        Returns:
+            dict: Reporte de AnalisisComponentes.analizar con "ciclos", "orden"
+                  y "estadisticas"
+        """
+        return AnalisisComponentes(self, max_trabajadores).analizar()
+    
+    def obtener_condensacion(self):
+        """
+        Construye el grafo condensado: cada componente fuertemente conexa se
+        reduce a un nodo, por lo que el resultado siempre es acíclico y admite
+        ordenamiento topológico y análisis aunque el grafo original tenga ciclos
+        
+        Returns:
+            GrafoCondensado: Condensación del grafo actual
+        """
+        return GrafoCondensado(self)
+    
+    def congelar(self):
+        """
+        Produce una instantánea inmutable y compacta del grafo (nombres
+        traducidos a enteros y aristas en arreglos CSR), pensada para
+        análisis de solo lectura sobre grafos grandes
+        
+        Returns:
+            GrafoCompacto: Instantánea del estado actual del grafo
+        """
+        return GrafoCompacto(self)
+    
+    def construir_indice_alcanzabilidad(self):
+        """
+        Construye un índice de bits para responder en O(1) si un módulo
+        depende transitivamente de otro (útil para muchas consultas por pares)
+        
+        Returns:
+            IndiceAlcanzabilidad: Índice del estado actual del grafo
+        """
+        return IndiceAlcanzabilidad(self)
+    
+    def obtener_subgrafo(self, modulos):
+        """
+        Obtiene una vista de solo lectura restringida a los módulos indicados,
+        sin copiar sus aristas. Admite las mismas consultas que el grafo.
+        
+        Args:
+            modulos (iterable): Módulos de la vista (los inexistentes se ignoran)
+        
+        Returns:
+            VistaSubgrafo: Vista del subgrafo inducido
+        """
+        return VistaSubgrafo(self, modulos)
+    
+    def obtener_vecindario(self, modulos, saltos, direccion="ambas"):
+        """
+        Obtiene una vista con los módulos a lo sumo a `saltos` aristas de los
+        módulos indicados
+        
+        Args:
+            modulos (iterable): Módulos centrales
+            saltos (int): Distancia máxima
+            direccion (str): "dependencias", "dependientes" o "ambas"
+        
+        Returns:
+            VistaSubgrafo: Vista del vecindario
+        
+        Raises:
+            ValueError: Si la dirección no es válida
+        """
+        if direccion == "dependencias":
+            adyacencias = (self.dependencias,)
+        elif direccion == "dependientes":
+            adyacencias = (self.dependientes,)
+        elif direccion == "ambas":
+            adyacencias = (self.dependencias, self.dependientes)
+        else:
+            raise ValueError(f"Dirección no válida: {direccion}")
+        
+        alcanzados = {modulo: None for modulo in modulos if modulo in self.modulos}
+        frontera = list(alcanzados)
+        for _ in range(saltos):
+            siguiente = []
+            for modulo in frontera:
+                for adyacencia in adyacencias:
+                    for vecino in adyacencia[modulo]:
+                        if vecino not in alcanzados:
+                            alcanzados[vecino] = None
+                            siguiente.append(vecino)
+            frontera = siguiente
+        
+        return VistaSubgrafo(self, alcanzados)
+    
+    def diferencia(self, nuevo):
+        """
+        Compara este grafo (versión anterior) con otra versión: módulos y
+        dependencias agregados o eliminados, y los módulos cuyas dependencias
+        transitivas o cuyo análisis de impacto cambiaron
+        
+        Args:
+            nuevo (GrafoDependencias): Versión nueva del grafo
+        
+        Returns:
+            DiferenciaGrafos: Cambios entre ambas versiones
+        """
+        return DiferenciaGrafos(self, nuevo)
+    
+    def centralidad_intermediacion(self, muestras=256, top_k=10, max_trabajadores=None,
+                                   semilla=None, confianza=0.95):
+        """
+        Estima qué módulos están en más cadenas de dependencias (cuellos de
+        botella) con la centralidad de intermediación calculada desde una
+        muestra de módulos en un pool de procesos
+        
+        Args:
+            muestras (int): Cantidad de módulos de origen a muestrear
+            top_k (int): Cantidad de módulos del ranking
+            max_trabajadores (int): Cantidad de procesos (None = núcleos disponibles)
+            semilla (int): Semilla del muestreo
+            confianza (float): Nivel de confianza del margen de error
+        
+        Returns:
+            dict: Reporte de CentralidadIntermediacion.calcular con el ranking
+                  y el margen de error de cada módulo
+        """
+        calculo = CentralidadIntermediacion(self, muestras, max_trabajadores, semilla)
+        return calculo.calcular(top_k, confianza)
+    
+    def reduccion_transitiva(self, aplicar=False):
+        """
+        Calcula la reducción transitiva del grafo: las dependencias que pueden
+        quitarse sin cambiar qué módulos dependen (directa o indirectamente) de
+        cuáles. Si hay ciclos se reduce la condensación: las aristas dentro de
+        un grupo circular se conservan y, entre dos grupos, se quitan las
+        implicadas por otro camino y las repetidas (queda la primera agregada).
+        
+        Las componentes se recorren con recorrer_alcance (un bit por
+        componente). Las dependencias de una componente se revisan de la más
+        cercana a la más lejana en ese orden, así que una dependencia ya
+        cubierta por las anteriores es redundante.
+        
+        Args:
+            aplicar (bool): True para eliminar del grafo las dependencias redundantes
+        
+        Returns:
+            list: Lista de tuplas (modulo_origen, modulo_destino) redundantes, en
+                  el orden en que se recorren las dependencias del grafo
+        """
+        componente_de = {}
+        redundantes = set()
+        
+        for indice, componente, _, filas, _ in self.recorrer_alcance():
+            for modulo in componente:
+                componente_de[modulo] = indice
+            
+            # Aristas hacia otras componentes agrupadas por componente destino
+            aristas = {}
+            for modulo in componente:
+                for dependencia in self.dependencias[modulo]:
+                    destino = componente_de[dependencia]
+                    if destino != indice:
+                        aristas.setdefault(destino, []).append((modulo, dependencia))
+            
+            # De la componente más cercana a la más lejana en el recorrido: una
+            # destino solo puede alcanzarse desde las revisadas antes que ella
+            cubiertas = 0
+            for destino in sorted(aristas, reverse=True):
+                if cubiertas & (1 << destino):
+                    redundantes.update(aristas[destino])
+                else:
+                    cubiertas |= filas[destino]
+                    redundantes.update(aristas[destino][1:])
+        
+        # Reportar en el orden de recorrido de las dependencias del grafo
+        removibles = [
+            (origen, destino)
+            for origen, deps in self.dependencias.items()
+            for destino in deps
+            if (origen, destino) in redundantes
+        ]
+        
+        if aplicar and removibles:
+            self.eliminar_dependencias_lote(removibles)
+        
+        return removibles
+    
+    def _ciclo_en_componente(self, componente):
+        """
+        Obtiene un ciclo concreto dentro de una componente fuertemente conexa
+        mediante BFS desde su primer módulo (el ciclo más corto que lo contiene)
+        
+        Args:
+            componente (list): Módulos de la componente (más de uno)
+            
+        Returns:
+            list: Ciclo como lista de módulos que termina en el módulo inicial
+        """
+        miembros = set(componente)
+        inicio = componente[0]
+        padres = {inicio: None}
+        cola = [inicio]
+        
+        for modulo in cola:
+            for dependencia in self.dependencias[modulo]:
+                if dependencia == inicio:
+                    # Reconstruir el camino inicio -> ... -> modulo
+                    ciclo = [inicio]
+                    while modulo is not None:
+                        ciclo.append(modulo)
+                        modulo = padres[modulo]
+                    ciclo.reverse()
+                    return ciclo
+                if dependencia in miembros and dependencia not in padres:
+                    padres[dependencia] = modulo
+                    cola.append(dependencia)
+        
+        return [inicio]
+    
+    def _recorrido_profundidad(self, raiz, adyacencia, visitados):
+        """
+        Recorrido en profundidad con pila explícita (sin recursión), compartido
+        por los análisis del grafo. Tiempo y memoria O(V + E) sin importar
+        la profundidad de las cadenas de dependencias.
         
-        for modulo in self.modulos:
-            if modulo not in visitados:
-                dfs(modulo, [])
+        Args:
+            raiz (str): Módulo desde el que se inicia el recorrido
+            adyacencia (dict): Lista de adyacencia a seguir (self.dependencias
+                               o self.dependientes)
+            visitados (set): Módulos ya visitados; se actualiza en el recorrido
+            
+        Yields:
+            tuple: (evento, modulo, vecino) donde evento es _ENTRADA, _ARISTA
+                   o _SALIDA y vecino solo se informa en _ARISTA
+        """
+        visitados.add(raiz)
+        yield (_ENTRADA, raiz, None)
+        pila = [(raiz, iter(adyacencia[raiz]))]
         
-        return (len(ciclos_encontrados) > 0, ciclos_encontrados)
+        while pila:
+            modulo, vecinos = pila[-1]
+            
+            for vecino in vecinos:
+                if vecino in visitados:
+                    yield (_ARISTA, modulo, vecino)
+                else:
+                    visitados.add(vecino)
+                    yield (_ENTRADA, vecino, None)
+                    pila.append((vecino, iter(adyacencia[vecino])))
+                    break
+            else:
+                pila.pop()
+                yield (_SALIDA, modulo, None)
+    
+    def _alcanzables(self, raiz, adyacencia):
+        """
+        Obtiene los módulos alcanzables desde un módulo siguiendo la
+        adyacencia indicada. El propio módulo solo se incluye si forma
+        parte de un ciclo.
+        
+        Args:
+            raiz (str): Módulo de inicio
+            adyacencia (dict): self.dependencias o self.dependientes
+            
+        Returns:
+            list: Módulos alcanzables en orden de descubrimiento
+        """
+        alcanzados = {}
+        
+        for evento, modulo, vecino in self._recorrido_profundidad(
+                raiz, adyacencia, set()):
+            if evento == _ENTRADA and modulo != raiz:
+                alcanzados[modulo] = None
+            elif evento == _ARISTA and vecino == raiz:
+                alcanzados[raiz] = None
+        
+        return list(alcanzados)
     
     def ordenamiento_topologico(self):
         """
         Realiza un ordenamiento topológico del grafo (orden de compilación)
         
+        En modo acíclico se devuelve el orden mantenido incrementalmente en
+        O(V); es un orden válido, pero sin el desempate alfabético.
+        
         Returns:
             list: Lista ordenada de módulos, o None si hay ciclos
         """
-        # Verificar que no haya ciclos
-        tiene_ciclos, _ = self.detectar_ciclos()
-        if tiene_ciclos:
+        if self._posicion is not None:
+            return [modulo for modulo in self._orden if modulo is not None]
+        
+        orden, pendientes = self.orden_kahn()
+        
+        if pendientes:
+            return None
+        
+        return orden
+    
+    def ordenamiento_topologico_detallado(self):
+        """
+        Realiza el ordenamiento topológico e informa qué bloquea el orden
+        cuando existen ciclos
+        
+        Returns:
+            tuple: (list, list) - (orden de compilación, componentes fuertemente
+                   conexas que bloquean el ordenamiento). Si el grafo es acíclico
+                   la segunda lista está vacía; si no, el orden es parcial y
+                   contiene solo los módulos que pueden compilarse
+        """
+        orden, pendientes = self.orden_kahn()
+        
+        # Los ciclos solo pueden estar entre los módulos que quedaron pendientes
+        componentes = [
+            sorted(componente)
+            for componente in self.componentes_fuertes(pendientes)
+            if len(componente) > 1
+        ]
+        componentes.sort()
+        
+        return (orden, componentes)
+    
+    def ruta_critica(self):
+        """
+        Calcula la ruta crítica de la compilación con programación dinámica
+        sobre el orden topológico, usando el costo de cada módulo. Con núcleos
+        ilimitados ninguna compilación puede durar menos que la ruta crítica.
+        
+        Para cada módulo se obtiene su inicio más temprano (cuando termina la
+        última de sus dependencias) y su holgura: cuánto puede retrasarse sin
+        alargar la compilación. Los módulos con holgura 0 están en una ruta
+        crítica y son los primeros candidatos a dividirse.
+        
+        Returns:
+            dict: Diccionario con la ruta (cadena más larga, dependencias
+                  primero), la cota_inferior del tiempo de compilación en
+                  paralelo, el costo_total (tiempo con un solo núcleo) y los
+                  diccionarios inicio_temprano y holgura por módulo; None si
+                  hay ciclos
+        """
+        orden = self.ordenamiento_topologico()
+        if orden is None:
             return None
         
-        # Algoritmo de Kahn
-        grados_entrada = {modulo: 0 for modulo in self.modulos}
+        modulos = self.modulos
+        inicio = {}
+        fin = {}
+        # Dependencia que determina el inicio de cada módulo (None si no tiene)
+        predecesor = {}
         
-        # Calcular grados de entrada
-        for modulo in self.dependencias:
+        for modulo in orden:
+            inicio_modulo = 0.0
+            anterior = None
             for dependencia in self.dependencias[modulo]:
-                grados_entrada[dependencia] += 1
+                if anterior is None or fin[dependencia] > inicio_modulo:
+                    inicio_modulo = fin[dependencia]
+                    anterior = dependencia
+            inicio[modulo] = inicio_modulo
+            fin[modulo] = inicio_modulo + modulos[modulo].costo
+            predecesor[modulo] = anterior
+        
+        duracion = max(fin.values(), default=0.0)
+        
+        # Recorrido inverso: fin más tardío sin retrasar la compilación
+        holgura = {}
+        fin_tardio = {}
+        for modulo in reversed(orden):
+            limite = duracion
+            for dependiente in self.dependientes[modulo]:
+                limite = min(limite, fin_tardio[dependiente] - modulos[dependiente].costo)
+            fin_tardio[modulo] = limite
+            holgura[modulo] = limite - fin[modulo]
+        
+        # Reconstruir la cadena más larga desde el primer módulo que termina último
+        ruta = []
+        actual = next((modulo for modulo in orden if fin[modulo] == duracion), None)
+        while actual is not None:
+            ruta.append(actual)
+            actual = predecesor[actual]
+        ruta.reverse()
         
-        # Cola con módulos sin dependencias
-        cola = [modulo for modulo in self.modulos if grados_entrada[modulo] == 0]
+        return {
+            "ruta": ruta,
+            "cota_inferior": duracion,
+            "costo_total": sum((modulos[modulo].costo for modulo in orden), 0.0),
+            "inicio_temprano": {modulo: inicio[modulo] for modulo in orden},
+            "holgura": {modulo: holgura[modulo] for modulo in orden}
+        }
+    
+    def orden_kahn(self):
+        """
+        Motor del ordenamiento topológico (algoritmo de Kahn con cola de
+        prioridad). Los empates se resuelven en orden alfabético.
+        Complejidad: O(V + E log V)
+        
+        Returns:
+            tuple: (list, dict) - (módulos ordenados, módulos pendientes que no
+                   pudieron ordenarse por estar en un ciclo o depender de uno)
+        """
+        # Grado de entrada = cantidad de dependencias aún no compiladas
+        grados_entrada = {
+            modulo: len(deps) for modulo, deps in self.dependencias.items()
+        }
+        
+        # Cola de prioridad con módulos sin dependencias
+        cola = [modulo for modulo, grado in grados_entrada.items() if grado == 0]
+        heapq.heapify(cola)
         resultado = []
         
         while cola:
-            # Ordenar para tener resultados consistentes
-            cola.sort()
-            modulo_actual = cola.pop(0)
+            modulo_actual = heapq.heappop(cola)
             resultado.append(modulo_actual)
             
             # Reducir grado de entrada de los dependientes
-            dependientes = self.obtener_dependientes(modulo_actual)
-            for dependiente in dependientes:
+            for dependiente in self.dependientes[modulo_actual]:
                 grados_entrada[dependiente] -= 1
                 if grados_entrada[dependiente] == 0:
-                    cola.append(dependiente)
+                    heapq.heappush(cola, dependiente)
+        
+        pendientes = {
+            modulo: None for modulo, grado in grados_entrada.items() if grado > 0
+        }
+        
+        return (resultado, pendientes)
+    
+    def componentes_fuertes(self, nodos=None):
+        """
+        Calcula las componentes fuertemente conexas del subgrafo inducido por
+        los nodos indicados (algoritmo de Tarjan sobre el recorrido iterativo).
+        Complejidad: O(V + E)
+        
+        Args:
+            nodos (dict): Módulos a considerar, usado como conjunto ordenado
+                          (None = todos los módulos)
         
-        return resultado
+        Returns:
+            list: Lista de componentes, cada una una lista de módulos en orden
+                  de descubrimiento. Cada componente aparece después de todas
+                  aquellas de las que depende (orden de compilación)
+        """
+        if nodos is None:
+            nodos = self.modulos
+        
+        indice = {}
+        bajo = {}
+        pila = []
+        en_pila = set()
+        camino = []
+        componentes = []
+        
+        # Los módulos fuera del subgrafo se marcan como visitados para que el
+        # recorrido no entre en ellos
+        visitados = {modulo for modulo in self.modulos if modulo not in nodos}
+        
+        for raiz in nodos:
+            if raiz in visitados:
+                continue
+            
+            for evento, modulo, vecino in self._recorrido_profundidad(
+                    raiz, self.dependencias, visitados):
+                if evento == _ENTRADA:
+                    indice[modulo] = bajo[modulo] = len(indice)
+                    pila.append(modulo)
+                    en_pila.add(modulo)
+                    camino.append(modulo)
+                elif evento == _ARISTA:
+                    if vecino in en_pila:
+                        bajo[modulo] = min(bajo[modulo], indice[vecino])
+                else:
+                    camino.pop()
+                    if camino:
+                        padre = camino[-1]
+                        bajo[padre] = min(bajo[padre], bajo[modulo])
+                    
+                    # Raíz de una componente: desapilar todos sus miembros
+                    if bajo[modulo] == indice[modulo]:
+                        componente = []
+                        while True:
+                            miembro = pila.pop()
+                            en_pila.remove(miembro)
+                            componente.append(miembro)
+                            if miembro == modulo:
+                                break
+                        componente.reverse()
+                        componentes.append(componente)
+        
+        return componentes
+    
+    def recorrer_alcance(self, nodos=None, inverso=False, ids=None):
+        """
+        Recorre las componentes fuertemente conexas del subgrafo inducido por
+        los nodos de modo que cada una se procese después de las que alcanza,
+        calculando como entero de bits lo alcanzable desde cada componente.
+        La fila de una componente se descarta cuando ya la usaron todas las
+        componentes que la alcanzan.
+        
+        Args:
+            nodos (dict): Módulos a considerar (None = todos los módulos); las
+                          aristas hacia módulos fuera de ellos se ignoran
+            inverso (bool): True para seguir dependientes en lugar de dependencias
+            ids (dict): Bit de cada módulo (None = un bit por componente, el
+                        de su índice en el recorrido)
+        
+        Yields:
+            tuple: (int, list, set, dict, int) - (índice de la componente, sus
+                   módulos, índices de las componentes vecinas, filas de las
+                   componentes aún necesarias con sus propios miembros incluidos,
+                   bits alcanzables desde la componente). Los miembros de la
+                   componente forman parte de su alcance solo si es un ciclo.
+                   Las filas son válidas hasta pedir la siguiente componente
+        """
+        adyacencia = self.dependientes if inverso else self.dependencias
+        
+        # Las componentes aparecen después de aquellas de las que dependen;
+        # para los dependientes se recorren al revés
+        componentes = self.componentes_fuertes(nodos)
+        if inverso:
+            componentes.reverse()
+        
+        componente_de = {}
+        for indice, componente in enumerate(componentes):
+            for modulo in componente:
+                componente_de[modulo] = indice
+        
+        # Componentes vecinas de cada componente y cuántas la alcanzan
+        sucesoras = []
+        padres_restantes = [0] * len(componentes)
+        for indice, componente in enumerate(componentes):
+            vecinas = {
+                componente_de[vecino]
+                for modulo in componente
+                for vecino in adyacencia[modulo]
+                if vecino in componente_de
+            }
+            vecinas.discard(indice)
+            for vecina in vecinas:
+                padres_restantes[vecina] += 1
+            sucesoras.append(vecinas)
+        
+        filas = {}
+        for indice, vecinas in enumerate(sucesoras):
+            componente = componentes[indice]
+            if ids is None:
+                miembros = 1 << indice
+            else:
+                miembros = 0
+                for modulo in componente:
+                    miembros |= 1 << ids[modulo]
+            
+            alcance = miembros if len(componente) > 1 else 0
+            for vecina in vecinas:
+                alcance |= filas[vecina]
+            
+            yield (indice, componente, vecinas, filas, alcance)
+            
+            for vecina in vecinas:
+                padres_restantes[vecina] -= 1
+                if padres_restantes[vecina] == 0:
+                    del filas[vecina]
+            if padres_restantes[indice]:
+                filas[indice] = alcance | miembros
     
     def obtener_modulos_independientes(self):
         """
@@ -245,13 +1277,17 @@ class GrafoDependencias:
         Returns:
             list: Lista de nombres de módulos independientes
         """
-        independientes = []
-        
-        for modulo in self.modulos:
-            if len(self.dependencias[modulo]) == 0:
-                independientes.append(modulo)
+        return list(self._sin_dependencias)
+    
+    def obtener_modulos_sin_dependientes(self):
+        """
+        Obtiene los módulos de los que no depende ningún otro (pueden
+        modificarse sin afectar a otros módulos)
         
-        return independientes
+        Returns:
+            list: Lista de nombres de módulos sin dependientes
+        """
+        return list(self._sin_dependientes)
     
     def analisis_impacto(self, nombre_modulo):
         """
@@ -267,19 +1303,55 @@ class GrafoDependencias:
         if nombre_modulo not in self.modulos:
             return []
         
-        afectados = set()
-        
-        def dfs_inverso(modulo):
-            dependientes = self.obtener_dependientes(modulo)
-            for dependiente in dependientes:
-                if dependiente not in afectados:
-                    afectados.add(dependiente)
-                    dfs_inverso(dependiente)
+        if self.cache is None:
+            return self._alcanzables(nombre_modulo, self.dependientes)
         
-        dfs_inverso(nombre_modulo)
+        afectados = self.cache.obtener_inversa(nombre_modulo)
+        if afectados is None:
+            afectados = dict.fromkeys(
+                self._alcanzables(nombre_modulo, self.dependientes)
+            )
+            self.cache.guardar_inversa(nombre_modulo, afectados)
         
         return list(afectados)
     
+    def analisis_impacto_multiple(self, modulos_cambiados, profundidad_maxima=None):
+        """
+        Analiza el impacto de un conjunto de cambios con un único recorrido en
+        anchura desde todos los módulos cambiados a la vez, de modo que cada
+        módulo afectado se visita una sola vez aunque lo alcancen varios cambios
+        
+        Args:
+            modulos_cambiados (iterable): Nombres de los módulos modificados
+                                          (los inexistentes se ignoran)
+            profundidad_maxima (int): Distancia máxima a explorar (None = sin límite)
+        
+        Returns:
+            dict: {modulo: (distancia, origen)} en orden de distancia. Los módulos
+                  cambiados aparecen con distancia 0 y ellos mismos como origen;
+                  el origen de los demás es el cambio que los alcanzó primero
+        """
+        afectados = {}
+        for modulo in modulos_cambiados:
+            if modulo in self.modulos and modulo not in afectados:
+                afectados[modulo] = (0, modulo)
+        
+        frontera = list(afectados)
+        distancia = 0
+        
+        while frontera and (profundidad_maxima is None or distancia < profundidad_maxima):
+            distancia += 1
+            siguiente = []
+            for modulo in frontera:
+                origen = afectados[modulo][1]
+                for dependiente in self.dependientes[modulo]:
+                    if dependiente not in afectados:
+                        afectados[dependiente] = (distancia, origen)
+                        siguiente.append(dependiente)
+            frontera = siguiente
+        
+        return afectados
+    
     def obtener_dependencias_transitivas(self, nombre_modulo):
         """
         Obtiene todas las dependencias transitivas de un módulo
@@ -293,34 +1365,392 @@ class GrafoDependencias:
         if nombre_modulo not in self.modulos:
             return []
         
-        visitados = set()
+        if self.cache is None:
+            return self._alcanzables(nombre_modulo, self.dependencias)
         
-        def dfs(modulo):
-            for dependencia in self.dependencias.get(modulo, []):
-                if dependencia not in visitados:
-                    visitados.add(dependencia)
-                    dfs(dependencia)
+        dependencias = self.cache.obtener_directa(nombre_modulo)
+        if dependencias is None:
+            dependencias = dict.fromkeys(
+                self._alcanzables(nombre_modulo, self.dependencias)
+            )
+            self.cache.guardar_directa(nombre_modulo, dependencias)
         
-        dfs(nombre_modulo)
+        return list(dependencias)
+    
+    def iterar_dependencias_transitivas(self, nombre_modulo, profundidad_maxima=None, filtro=None):
+        """
+        Versión perezosa de obtener_dependencias_transitivas: genera las
+        dependencias en orden de anchura junto con su distancia, y deja de
+        recorrer el grafo en cuanto se deja de consumir el generador. El grafo
+        no debe modificarse mientras se itera.
         
-        return list(visitados)
+        Args:
+            nombre_modulo (str): Nombre del módulo
+            profundidad_maxima (int): Distancia máxima a explorar (None = sin límite)
+            filtro (callable): Función que recibe el nombre de cada módulo
+                               alcanzado; solo se generan los que la cumplen (el
+                               recorrido continúa a través de los demás)
+        
+        Yields:
+            tuple: (modulo, distancia)
+        """
+        return self._recorrido_anchura(
+            nombre_modulo, self.dependencias, profundidad_maxima, filtro
+        )
+    
+    def iterar_impacto(self, nombre_modulo, profundidad_maxima=None, filtro=None):
+        """
+        Versión perezosa de analisis_impacto: genera los módulos afectados en
+        orden de anchura junto con su distancia (ver iterar_dependencias_transitivas)
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo a analizar
+            profundidad_maxima (int): Distancia máxima a explorar (None = sin límite)
+            filtro (callable): Función que decide qué módulos se generan
+        
+        Yields:
+            tuple: (modulo, distancia)
+        """
+        return self._recorrido_anchura(
+            nombre_modulo, self.dependientes, profundidad_maxima, filtro
+        )
+    
+    def _recorrido_anchura(self, raiz, adyacencia, profundidad_maxima, filtro):
+        """
+        Recorrido en anchura por niveles, perezoso. Igual que en _alcanzables,
+        la raíz solo se genera si forma parte de un ciclo.
+        
+        Args:
+            raiz (str): Módulo de inicio
+            adyacencia (dict): self.dependencias o self.dependientes
+            profundidad_maxima (int): Distancia máxima (None = sin límite)
+            filtro (callable): Predicado sobre el nombre del módulo (None = todos)
+        
+        Yields:
+            tuple: (modulo, distancia)
+        """
+        if raiz not in adyacencia:
+            return
+        
+        visitados = {raiz}
+        raiz_en_ciclo = False
+        frontera = [raiz]
+        distancia = 0
+        
+        while frontera and (profundidad_maxima is None or distancia < profundidad_maxima):
+            distancia += 1
+            siguiente = []
+            for modulo in frontera:
+                for vecino in adyacencia[modulo]:
+                    if vecino not in visitados:
+                        visitados.add(vecino)
+                        siguiente.append(vecino)
+                    elif vecino == raiz and not raiz_en_ciclo:
+                        raiz_en_ciclo = True
+                    else:
+                        continue
+                    if filtro is None or filtro(vecino):
+                        yield (vecino, distancia)
+            frontera = siguiente
     
     def obtener_estadisticas(self):
         """
-        Obtiene estadísticas del grafo
+        Obtiene estadísticas del grafo. Los contadores se mantienen en cada
+        modificación, así que la consulta es O(1) mientras el grafo no cambie.
         
         Returns:
             dict: Diccionario con estadísticas
         """
-        total_modulos = len(self.modulos)
-        total_dependencias = sum(len(deps) for deps in self.dependencias.values())
-        modulos_independientes = len(self.obtener_modulos_independientes())
-        tiene_ciclos, ciclos = self.detectar_ciclos()
+        ciclos = self._obtener_ciclos()
         
         return {
-            "total_modulos": total_modulos,
-            "total_dependencias": total_dependencias,
-            "modulos_independientes": modulos_independientes,
-            "tiene_ciclos": tiene_ciclos,
+            "total_modulos": len(self.modulos),
+            "total_dependencias": self.total_dependencias,
+            "modulos_independientes": len(self._sin_dependencias),
+            "modulos_sin_dependientes": len(self._sin_dependientes),
+            "tiene_ciclos": len(ciclos) > 0,
             "cantidad_ciclos": len(ciclos)
         }
+
+
+class GrafoCondensado:
+    """Clase que representa la condensación (DAG de componentes fuertemente
+       conexas) de un grafo de dependencias"""
+    
+    def __init__(self, grafo):
+        """
+        Construye la condensación de un grafo en O(V + E)
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a condensar
+        """
+        componentes = grafo.obtener_componentes_fuertes()
+        # Numerar las componentes por su primer módulo para conservar el
+        # desempate alfabético del ordenamiento topológico
+        componentes.sort(key=lambda componente: componente[0])
+        
+        # Lista de componentes; el índice de cada una es su nodo en el DAG
+        self.componentes = componentes
+        # Diccionario que mapea nombre de módulo -> índice de su componente
+        self.componente_de = {}
+        # Grafo acíclico entre componentes (nodos = índices)
+        self.dag = GrafoDependencias()
+        
+        for indice, componente in enumerate(componentes):
+            self.dag.agregar_modulo(indice, ", ".join(map(str, componente)))
+            for modulo in componente:
+                self.componente_de[modulo] = indice
+        
+        for modulo, deps in grafo.dependencias.items():
+            origen = self.componente_de[modulo]
+            for dependencia in deps:
+                destino = self.componente_de[dependencia]
+                if origen != destino:
+                    self.dag.agregar_dependencia(origen, destino)
+    
+    def es_ciclica(self, indice):
+        """
+        Indica si una componente es un grupo de dependencias circulares
+        
+        Args:
+            indice (int): Índice de la componente
+            
+        Returns:
+            bool: True si la componente tiene más de un módulo
+        """
+        return len(self.componentes[indice]) > 1
+    
+    def obtener_componentes_ciclicas(self):
+        """
+        Obtiene todos los grupos de dependencias circulares
+        
+        Returns:
+            list: Lista de componentes con más de un módulo
+        """
+        return [
+            componente for componente in self.componentes
+            if len(componente) > 1
+        ]
+    
+    def ordenamiento_topologico(self):
+        """
+        Realiza el ordenamiento topológico sobre el DAG de componentes.
+        Los módulos de una misma componente deben compilarse juntos.
+        
+        Returns:
+            list: Lista ordenada de componentes (listas de módulos)
+        """
+        return [
+            self.componentes[indice]
+            for indice in self.dag.ordenamiento_topologico()
+        ]
+    
+    def obtener_dependencias_transitivas(self, nombre_modulo):
+        """
+        Obtiene todas las dependencias transitivas de un módulo usando el DAG
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+            
+        Returns:
+            list: Lista de todas las dependencias (directas e indirectas)
+        """
+        if nombre_modulo not in self.componente_de:
+            return []
+        
+        indice = self.componente_de[nombre_modulo]
+        return self._expandir(indice, self.dag.obtener_dependencias_transitivas(indice))
+    
+    def analisis_impacto(self, nombre_modulo):
+        """
+        Analiza qué módulos se verían afectados si se modifica un módulo,
+        usando el DAG
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo a analizar
+            
+        Returns:
+            list: Lista de módulos afectados
+        """
+        if nombre_modulo not in self.componente_de:
+            return []
+        
+        indice = self.componente_de[nombre_modulo]
+        return self._expandir(indice, self.dag.analisis_impacto(indice))
+    
+    def _expandir(self, indice, alcanzadas):
+        """
+        Convierte componentes alcanzadas en la lista de sus módulos. Si la
+        componente de origen es cíclica, sus propios módulos también se
+        alcanzan (incluido el módulo consultado).
+        
+        Args:
+            indice (int): Componente de origen
+            alcanzadas (list): Componentes alcanzadas desde la de origen
+            
+        Returns:
+            list: Lista de módulos
+        """
+        modulos = []
+        
+        if self.es_ciclica(indice):
+            modulos.extend(self.componentes[indice])
+        
+        for alcanzada in alcanzadas:
+            modulos.extend(self.componentes[alcanzada])
+        
+        return modulos
+
+
+def _solo_lectura(self, *args, **kwargs):
+    """Rechaza las modificaciones sobre un grafo de solo lectura"""
+    raise TypeError(f"{type(self).__name__} es de solo lectura")
+
+
+class GrafoSoloLectura(GrafoDependencias):
+    """Clase base de los grafos que admiten todas las consultas de
+       GrafoDependencias pero ninguna modificación"""
+    
+    agregar_modulo = _solo_lectura
+    agregar_dependencia = _solo_lectura
+    eliminar_dependencia = _solo_lectura
+    eliminar_modulo = _solo_lectura
+    establecer_costo = _solo_lectura
+    agregar_modulos_lote = _solo_lectura
+    agregar_dependencias_lote = _solo_lectura
+    eliminar_dependencias_lote = _solo_lectura
+    activar_modo_aciclico = _solo_lectura
+    desactivar_modo_aciclico = _solo_lectura
+    
+    def reduccion_transitiva(self, aplicar=False):
+        """Calcula la reducción transitiva; no puede aplicarse sobre el grafo"""
+        if aplicar:
+            _solo_lectura(self)
+        return super().reduccion_transitiva()
+
+
+class _ConjuntoVista:
+    """Conjunto de aristas de un módulo del grafo base restringido a los
+       miembros de una vista (se filtra al recorrerlo, sin copiarlo)"""
+    
+    __slots__ = ("base", "miembros")
+    
+    def __init__(self, base, miembros):
+        self.base = base
+        self.miembros = miembros
+    
+    def __iter__(self):
+        miembros = self.miembros
+        return (vecino for vecino in self.base if vecino in miembros)
+    
+    def __contains__(self, vecino):
+        return vecino in self.miembros and vecino in self.base
+    
+    def __len__(self):
+        miembros = self.miembros
+        return sum(1 for vecino in self.base if vecino in miembros)
+    
+    def __bool__(self):
+        return any(vecino in self.miembros for vecino in self.base)
+
+
+class _TablaVista:
+    """Diccionario de solo lectura del grafo base (modulos, dependencias o
+       dependientes) restringido a los miembros de una vista"""
+    
+    __slots__ = ("base", "miembros", "conjuntos")
+    
+    def __init__(self, base, miembros, conjuntos):
+        """
+        Args:
+            base (dict): Diccionario del grafo base
+            miembros (dict): Módulos de la vista
+            conjuntos (bool): True si los valores son conjuntos de aristas que
+                              también deben restringirse
+        """
+        self.base = base
+        self.miembros = miembros
+        self.conjuntos = conjuntos
+    
+    def __getitem__(self, nombre):
+        if nombre not in self.miembros:
+            raise KeyError(nombre)
+        valor = self.base[nombre]
+        if self.conjuntos:
+            return _ConjuntoVista(valor, self.miembros)
+        return valor
+    
+    def get(self, nombre, defecto=None):
+        if nombre in self:
+            return self[nombre]
+        return defecto
+    
+    def __contains__(self, nombre):
+        return nombre in self.miembros and nombre in self.base
+    
+    def __iter__(self):
+        base = self.base
+        return (nombre for nombre in self.miembros if nombre in base)
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def keys(self):
+        return iter(self)
+    
+    def values(self):
+        return (self[nombre] for nombre in self)
+    
+    def items(self):
+        return ((nombre, self[nombre]) for nombre in self)
+
+
+class VistaSubgrafo(GrafoSoloLectura):
+    """Clase que representa una vista de solo lectura de un GrafoDependencias
+       restringida a un subconjunto de módulos. No copia aristas: consulta las
+       del grafo base y descarta las que salen del subconjunto, así que refleja
+       los cambios posteriores del grafo base."""
+    
+    def __init__(self, grafo, modulos):
+        """
+        Crea la vista en O(k), con k la cantidad de módulos indicados
+        
+        Args:
+            grafo (GrafoDependencias): Grafo base
+            modulos (iterable): Módulos de la vista (los inexistentes se ignoran)
+        """
+        self.grafo = grafo
+        self.miembros = {modulo: None for modulo in modulos if modulo in grafo.modulos}
+        self.modulos = _TablaVista(grafo.modulos, self.miembros, False)
+        self.dependencias = _TablaVista(grafo.dependencias, self.miembros, True)
+        self.dependientes = _TablaVista(grafo.dependientes, self.miembros, True)
+        self.cache = None
+        self.diario = None
+        self._orden = None
+        self._posicion = None
+        self._huecos = 0
+        self.ciclo_rechazado = None
+    
+    # La caché no vería los cambios del grafo base
+    activar_cache = _solo_lectura
+    
+    @property
+    def total_dependencias(self):
+        """Cantidad de aristas entre módulos de la vista"""
+        return sum(len(deps) for deps in self.dependencias.values())
+    
+    @property
+    def _sin_dependencias(self):
+        return {modulo: None for modulo, deps in self.dependencias.items() if not deps}
+    
+    @property
+    def _sin_dependientes(self):
+        return {modulo: None for modulo, deps in self.dependientes.items() if not deps}
+    
+    def _obtener_ciclos(self):
+        """Los ciclos se recalculan en cada consulta: el grafo base puede cambiar"""
+        return [
+            self._ciclo_en_componente(componente)
+            for componente in self.componentes_fuertes(self.modulos)
+            if len(componente) > 1
+        ]
@@ -0,0 +1,527 @@
+"""Módulo que implementa una versión congelada y compacta del grafo de dependencias.
+   Los nombres de los módulos se traducen a identificadores enteros consecutivos y
+   las aristas se guardan en formato CSR (compressed sparse row) usando arreglos
+   de `array`, tanto en sentido directo (dependencias) como inverso (dependientes).
+"""
+
+import heapq
+from array import array
+
+
+class GrafoCompacto:
+    """Clase que representa una instantánea inmutable y compacta de un GrafoDependencias"""
+    
+    def __init__(self, grafo):
+        """
+        Construye la instantánea a partir de un grafo de dependencias en O(V + E)
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a congelar
+        """
+        # Tabla de nombres: identificador entero -> nombre de módulo
+        self.nombres = list(grafo.modulos)
+        # Diccionario inverso: nombre de módulo -> identificador entero
+        self.ids = {nombre: id_modulo for id_modulo, nombre in enumerate(self.nombres)}
+        self.descripciones = [grafo.modulos[nombre].descripcion for nombre in self.nombres]
+        self.costos = array("d", [grafo.modulos[nombre].costo for nombre in self.nombres])
+        
+        # Aristas directas: las dependencias del módulo i son
+        # destinos[desplazamientos[i]:desplazamientos[i + 1]]
+        self.desplazamientos, self.destinos = self._construir_csr(grafo.dependencias)
+        # Aristas inversas con el mismo formato
+        self.desplazamientos_inv, self.origenes = self._construir_csr(grafo.dependientes)
+        
+        # Identificadores en orden alfabético de nombre (por_rango) y posición
+        # de cada módulo en ese orden (rango), para el desempate del
+        # ordenamiento topológico sin comparar cadenas
+        self.por_rango = array(
+            "i", sorted(range(len(self.nombres)), key=self.nombres.__getitem__)
+        )
+        self.rango = array("i", bytes(4 * len(self.nombres)))
+        for posicion, id_modulo in enumerate(self.por_rango):
+            self.rango[id_modulo] = posicion
+    
+    @classmethod
+    def desde_arreglos(cls, nombres, ids, descripciones, desplazamientos, destinos,
+                       desplazamientos_inv, origenes, rango, por_rango, costos=None):
+        """
+        Construye la instantánea directamente a partir de sus tablas, sin
+        copiarlas (por ejemplo, vistas sobre un archivo mapeado en memoria)
+        
+        Args:
+            nombres (sequence): Identificador -> nombre
+            ids (mapping): Nombre -> identificador (soporta `in` y `[]`)
+            descripciones (sequence): Identificador -> descripción
+            desplazamientos, destinos: Aristas directas en formato CSR
+            desplazamientos_inv, origenes: Aristas inversas en formato CSR
+            rango, por_rango: Orden alfabético de los módulos
+            costos (sequence): Identificador -> costo (None = 1.0 para todos)
+        
+        Returns:
+            GrafoCompacto: Instantánea que usa las tablas recibidas
+        """
+        compacto = cls.__new__(cls)
+        compacto.nombres = nombres
+        compacto.ids = ids
+        compacto.descripciones = descripciones
+        compacto.desplazamientos = desplazamientos
+        compacto.destinos = destinos
+        compacto.desplazamientos_inv = desplazamientos_inv
+        compacto.origenes = origenes
+        compacto.rango = rango
+        compacto.por_rango = por_rango
+        compacto.costos = costos if costos is not None else array("d", [1.0]) * len(nombres)
+        
+        return compacto
+    
+    def _construir_csr(self, adyacencia):
+        """
+        Convierte una lista de adyacencia por nombre en arreglos CSR
+        
+        Args:
+            adyacencia (dict): modulo -> módulos vecinos
+        
+        Returns:
+            tuple: (array, array) - (desplazamientos, vecinos)
+        """
+        desplazamientos = array("q", [0])
+        vecinos = array("i")
+        ids = self.ids
+        
+        for nombre in self.nombres:
+            vecinos.extend([ids[vecino] for vecino in adyacencia[nombre]])
+            desplazamientos.append(len(vecinos))
+        
+        return (desplazamientos, vecinos)
+    
+    def cantidad_modulos(self):
+        """Retorna la cantidad de módulos de la instantánea"""
+        return len(self.nombres)
+    
+    def cantidad_dependencias(self):
+        """Retorna la cantidad de aristas de la instantánea"""
+        return len(self.destinos)
+    
+    def obtener_dependencias_directas(self, nombre_modulo):
+        """
+        Obtiene las dependencias directas de un módulo
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+        
+        Returns:
+            list: Lista de nombres de módulos de los que depende directamente
+        """
+        if nombre_modulo not in self.ids:
+            return []
+        
+        id_modulo = self.ids[nombre_modulo]
+        inicio = self.desplazamientos[id_modulo]
+        fin = self.desplazamientos[id_modulo + 1]
+        
+        return [self.nombres[destino] for destino in self.destinos[inicio:fin]]
+    
+    def obtener_dependientes(self, nombre_modulo):
+        """
+        Obtiene los módulos que dependen de este módulo
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+        
+        Returns:
+            list: Lista de nombres de módulos que dependen de este
+        """
+        if nombre_modulo not in self.ids:
+            return []
+        
+        id_modulo = self.ids[nombre_modulo]
+        inicio = self.desplazamientos_inv[id_modulo]
+        fin = self.desplazamientos_inv[id_modulo + 1]
+        
+        return [self.nombres[origen] for origen in self.origenes[inicio:fin]]
+    
+    def obtener_dependencias_transitivas(self, nombre_modulo):
+        """
+        Obtiene todas las dependencias transitivas de un módulo
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+        
+        Returns:
+            list: Lista de todas las dependencias (directas e indirectas)
+        """
+        if nombre_modulo not in self.ids:
+            return []
+        
+        alcanzados = self._alcanzables(
+            self.ids[nombre_modulo], self.desplazamientos, self.destinos
+        )
+        return [self.nombres[id_modulo] for id_modulo in alcanzados]
+    
+    def analisis_impacto(self, nombre_modulo):
+        """
+        Analiza qué módulos se verían afectados si se modifica un módulo
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo a analizar
+        
+        Returns:
+            list: Lista de módulos afectados
+        """
+        if nombre_modulo not in self.ids:
+            return []
+        
+        alcanzados = self._alcanzables(
+            self.ids[nombre_modulo], self.desplazamientos_inv, self.origenes
+        )
+        return [self.nombres[id_modulo] for id_modulo in alcanzados]
+    
+    def analisis_impacto_multiple(self, modulos_cambiados, profundidad_maxima=None):
+        """
+        Analiza el impacto de un conjunto de cambios con un único recorrido en
+        anchura multiorigen, igual que GrafoDependencias.analisis_impacto_multiple
+        
+        Args:
+            modulos_cambiados (iterable): Nombres de los módulos modificados
+            profundidad_maxima (int): Distancia máxima a explorar (None = sin límite)
+        
+        Returns:
+            dict: {modulo: (distancia, origen)} en orden de distancia
+        """
+        # origen_de[m]: identificador del cambio que alcanzó a m, -1 si no se visitó
+        origen_de = array("i", [-1]) * len(self.nombres)
+        afectados = {}
+        frontera = []
+        for nombre in modulos_cambiados:
+            if nombre in self.ids:
+                id_modulo = self.ids[nombre]
+                if origen_de[id_modulo] < 0:
+                    origen_de[id_modulo] = id_modulo
+                    afectados[self.nombres[id_modulo]] = (0, self.nombres[id_modulo])
+                    frontera.append(id_modulo)
+        
+        distancia = 0
+        
+        while frontera and (profundidad_maxima is None or distancia < profundidad_maxima):
+            distancia += 1
+            siguiente = []
+            for modulo in frontera:
+                origen = origen_de[modulo]
+                for posicion in range(self.desplazamientos_inv[modulo], self.desplazamientos_inv[modulo + 1]):
+                    dependiente = self.origenes[posicion]
+                    if origen_de[dependiente] < 0:
+                        origen_de[dependiente] = origen
+                        afectados[self.nombres[dependiente]] = (distancia, self.nombres[origen])
+                        siguiente.append(dependiente)
+            frontera = siguiente
+        
+        return afectados
+    
+    def _alcanzables(self, raiz, desplazamientos, vecinos):
+        """
+        Recorrido en profundidad iterativo sobre arreglos CSR. Produce los
+        mismos resultados, en el mismo orden, que GrafoDependencias._alcanzables
+        
+        Args:
+            raiz (int): Identificador del módulo de inicio
+            desplazamientos (array): Desplazamientos CSR
+            vecinos (array): Vecinos CSR
+        
+        Returns:
+            list: Identificadores alcanzables en orden de descubrimiento
+        """
+        visitado = bytearray(len(self.nombres))
+        visitado[raiz] = 1
+        alcanzados = []
+        raiz_alcanzada = False
+        # Pila de (módulo, posición del siguiente vecino a explorar)
+        pila_modulos = [raiz]
+        pila_posiciones = [desplazamientos[raiz]]
+        
+        while pila_modulos:
+            modulo = pila_modulos[-1]
+            posicion = pila_posiciones[-1]
+            fin = desplazamientos[modulo + 1]
+            
+            while posicion < fin:
+                vecino = vecinos[posicion]
+                posicion += 1
+                if not visitado[vecino]:
+                    visitado[vecino] = 1
+                    alcanzados.append(vecino)
+                    pila_posiciones[-1] = posicion
+                    pila_modulos.append(vecino)
+                    pila_posiciones.append(desplazamientos[vecino])
+                    break
+                if vecino == raiz and not raiz_alcanzada:
+                    raiz_alcanzada = True
+                    alcanzados.append(raiz)
+            else:
+                pila_modulos.pop()
+                pila_posiciones.pop()
+        
+        return alcanzados
+    
+    def ordenamiento_topologico(self):
+        """
+        Realiza un ordenamiento topológico (orden de compilación)
+        
+        Returns:
+            list: Lista ordenada de módulos, o None si hay ciclos
+        """
+        orden, pendientes = self._orden_kahn()
+        
+        if pendientes:
+            return None
+        
+        return [self.nombres[id_modulo] for id_modulo in orden]
+    
+    def ordenamiento_topologico_detallado(self):
+        """
+        Realiza el ordenamiento topológico e informa qué bloquea el orden
+        cuando existen ciclos
+        
+        Returns:
+            tuple: (list, list) - (orden de compilación, componentes fuertemente
+                   conexas que bloquean el ordenamiento)
+        """
+        orden, pendientes = self._orden_kahn()
+        
+        componentes = [
+            sorted(self.nombres[id_modulo] for id_modulo in componente)
+            for componente in self._componentes_fuertes(pendientes)
+            if len(componente) > 1
+        ]
+        componentes.sort()
+        
+        return ([self.nombres[id_modulo] for id_modulo in orden], componentes)
+    
+    def _orden_kahn(self):
+        """
+        Algoritmo de Kahn con cola de prioridad sobre los rangos alfabéticos
+        
+        Returns:
+            tuple: (list, list) - (identificadores ordenados, identificadores
+                   pendientes por estar en un ciclo o depender de uno)
+        """
+        cantidad = len(self.nombres)
+        desplazamientos = self.desplazamientos
+        grados_entrada = array(
+            "q", [desplazamientos[i + 1] - desplazamientos[i] for i in range(cantidad)]
+        )
+        rango = self.rango
+        # La cola guarda rangos; por_rango traduce de vuelta al identificador
+        por_rango = self.por_rango
+        
+        cola = [rango[i] for i in range(cantidad) if grados_entrada[i] == 0]
+        heapq.heapify(cola)
+        resultado = []
+        
+        while cola:
+            modulo_actual = por_rango[heapq.heappop(cola)]
+            resultado.append(modulo_actual)
+            
+            for posicion in range(self.desplazamientos_inv[modulo_actual],
+                                  self.desplazamientos_inv[modulo_actual + 1]):
+                dependiente = self.origenes[posicion]
+                grados_entrada[dependiente] -= 1
+                if grados_entrada[dependiente] == 0:
+                    heapq.heappush(cola, rango[dependiente])
+        
+        pendientes = [i for i in range(cantidad) if grados_entrada[i] > 0]
+        
+        return (resultado, pendientes)
+    
+    def obtener_componentes_fuertes(self):
+        """
+        Obtiene las componentes fuertemente conexas de la instantánea
+        
+        Returns:
+            list: Lista de componentes (listas ordenadas de módulos); cada
+                  componente aparece después de aquellas de las que depende
+        """
+        return [
+            sorted(self.nombres[id_modulo] for id_modulo in componente)
+            for componente in self._componentes_fuertes(range(len(self.nombres)))
+        ]
+    
+    def detectar_ciclos(self):
+        """
+        Detecta ciclos reportando uno por cada grupo de dependencias circulares
+        
+        Returns:
+            tuple: (bool, list) - (tiene_ciclos, lista de ciclos encontrados)
+        """
+        ciclos_encontrados = []
+        
+        for componente in self._componentes_fuertes(range(len(self.nombres))):
+            if len(componente) > 1:
+                ciclo = self._ciclo_en_componente(componente)
+                ciclos_encontrados.append([self.nombres[id_modulo] for id_modulo in ciclo])
+        
+        return (len(ciclos_encontrados) > 0, ciclos_encontrados)
+    
+    def _componentes_fuertes(self, nodos):
+        """
+        Algoritmo de Tarjan iterativo sobre el subgrafo inducido por los nodos
+        
+        Args:
+            nodos (iterable): Identificadores a considerar, en orden
+        
+        Returns:
+            list: Lista de componentes (listas de identificadores en orden de
+                  descubrimiento), en orden de compilación
+        """
+        cantidad = len(self.nombres)
+        desplazamientos = self.desplazamientos
+        destinos = self.destinos
+        nodos = list(nodos)
+        permitido = bytearray(cantidad)
+        for nodo in nodos:
+            permitido[nodo] = 1
+        
+        sin_indice = -1
+        indice = array("q", [sin_indice]) * cantidad
+        bajo = array("q", [0]) * cantidad
+        en_pila = bytearray(cantidad)
+        pila = []
+        componentes = []
+        contador = 0
+        
+        for raiz in nodos:
+            if indice[raiz] != sin_indice:
+                continue
+            
+            indice[raiz] = bajo[raiz] = contador
+            contador += 1
+            pila.append(raiz)
+            en_pila[raiz] = 1
+            pila_modulos = [raiz]
+            pila_posiciones = [desplazamientos[raiz]]
+            
+            while pila_modulos:
+                modulo = pila_modulos[-1]
+                posicion = pila_posiciones[-1]
+                fin = desplazamientos[modulo + 1]
+                descendio = False
+                
+                while posicion < fin:
+                    vecino = destinos[posicion]
+                    posicion += 1
+                    if not permitido[vecino]:
+                        continue
+                    if indice[vecino] == sin_indice:
+                        indice[vecino] = bajo[vecino] = contador
+                        contador += 1
+                        pila.append(vecino)
+                        en_pila[vecino] = 1
+                        pila_posiciones[-1] = posicion
+                        pila_modulos.append(vecino)
+                        pila_posiciones.append(desplazamientos[vecino])
+                        descendio = True
+                        break
+                    if en_pila[vecino] and indice[vecino] < bajo[modulo]:
+                        bajo[modulo] = indice[vecino]
+                
+                if descendio:
+                    continue
+                
+                pila_modulos.pop()
+                pila_posiciones.pop()
+                if pila_modulos:
+                    padre = pila_modulos[-1]
+                    if bajo[modulo] < bajo[padre]:
+                        bajo[padre] = bajo[modulo]
+                
+                # Raíz de una componente: desapilar todos sus miembros
+                if bajo[modulo] == indice[modulo]:
+                    componente = []
+                    while True:
+                        miembro = pila.pop()
+                        en_pila[miembro] = 0
+                        componente.append(miembro)
+                        if miembro == modulo:
+                            break
+                    componente.reverse()
+                    componentes.append(componente)
+        
+        return componentes
+    
+    def _ciclo_en_componente(self, componente):
+        """
+        Obtiene el ciclo más corto que pasa por el primer módulo de una
+        componente fuertemente conexa (BFS)
+        
+        Args:
+            componente (list): Identificadores de la componente
+        
+        Returns:
+            list: Ciclo como lista de identificadores que termina en el inicial
+        """
+        miembros = set(componente)
+        inicio = componente[0]
+        padres = {inicio: None}
+        cola = [inicio]
+        
+        for modulo in cola:
+            for posicion in range(self.desplazamientos[modulo],
+                                  self.desplazamientos[modulo + 1]):
+                dependencia = self.destinos[posicion]
+                if dependencia == inicio:
+                    ciclo = [inicio]
+                    while modulo is not None:
+                        ciclo.append(modulo)
+                        modulo = padres[modulo]
+                    ciclo.reverse()
+                    return ciclo
+                if dependencia in miembros and dependencia not in padres:
+                    padres[dependencia] = modulo
+                    cola.append(dependencia)
+        
+        return [inicio]
+    
+    def obtener_modulos_independientes(self):
+        """
+        Obtiene los módulos sin dependencias (pueden compilarse primero)
+        
+        Returns:
+            list: Lista de nombres de módulos independientes
+        """
+        desplazamientos = self.desplazamientos
+        
+        return [
+            self.nombres[i] for i in range(len(self.nombres))
+            if desplazamientos[i] == desplazamientos[i + 1]
+        ]
+    
+    def obtener_modulos_sin_dependientes(self):
+        """
+        Obtiene los módulos de los que no depende ningún otro
+        
+        Returns:
+            list: Lista de nombres de módulos sin dependientes
+        """
+        desplazamientos_inv = self.desplazamientos_inv
+        
+        return [
+            self.nombres[i] for i in range(len(self.nombres))
+            if desplazamientos_inv[i] == desplazamientos_inv[i + 1]
+        ]
+    
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas de la instantánea
+        
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        tiene_ciclos, ciclos = self.detectar_ciclos()
+        
+        return {
+            "total_modulos": len(self.nombres),
+            "total_dependencias": len(self.destinos),
+            "modulos_independientes": len(self.obtener_modulos_independientes()),
+            "modulos_sin_dependientes": len(self.obtener_modulos_sin_dependientes()),
+            "tiene_ciclos": tiene_ciclos,
+            "cantidad_ciclos": len(ciclos)
+        }
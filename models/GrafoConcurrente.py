@@ -0,0 +1,363 @@
+"""Módulo que implementa un modo concurrente para el grafo de dependencias.
+   Las consultas de varios hilos se ejecutan en paralelo bajo un bloqueo de lectura
+   y las modificaciones bajo un bloqueo de escritura. Las versiones (instantáneas)
+   comparten las estructuras del grafo y solo se copia lo que un escritor modifica
+   mientras alguna versión sigue viva (copia en escritura).
+"""
+
+import threading
+import weakref
+from contextlib import contextmanager
+
+from models.Grafo import GrafoDependencias, GrafoSoloLectura, Modulo
+
+
+class BloqueoLecturaEscritura:
+    """Clase que representa un bloqueo de lectores-escritor con preferencia al escritor"""
+    
+    def __init__(self):
+        """Inicializa el bloqueo libre"""
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escribiendo = False
+        # Escritores esperando: bloquean a los lectores nuevos para que un
+        # flujo continuo de lecturas no deje esperando al escritor
+        self._escritores_esperando = 0
+    
+    def adquirir_lectura(self):
+        """Adquiere el bloqueo compartido de lectura"""
+        with self._condicion:
+            while self._escribiendo or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+    
+    def liberar_lectura(self):
+        """Libera el bloqueo de lectura"""
+        with self._condicion:
+            self._lectores -= 1
+            if self._lectores == 0:
+                self._condicion.notify_all()
+    
+    def adquirir_escritura(self):
+        """Adquiere el bloqueo exclusivo de escritura"""
+        with self._condicion:
+            self._escritores_esperando += 1
+            while self._escribiendo or self._lectores:
+                self._condicion.wait()
+            self._escritores_esperando -= 1
+            self._escribiendo = True
+    
+    def liberar_escritura(self):
+        """Libera el bloqueo de escritura"""
+        with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+    
+    @contextmanager
+    def lectura(self):
+        """Contexto que mantiene el bloqueo de lectura"""
+        self.adquirir_lectura()
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
+    
+    @contextmanager
+    def escritura(self):
+        """Contexto que mantiene el bloqueo de escritura"""
+        self.adquirir_escritura()
+        try:
+            yield
+        finally:
+            self.liberar_escritura()
+
+
+class VersionGrafo(GrafoSoloLectura):
+    """Clase que representa una versión inmutable de un GrafoConcurrente. Admite
+       todas las consultas de GrafoDependencias sin bloqueos."""
+    
+    def __init__(self, grafo, version):
+        """
+        Crea la versión compartiendo (sin copiar) las estructuras del grafo
+        
+        Args:
+            grafo (GrafoDependencias): Grafo de origen
+            version (int): Número de versión del grafo concurrente
+        """
+        self.version = version
+        self.modulos = grafo.modulos
+        self.dependencias = grafo.dependencias
+        self.dependientes = grafo.dependientes
+        self.total_dependencias = grafo.total_dependencias
+        self._sin_dependencias = grafo._sin_dependencias
+        self._sin_dependientes = grafo._sin_dependientes
+        self._orden = grafo._orden
+        self._posicion = grafo._posicion
+        self._huecos = grafo._huecos
+        self.ciclo_rechazado = grafo.ciclo_rechazado
+        self._ciclos = grafo._ciclos
+        # La caché del grafo sigue su estado actual; la versión puede activar la suya
+        self.cache = None
+        self.diario = None
+
+
+class GrafoConcurrente:
+    """Clase que protege un GrafoDependencias para usarlo desde varios hilos"""
+    
+    def __init__(self, grafo=None):
+        """
+        Inicializa el modo concurrente
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a proteger (None = grafo vacío). A
+                                       partir de aquí solo debe usarse a través
+                                       de este objeto
+        """
+        self.grafo = grafo if grafo is not None else GrafoDependencias()
+        self.bloqueo = BloqueoLecturaEscritura()
+        # Cantidad de modificaciones aplicadas
+        self.version = 0
+        # Versiones vivas que comparten estructuras con el grafo
+        self._versiones = weakref.WeakSet()
+        self._mutex_versiones = threading.Lock()
+        # True si los diccionarios principales siguen compartidos con la
+        # última versión creada
+        self._superior_compartido = False
+        # Módulos cuyo conjunto de aristas (o registro) ya se copió desde la
+        # última versión creada y puede modificarse en el lugar
+        self._propias_dependencias = set()
+        self._propias_dependientes = set()
+        self._propios_modulos = set()
+    
+    @contextmanager
+    def lectura(self):
+        """
+        Contexto para varias consultas consistentes seguidas sobre el grafo
+        
+        Yields:
+            GrafoDependencias: El grafo protegido (no debe modificarse)
+        """
+        with self.bloqueo.lectura():
+            yield self.grafo
+    
+    def instantanea(self):
+        """
+        Crea en O(1) una versión estable del grafo que no bloquea a los
+        escritores: cada modificación posterior copia solo los diccionarios
+        que toca
+        
+        Returns:
+            VersionGrafo: Versión de solo lectura del estado actual
+        """
+        with self.bloqueo.lectura(), self._mutex_versiones:
+            version = VersionGrafo(self.grafo, self.version)
+            self._versiones.add(version)
+            self._superior_compartido = True
+            self._propias_dependencias = set()
+            self._propias_dependientes = set()
+            self._propios_modulos = set()
+        
+        return version
+    
+    def _desacoplar(self, dependencias=(), dependientes=(), modulos=()):
+        """
+        Copia, si alguna versión viva los comparte, los diccionarios que una
+        modificación va a tocar. Se llama con el bloqueo de escritura tomado.
+        
+        Args:
+            dependencias (iterable): Módulos cuyo conjunto de dependencias cambia
+            dependientes (iterable): Módulos cuyo conjunto de dependientes cambia
+            modulos (iterable): Módulos cuyo registro Modulo cambia
+        """
+        if not self._versiones:
+            return
+        
+        grafo = self.grafo
+        if self._superior_compartido:
+            grafo.modulos = dict(grafo.modulos)
+            grafo.dependencias = dict(grafo.dependencias)
+            grafo.dependientes = dict(grafo.dependientes)
+            grafo._sin_dependencias = dict(grafo._sin_dependencias)
+            grafo._sin_dependientes = dict(grafo._sin_dependientes)
+            if grafo._orden is not None:
+                grafo._orden = list(grafo._orden)
+                grafo._posicion = dict(grafo._posicion)
+            self._superior_compartido = False
+        
+        self._copiar_conjuntos(grafo.dependencias, dependencias, self._propias_dependencias)
+        self._copiar_conjuntos(grafo.dependientes, dependientes, self._propias_dependientes)
+        
+        for nombre in modulos:
+            if nombre in grafo.modulos and nombre not in self._propios_modulos:
+                anterior = grafo.modulos[nombre]
+                grafo.modulos[nombre] = Modulo(anterior.nombre, anterior.descripcion, anterior.costo)
+                self._propios_modulos.add(nombre)
+    
+    def _copiar_conjuntos(self, adyacencia, modulos, propios):
+        """Copia los conjuntos de aristas indicados que aún son compartidos"""
+        for nombre in modulos:
+            if nombre in adyacencia and nombre not in propios:
+                adyacencia[nombre] = dict(adyacencia[nombre])
+                propios.add(nombre)
+    
+    def _registrar(self, cambios):
+        """Avanza la versión si hubo cambios y retorna el valor recibido"""
+        if cambios:
+            self.version += 1
+        return cambios
+    
+    def agregar_modulo(self, nombre, descripcion="", costo=1.0):
+        """Versión protegida de GrafoDependencias.agregar_modulo"""
+        with self.bloqueo.escritura():
+            self._desacoplar()
+            return self._registrar(self.grafo.agregar_modulo(nombre, descripcion, costo))
+    
+    def agregar_dependencia(self, modulo_origen, modulo_destino):
+        """Versión protegida de GrafoDependencias.agregar_dependencia"""
+        with self.bloqueo.escritura():
+            self._desacoplar((modulo_origen,), (modulo_destino,))
+            return self._registrar(self.grafo.agregar_dependencia(modulo_origen, modulo_destino))
+    
+    def eliminar_dependencia(self, modulo_origen, modulo_destino):
+        """Versión protegida de GrafoDependencias.eliminar_dependencia"""
+        with self.bloqueo.escritura():
+            self._desacoplar((modulo_origen,), (modulo_destino,))
+            return self._registrar(self.grafo.eliminar_dependencia(modulo_origen, modulo_destino))
+    
+    def eliminar_modulo(self, nombre):
+        """Versión protegida de GrafoDependencias.eliminar_modulo"""
+        with self.bloqueo.escritura():
+            grafo = self.grafo
+            if nombre in grafo.modulos:
+                # Se modifican los conjuntos de sus vecinos, no los suyos
+                self._desacoplar(grafo.dependientes[nombre], grafo.dependencias[nombre])
+            return self._registrar(grafo.eliminar_modulo(nombre))
+    
+    def establecer_costo(self, nombre, costo):
+        """Versión protegida de GrafoDependencias.establecer_costo"""
+        with self.bloqueo.escritura():
+            self._desacoplar(modulos=(nombre,))
+            return self._registrar(self.grafo.establecer_costo(nombre, costo))
+    
+    def agregar_modulos_lote(self, modulos):
+        """Versión protegida de GrafoDependencias.agregar_modulos_lote"""
+        modulos = list(modulos)
+        with self.bloqueo.escritura():
+            self._desacoplar()
+            reporte = self.grafo.agregar_modulos_lote(modulos)
+            self._registrar(reporte["exitosos"])
+            return reporte
+    
+    def agregar_dependencias_lote(self, dependencias):
+        """Versión protegida de GrafoDependencias.agregar_dependencias_lote"""
+        dependencias = list(dependencias)
+        with self.bloqueo.escritura():
+            return self._aplicar_lote(self.grafo.agregar_dependencias_lote, dependencias)
+    
+    def eliminar_dependencias_lote(self, dependencias):
+        """Versión protegida de GrafoDependencias.eliminar_dependencias_lote"""
+        dependencias = list(dependencias)
+        with self.bloqueo.escritura():
+            return self._aplicar_lote(self.grafo.eliminar_dependencias_lote, dependencias)
+    
+    def _aplicar_lote(self, operacion, dependencias):
+        """Desacopla los conjuntos tocados por un lote de aristas y lo aplica"""
+        self._desacoplar(
+            [origen for origen, _ in dependencias],
+            [destino for _, destino in dependencias]
+        )
+        reporte = operacion(dependencias)
+        self._registrar(reporte["exitosos"])
+        return reporte
+    
+    def reduccion_transitiva(self, aplicar=False):
+        """Versión protegida de GrafoDependencias.reduccion_transitiva"""
+        if not aplicar:
+            with self.bloqueo.lectura():
+                return self.grafo.reduccion_transitiva()
+        
+        with self.bloqueo.escritura():
+            removibles = self.grafo.reduccion_transitiva()
+            if removibles:
+                self._aplicar_lote(self.grafo.eliminar_dependencias_lote, removibles)
+            return removibles
+    
+    def activar_cache(self, capacidad=1024):
+        """Versión protegida de GrafoDependencias.activar_cache"""
+        with self.bloqueo.escritura():
+            return self.grafo.activar_cache(capacidad)
+    
+    def activar_modo_aciclico(self):
+        """Versión protegida de GrafoDependencias.activar_modo_aciclico"""
+        with self.bloqueo.escritura():
+            return self.grafo.activar_modo_aciclico()
+    
+    def desactivar_modo_aciclico(self):
+        """Versión protegida de GrafoDependencias.desactivar_modo_aciclico"""
+        with self.bloqueo.escritura():
+            self.grafo.desactivar_modo_aciclico()
+    
+    def obtener_dependencias_directas(self, nombre_modulo):
+        """Versión protegida de GrafoDependencias.obtener_dependencias_directas"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_dependencias_directas(nombre_modulo)
+    
+    def obtener_dependientes(self, nombre_modulo):
+        """Versión protegida de GrafoDependencias.obtener_dependientes"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_dependientes(nombre_modulo)
+    
+    def obtener_dependencias_transitivas(self, nombre_modulo):
+        """Versión protegida de GrafoDependencias.obtener_dependencias_transitivas"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_dependencias_transitivas(nombre_modulo)
+    
+    def analisis_impacto(self, nombre_modulo):
+        """Versión protegida de GrafoDependencias.analisis_impacto"""
+        with self.bloqueo.lectura():
+            return self.grafo.analisis_impacto(nombre_modulo)
+    
+    def analisis_impacto_multiple(self, modulos_cambiados, profundidad_maxima=None):
+        """Versión protegida de GrafoDependencias.analisis_impacto_multiple"""
+        with self.bloqueo.lectura():
+            return self.grafo.analisis_impacto_multiple(modulos_cambiados, profundidad_maxima)
+    
+    def detectar_ciclos(self):
+        """Versión protegida de GrafoDependencias.detectar_ciclos"""
+        with self.bloqueo.lectura():
+            return self.grafo.detectar_ciclos()
+    
+    def ordenamiento_topologico(self):
+        """Versión protegida de GrafoDependencias.ordenamiento_topologico"""
+        with self.bloqueo.lectura():
+            return self.grafo.ordenamiento_topologico()
+    
+    def ordenamiento_topologico_detallado(self):
+        """Versión protegida de GrafoDependencias.ordenamiento_topologico_detallado"""
+        with self.bloqueo.lectura():
+            return self.grafo.ordenamiento_topologico_detallado()
+    
+    def ruta_critica(self):
+        """Versión protegida de GrafoDependencias.ruta_critica"""
+        with self.bloqueo.lectura():
+            return self.grafo.ruta_critica()
+    
+    def obtener_modulos_independientes(self):
+        """Versión protegida de GrafoDependencias.obtener_modulos_independientes"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_modulos_independientes()
+    
+    def obtener_modulos_sin_dependientes(self):
+        """Versión protegida de GrafoDependencias.obtener_modulos_sin_dependientes"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_modulos_sin_dependientes()
+    
+    def obtener_estadisticas(self):
+        """Versión protegida de GrafoDependencias.obtener_estadisticas"""
+        with self.bloqueo.lectura():
+            return self.grafo.obtener_estadisticas()
+    
+    def congelar(self):
+        """Versión protegida de GrafoDependencias.congelar"""
+        with self.bloqueo.lectura():
+            return self.grafo.congelar()
@@ -0,0 +1,186 @@
+"""Módulo que implementa un índice de alcanzabilidad con conjuntos de bits para el grafo de dependencias.
+   Responde en O(1) preguntas del tipo "¿el módulo A depende (directa o indirectamente) de B?"
+   y combina clausuras de varios módulos con operaciones de bits sobre enteros de Python.
+"""
+
+import sys
+
+
+class IndiceAlcanzabilidad:
+    """Clase que representa la matriz de alcanzabilidad de un grafo como filas de bits"""
+    
+    def __init__(self, grafo):
+        """
+        Construye el índice recorriendo las componentes fuertemente conexas en
+        orden de compilación: la fila de cada componente es la unión de las
+        filas de las componentes de las que depende. Los módulos de un mismo
+        ciclo comparten fila. El índice es una instantánea: no se actualiza si
+        el grafo cambia después de construirlo.
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a indexar
+        """
+        # Identificador entero (posición del bit) de cada módulo
+        self.nombres = list(grafo.modulos)
+        self.ids = {nombre: id_modulo for id_modulo, nombre in enumerate(self.nombres)}
+        self.bytes_por_fila = (len(self.nombres) + 7) // 8
+        
+        # Componente de cada módulo (por identificador)
+        self.componente_de = [0] * len(self.nombres)
+        # filas[c]: bits de los módulos alcanzables desde la componente c
+        self.filas = []
+        
+        for indice, componente, _, _, alcance in grafo.recorrer_alcance(ids=self.ids):
+            for nombre in componente:
+                self.componente_de[self.ids[nombre]] = indice
+            self.filas.append(alcance.to_bytes(self.bytes_por_fila, "little"))
+    
+    def depende_de(self, modulo_origen, modulo_destino):
+        """
+        Indica si modulo_origen depende directa o indirectamente de modulo_destino
+        
+        Args:
+            modulo_origen (str): Nombre del módulo que depende
+            modulo_destino (str): Nombre del módulo del que depende
+        
+        Returns:
+            bool: True si existe un camino de dependencias, False en caso contrario
+        """
+        if modulo_origen not in self.ids or modulo_destino not in self.ids:
+            return False
+        
+        fila = self.filas[self.componente_de[self.ids[modulo_origen]]]
+        bit = self.ids[modulo_destino]
+        
+        return bool(fila[bit >> 3] & (1 << (bit & 7)))
+    
+    def consultar_pares(self, pares):
+        """
+        Responde muchas consultas "¿A depende de B?" a la vez
+        
+        Args:
+            pares (iterable): Tuplas (modulo_origen, modulo_destino)
+        
+        Returns:
+            list: Lista de bool, una respuesta por par
+        """
+        return [self.depende_de(origen, destino) for origen, destino in pares]
+    
+    def obtener_dependencias_transitivas(self, nombre_modulo):
+        """
+        Obtiene las dependencias transitivas de un módulo a partir de su fila
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+        
+        Returns:
+            list: Lista de módulos (en orden de inserción en el grafo)
+        """
+        if nombre_modulo not in self.ids:
+            return []
+        
+        return self._decodificar(self.filas[self.componente_de[self.ids[nombre_modulo]]])
+    
+    def cantidad_dependencias_transitivas(self, nombre_modulo):
+        """
+        Cuenta las dependencias transitivas de un módulo sin listarlas
+        
+        Args:
+            nombre_modulo (str): Nombre del módulo
+        
+        Returns:
+            int: Cantidad de módulos de los que depende
+        """
+        return bin(self._fila_entera(nombre_modulo)).count("1")
+    
+    def union_dependencias(self, nombres_modulos):
+        """
+        Obtiene los módulos de los que depende al menos uno de los indicados
+        
+        Args:
+            nombres_modulos (iterable): Nombres de los módulos
+        
+        Returns:
+            list: Lista de módulos en la unión de las clausuras
+        """
+        resultado = 0
+        for nombre in nombres_modulos:
+            resultado |= self._fila_entera(nombre)
+        
+        return self._decodificar(resultado.to_bytes(self.bytes_por_fila, "little"))
+    
+    def interseccion_dependencias(self, nombres_modulos):
+        """
+        Obtiene los módulos de los que dependen todos los indicados
+        
+        Args:
+            nombres_modulos (iterable): Nombres de los módulos
+        
+        Returns:
+            list: Lista de módulos en la intersección de las clausuras
+        """
+        resultado = None
+        for nombre in nombres_modulos:
+            fila = self._fila_entera(nombre)
+            resultado = fila if resultado is None else resultado & fila
+        
+        if not resultado:
+            return []
+        
+        return self._decodificar(resultado.to_bytes(self.bytes_por_fila, "little"))
+    
+    def obtener_uso_memoria(self):
+        """
+        Obtiene la memoria ocupada por el índice
+        
+        Returns:
+            dict: Diccionario con bytes de las filas de bits, de las tablas
+                  auxiliares y el total
+        """
+        bytes_filas = sum(sys.getsizeof(fila) for fila in self.filas)
+        bytes_tablas = (
+            sys.getsizeof(self.filas)
+            + sys.getsizeof(self.componente_de)
+            + sys.getsizeof(self.ids)
+            + sys.getsizeof(self.nombres)
+        )
+        total = bytes_filas + bytes_tablas
+        
+        return {
+            "modulos": len(self.nombres),
+            "filas": len(self.filas),
+            "bytes_filas": bytes_filas,
+            "bytes_tablas": bytes_tablas,
+            "bytes_total": total,
+            "bytes_por_modulo": total / len(self.nombres) if self.nombres else 0.0
+        }
+    
+    def _fila_entera(self, nombre_modulo):
+        """Obtiene la fila de un módulo como entero (0 si no existe)"""
+        if nombre_modulo not in self.ids:
+            return 0
+        
+        fila = self.filas[self.componente_de[self.ids[nombre_modulo]]]
+        return int.from_bytes(fila, "little")
+    
+    def _decodificar(self, fila):
+        """
+        Traduce una fila de bits a nombres de módulos, saltando bytes vacíos
+        
+        Args:
+            fila (bytes): Fila de bits
+        
+        Returns:
+            list: Lista de nombres de módulos cuyo bit está encendido
+        """
+        modulos = []
+        
+        for posicion, byte in enumerate(fila):
+            if not byte:
+                continue
+            base = posicion << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    modulos.append(self.nombres[base + bit])
+        
+        return modulos
@@ -217,12 +217,23 @@ class ServicioProyectos:
             print(" No hay módulos en el sistema")
             return
         
-        orden = self.grafo.ordenamiento_topologico()
+        orden, bloqueantes = self.grafo.ordenamiento_topologico_detallado()
         
-        if orden is None:
+        if bloqueantes:
             print("\n No se puede determinar el orden de compilación")
             print("   Existen dependencias circulares en el grafo")
-            print("   Use la opción de 'Detectar ciclos' para identificarlos")
+            print(f"   Grupos de módulos que bloquean el orden ({len(bloqueantes)}):")
+            for componente in bloqueantes:
+                print(f"   - {', '.join(componente)}")
+            
+            # Orden por grupos: los módulos de un ciclo se compilan juntos
+            grupos = self.grafo.obtener_condensacion().ordenamiento_topologico()
+            print(f"\n Orden de compilación por grupos ({len(grupos)} grupos):")
+            for i, grupo in enumerate(grupos, 1):
+                if len(grupo) > 1:
+                    print(f"   {i}. [{', '.join(grupo)}] (ciclo, compilar juntos)")
+                else:
+                    print(f"   {i}. {grupo[0]}")
         else:
             print(f"\n Orden de compilación óptimo ({len(orden)} módulos):")
             for i, modulo in enumerate(orden, 1):
@@ -296,6 +307,7 @@ class ServicioProyectos:
         print(f"   Total de módulos:         {stats['total_modulos']}")
         print(f"   Total de dependencias:    {stats['total_dependencias']}")
         print(f"   Módulos independientes:   {stats['modulos_independientes']}")
+        print(f"   Módulos sin dependientes: {stats['modulos_sin_dependientes']}")
         print(f"   Tiene ciclos:             {'Sí ' if stats['tiene_ciclos'] else 'No '}")
         if stats['tiene_ciclos']:
             print(f"   Cantidad de ciclos:       {stats['cantidad_ciclos']}")
@@ -364,8 +376,7 @@ class ServicioProyectos:
             ("Pagos", "Procesamiento de pagos")
         ]
         
-        for nombre, desc in modulos:
-            self.grafo.agregar_modulo(nombre, desc)
+        self.grafo.agregar_modulos_lote(modulos)
         
         # Dependencias
         dependencias = [
@@ -382,8 +393,7 @@ class ServicioProyectos:
             ("Validaciones", "Logs")
         ]
         
-        for origen, destino in dependencias:
-            self.grafo.agregar_dependencia(origen, destino)
+        self.grafo.agregar_dependencias_lote(dependencias)
         
         print("\n Datos de ejemplo cargados correctamente")
         print(f"   - {len(modulos)} módulos")
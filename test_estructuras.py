@@ -3,8 +3,20 @@
 Script de prueba para verificar el funcionamiento de las estructuras de datos
 """
 
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
+
 from models.Arbol import ArbolUniversitario
+from models.EjecutorCompilacion import EjecutorCompilacion
 from models.Grafo import GrafoDependencias
+from models.GrafoConcurrente import GrafoConcurrente
+from utils.ArchivosGrafo import ArchivosGrafo
+from utils.DiarioGrafo import DiarioGrafo
+from utils.InstantaneaGrafo import InstantaneaGrafo
 
 def probar_arbol():
     """Prueba las operaciones del árbol"""
@@ -38,6 +50,14 @@ def probar_arbol():
     print("\n TODAS LAS PRUEBAS DEL ÁRBOL PASARON\n")
 
 
+def crear_grafo_rombo():
+    """Crea el grafo A -> B -> D, A -> C -> D con costo 2.0 en C"""
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote([("A", "Módulo A"), ("B", "Módulo B"), ("C", "Módulo C", 2.0), ("D", "Módulo D")])
+    grafo.agregar_dependencias_lote([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+    return grafo
+
+
 def probar_grafo():
     """Prueba las operaciones del grafo"""
     print("="*60)
@@ -69,15 +89,107 @@ def probar_grafo():
     # Ordenamiento topológico
     orden = grafo.ordenamiento_topologico()
     print(f" Orden topológico: {orden}")
+    assert orden == ["D", "B", "C", "A"], "Las dependencias deben compilarse primero"
+    
+    # Ruta crítica con costos de compilación
+    grafo.establecer_costo("C", 2.0)
+    critica = grafo.ruta_critica()
+    assert critica["ruta"] == ["D", "C", "A"] and critica["cota_inferior"] == 4.0
+    assert critica["holgura"]["B"] == 1.0 and critica["inicio_temprano"]["A"] == 3.0
+    print(f" Ruta crítica: {critica['ruta']} ({critica['cota_inferior']} de {critica['costo_total']})")
     
     # Módulos independientes
     independientes = grafo.obtener_modulos_independientes()
     print(f" Módulos independientes: {independientes}")
     
+    # Centralidad de intermediación: A -> D pasa por B y por C
+    centralidad = grafo.centralidad_intermediacion(muestras=16, top_k=2, max_trabajadores=2)
+    assert centralidad["exacto"] and centralidad["ranking"][0]["modulo"] == "B"
+    assert [fila["centralidad"] for fila in centralidad["ranking"]] == [0.5, 0.5]
+    print(f" Módulos más centrales: {[fila['modulo'] for fila in centralidad['ranking']]}")
+    
+    # Impacto de un conjunto de cambios
+    impacto = grafo.analisis_impacto_multiple(["D", "C"])
+    assert impacto == {"D": (0, "D"), "C": (0, "C"), "B": (1, "D"), "A": (1, "C")}
+    assert list(grafo.analisis_impacto_multiple(["D"], profundidad_maxima=1)) == ["D", "B", "C"]
+    print(f" Impacto de los cambios D y C: {impacto}")
+    
+    # Recorridos perezosos con distancia y profundidad máxima
+    assert list(grafo.iterar_impacto("D", profundidad_maxima=1)) == [("B", 1), ("C", 1)]
+    assert any(modulo == "D" for modulo, _ in grafo.iterar_dependencias_transitivas("A", 2))
+    primeros = list(itertools.islice(grafo.iterar_impacto("D", filtro=lambda m: m != "B"), 1))
+    assert primeros == [("C", 1)]
+    print(f" Recorrido perezoso desde A: {list(grafo.iterar_dependencias_transitivas('A'))}")
+    
     # Estadísticas
     stats = grafo.obtener_estadisticas()
     print(f" Estadísticas: {stats}")
     
+    # Instantánea compacta (CSR)
+    compacto = grafo.congelar()
+    assert compacto.ordenamiento_topologico() == orden
+    assert compacto.analisis_impacto("D") == grafo.analisis_impacto("D")
+    print(f" Instantánea compacta: {compacto.cantidad_modulos()} módulos, "
+          f"{compacto.cantidad_dependencias()} dependencias")
+    
+    # Índice de alcanzabilidad con filas de bits
+    indice = grafo.construir_indice_alcanzabilidad()
+    assert indice.depende_de("A", "D") and not indice.depende_de("D", "A")
+    assert not indice.depende_de("A", "A") and not indice.depende_de("A", "Z")
+    assert indice.consultar_pares([("B", "D"), ("B", "C")]) == [True, False]
+    assert indice.obtener_dependencias_transitivas("A") == ["B", "C", "D"]
+    assert indice.union_dependencias(["B", "C"]) == ["D"]
+    assert indice.interseccion_dependencias(["A", "B"]) == ["D"]
+    assert indice.interseccion_dependencias(["B", "D"]) == []
+    memoria = indice.obtener_uso_memoria()
+    assert memoria["modulos"] == 4 and memoria["filas"] == 4 and memoria["bytes_total"] > 0
+    
+    # Con un ciclo X -> Y -> X los miembros comparten fila y dependen de sí mismos
+    ciclico = GrafoDependencias()
+    ciclico.agregar_modulos_lote(["W", "X", "Y", "Z"])
+    ciclico.agregar_dependencias_lote([("W", "X"), ("X", "Y"), ("Y", "X"), ("Y", "Z")])
+    indice_ciclico = ciclico.construir_indice_alcanzabilidad()
+    assert indice_ciclico.depende_de("X", "X") and not indice_ciclico.depende_de("Z", "Z")
+    assert indice_ciclico.obtener_uso_memoria()["filas"] == 3
+    assert indice_ciclico.obtener_dependencias_transitivas("X") == ["X", "Y", "Z"]
+    assert indice_ciclico.obtener_dependencias_transitivas("Y") == ["X", "Y", "Z"]
+    assert indice_ciclico.cantidad_dependencias_transitivas("W") == 3
+    print(f" Índice de alcanzabilidad: {memoria['bytes_total']} bytes para {memoria['modulos']} módulos")
+    
+    # Caché de clausuras transitivas
+    grafo = crear_grafo_rombo()
+    cache = grafo.activar_cache(capacidad=8)
+    grafo.obtener_dependencias_transitivas("A")
+    grafo.obtener_dependencias_transitivas("A")
+    grafo.analisis_impacto("D")
+    grafo.agregar_modulo("E", "Módulo E")
+    grafo.agregar_dependencia("D", "E")  # Solo cambia la clausura de A
+    assert "E" in grafo.obtener_dependencias_transitivas("A")
+    assert sorted(grafo.analisis_impacto("D")) == ["A", "B", "C"]
+    assert cache.aciertos == 2 and cache.invalidaciones == 1
+    print(f" Caché de clausuras: {cache.obtener_estadisticas()}")
+    
+    # Reducción transitiva: A -> D ya está implicada por A -> B -> D
+    grafo = crear_grafo_rombo()
+    grafo.agregar_dependencia("A", "D")
+    assert grafo.reduccion_transitiva(aplicar=True) == [("A", "D")]
+    assert grafo.obtener_dependencias_directas("A") == ["B", "C"]
+    print(" Reducción transitiva: dependencia redundante A -> D eliminada")
+    
+    # Diferencia entre versiones: C pasa de depender de B a depender de A
+    anterior = GrafoDependencias()
+    nuevo = GrafoDependencias()
+    for version in (anterior, nuevo):
+        version.agregar_modulos_lote(["A", "B", "C"])
+    anterior.agregar_dependencias_lote([("A", "B"), ("B", "C")])
+    nuevo.agregar_dependencias_lote([("A", "B"), ("A", "C")])
+    diferencia = anterior.diferencia(nuevo)
+    assert diferencia.dependencias_agregadas == [("A", "C")]
+    assert diferencia.dependencias_eliminadas == [("B", "C")]
+    assert diferencia.alcance_directo_cambiado == ["B"]
+    assert diferencia.alcance_inverso_cambiado == ["C"]
+    print(f" Diferencia entre versiones: {diferencia.obtener_resumen()}")
+    
     print("\n TODAS LAS PRUEBAS DEL GRAFO PASARON\n")
 
 
@@ -107,17 +219,411 @@ def probar_grafo_con_ciclos():
         print(" Ordenamiento topológico no es posible (como se esperaba)")
         orden = grafo.ordenamiento_topologico()
         assert orden is None, "El ordenamiento debería ser None con ciclos"
+        orden, bloqueantes = grafo.ordenamiento_topologico_detallado()
+        print(f" Componentes que bloquean el orden: {bloqueantes}")
+        assert bloqueantes == [["A", "B", "C"]], "Debe reportar el ciclo A-B-C"
+        
+        # La condensación permite ordenar aunque existan ciclos
+        grafo.agregar_modulo("D", "Módulo D")
+        grafo.agregar_dependencia("D", "A")
+        condensacion = grafo.obtener_condensacion()
+        grupos = condensacion.ordenamiento_topologico()
+        print(f" Orden por componentes: {grupos}")
+        assert grupos == [["A", "B", "C"], ["D"]], "El ciclo debe compilarse antes que D"
+        assert sorted(condensacion.analisis_impacto("B")) == ["A", "B", "C", "D"]
     else:
         print(" ERROR: No se detectó el ciclo")
     
+    # Vistas sin copia: fuera del ciclo el subgrafo sí tiene orden topológico
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(["A", "B", "C", "D"])
+    grafo.agregar_dependencias_lote([("A", "B"), ("B", "C"), ("C", "A"), ("D", "A")])
+    vista = grafo.obtener_subgrafo(["A", "D"])
+    assert vista.ordenamiento_topologico() == ["A", "D"]
+    assert vista.detectar_ciclos() == (False, []) and vista.analisis_impacto("A") == ["D"]
+    vecindario = grafo.obtener_vecindario(["A"], 1, direccion="dependencias")
+    assert sorted(vecindario.modulos) == ["A", "B"]
+    grafo.agregar_dependencia("B", "A")  # La vista refleja el grafo base
+    assert vecindario.detectar_ciclos()[0] and vecindario.ordenamiento_topologico() is None
+    try:
+        vista.agregar_dependencia("D", "A")
+        assert False, "La vista debe ser de solo lectura"
+    except TypeError:
+        pass
+    print(f" Vecindario de A a un salto: {list(vecindario.modulos)}")
+    
+    # Análisis paralelo por componentes débilmente conexas (dos islas)
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(["A", "B", "C", "D", "X", "Y"])
+    grafo.agregar_dependencias_lote([("A", "B"), ("B", "C"), ("C", "A"), ("D", "A"), ("Y", "X")])
+    assert grafo.obtener_componentes_debiles() == [["A", "B", "C", "D"], ["X", "Y"]]
+    analisis = grafo.analisis_por_componentes(max_trabajadores=2)
+    assert analisis["componentes"] == 2 and analisis["orden"] is None
+    assert analisis["ciclos"] == grafo.detectar_ciclos()
+    assert analisis["estadisticas"] == grafo.obtener_estadisticas()
+    
+    # Con varios ciclos se conserva el orden de detectar_ciclos, aunque la
+    # componente de X (que contiene el ciclo W-V) empiece antes que la de Y-Z
+    islas = GrafoDependencias()
+    islas.agregar_modulos_lote(["X", "Y", "Z", "W", "V"])
+    islas.agregar_dependencias_lote([("Y", "Z"), ("Z", "Y"), ("W", "V"), ("V", "W"), ("W", "X")])
+    assert islas.detectar_ciclos() == (True, [["Y", "Z", "Y"], ["W", "V", "W"]])
+    for trabajadores in (1, 2):
+        analisis_islas = islas.analisis_por_componentes(max_trabajadores=trabajadores)
+        assert analisis_islas["ciclos"] == islas.detectar_ciclos()
+    print(f" Análisis por componentes: {analisis['estadisticas']}")
+    
+    # Modo acíclico: la dependencia que cierra el ciclo se rechaza al agregarla
+    grafo = GrafoDependencias()
+    for nombre in ["A", "B", "C"]:
+        grafo.agregar_modulo(nombre)
+    assert grafo.activar_modo_aciclico()
+    grafo.agregar_dependencia("A", "B")
+    grafo.agregar_dependencia("B", "C")
+    assert not grafo.agregar_dependencia("C", "A"), "Debe rechazar C → A"
+    print(f" Modo acíclico rechazó el ciclo: {' → '.join(grafo.ciclo_rechazado)}")
+    assert grafo.ordenamiento_topologico() == ["C", "B", "A"]
+    
+    # Cadena más profunda que el límite de recursión (los recorridos son iterativos)
+    profundidad = sys.getrecursionlimit() + 500
+    cadena = GrafoDependencias()
+    cadena.agregar_modulos_lote(range(profundidad))
+    cadena.agregar_dependencias_lote((indice, indice + 1) for indice in range(profundidad - 1))
+    assert len(cadena.obtener_dependencias_transitivas(0)) == profundidad - 1
+    assert len(cadena.analisis_impacto(profundidad - 1)) == profundidad - 1
+    assert cadena.detectar_ciclos() == (False, [])
+    cadena.agregar_dependencia(profundidad - 1, 0)
+    assert len(cadena.detectar_ciclos()[1][0]) == profundidad + 1
+    print(f" Cadena de {profundidad} módulos recorrida sin RecursionError")
+    
     print("\n PRUEBA DE CICLOS COMPLETADA\n")
 
 
+def probar_operaciones_lote():
+    """Prueba las operaciones por lotes cuando un elemento falla"""
+    print("="*60)
+    print("PRUEBA DE OPERACIONES POR LOTES")
+    print("="*60)
+    
+    # Un lote que falla a mitad de camino deja contabilizadas las aristas aplicadas
+    def lote_con_error():
+        yield ("A", "B")
+        yield ("B", "A")
+        raise ValueError("Fila mal formada")
+    
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(["A", "B"])
+    grafo.activar_cache()
+    assert grafo.obtener_dependencias_transitivas("A") == []
+    assert not grafo.detectar_ciclos()[0]
+    try:
+        grafo.agregar_dependencias_lote(lote_con_error())
+        assert False, "El error del lote debe propagarse"
+    except ValueError:
+        pass
+    stats = grafo.obtener_estadisticas()
+    assert stats["total_dependencias"] == 2 and stats["tiene_ciclos"]
+    assert grafo.obtener_dependencias_transitivas("A") == ["B", "A"]
+    try:
+        grafo.eliminar_dependencias_lote([("A", "B"), ("B",)])
+        assert False, "Una tupla incompleta debe fallar"
+    except ValueError:
+        pass
+    assert grafo.total_dependencias == 1 and not grafo.detectar_ciclos()[0]
+    print(" Lote interrumpido: contadores, ciclos y caché actualizados")
+    
+    # Un lote de módulos con un costo inválido no agrega ninguno
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(["A", "B"])
+    try:
+        grafo.agregar_modulos_lote([("C", "", 1.0), ("D", "", -1.0)])
+        assert False, "El costo negativo debe rechazarse"
+    except ValueError:
+        pass
+    assert list(grafo.modulos) == ["A", "B"]
+    print(" Lote con costo negativo: ningún módulo agregado")
+    
+    print("\n PRUEBA DE OPERACIONES POR LOTES COMPLETADA\n")
+
+
+def probar_persistencia():
+    """Prueba la instantánea binaria y los archivos de módulos y aristas"""
+    print("="*60)
+    print("PRUEBA DE PERSISTENCIA")
+    print("="*60)
+    
+    # Instantánea binaria (guardar y cargar con mmap)
+    grafo = crear_grafo_rombo()
+    orden = grafo.ordenamiento_topologico()
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "grafo.bin")
+        InstantaneaGrafo.guardar(grafo, ruta)
+        cargado = InstantaneaGrafo.cargar(ruta)
+        assert cargado.ordenamiento_topologico() == orden
+        assert cargado.analisis_impacto("D") == grafo.analisis_impacto("D")
+        assert cargado.obtener_estadisticas() == grafo.obtener_estadisticas()
+        assert list(cargado.costos) == [1.0, 1.0, 2.0, 1.0]
+        assert InstantaneaGrafo.cargar_grafo(ruta).modulos["C"].costo == 2.0
+        del cargado
+        
+        # Los nombres enteros conservan su tipo (y su orden numérico)
+        enteros = GrafoDependencias()
+        enteros.agregar_modulos_lote([1, 2, 10])
+        enteros.agregar_dependencias_lote([(2, 1), (10, 1)])
+        InstantaneaGrafo.guardar(enteros, ruta)
+        cargado = InstantaneaGrafo.cargar(ruta)
+        assert cargado.analisis_impacto(1) == enteros.analisis_impacto(1) == [2, 10]
+        assert cargado.ordenamiento_topologico() == enteros.ordenamiento_topologico()
+        assert "1" not in cargado.ids
+        assert list(InstantaneaGrafo.cargar_grafo(ruta).modulos) == [1, 2, 10]
+        del cargado
+        
+        otros = GrafoDependencias()
+        otros.agregar_modulo(("paquete", "modulo"))
+        try:
+            InstantaneaGrafo.guardar(otros, ruta)
+            assert False, "Un nombre que no es str ni int debe rechazarse"
+        except ValueError:
+            pass
+    print(" Instantánea binaria: guardada y cargada correctamente")
+    
+    # Exportar e importar listas de módulos y aristas (CSV y JSON Lines)
+    grafo = crear_grafo_rombo()
+    with tempfile.TemporaryDirectory() as carpeta:
+        for formato in ("csv", "jsonl"):
+            ruta_modulos = os.path.join(carpeta, f"modulos.{formato}")
+            ruta_aristas = os.path.join(carpeta, f"aristas.{formato}")
+            ArchivosGrafo.exportar(grafo, ruta_modulos, ruta_aristas, formato)
+            importado = GrafoDependencias()
+            resumen = ArchivosGrafo.importar(importado, ruta_modulos, ruta_aristas, formato, tamano_lote=2)
+            assert resumen["modulos_agregados"] == 4 and resumen["dependencias_agregadas"] == 4
+            assert list(importado.modulos) == list(grafo.modulos)
+            assert list(ArchivosGrafo.generar_aristas(importado)) == list(ArchivosGrafo.generar_aristas(grafo))
+            assert importado.modulos["C"].costo == 2.0
+        
+        # Archivos sin encabezado, con un módulo y una arista repetidos
+        ruta_modulos = os.path.join(carpeta, "sin_encabezado_modulos.csv")
+        ruta_aristas = os.path.join(carpeta, "sin_encabezado_aristas.csv")
+        with open(ruta_modulos, "w", encoding="utf-8") as archivo:
+            archivo.write("X,Módulo X\nY\nX\n")
+        with open(ruta_aristas, "w", encoding="utf-8") as archivo:
+            archivo.write("X,Y\nX,Y\nY,Z\n")
+        importado = GrafoDependencias()
+        resumen = ArchivosGrafo.importar(importado, ruta_modulos, ruta_aristas)
+        assert resumen == {
+            "modulos_agregados": 2, "modulos_rechazados": 1,
+            "dependencias_agregadas": 1, "dependencias_rechazadas": 2
+        }
+    print(" Archivos CSV y JSON Lines: exportados e importados correctamente")
+    
+    print("\n PRUEBA DE PERSISTENCIA COMPLETADA\n")
+
+
+def probar_diario():
+    """Prueba la recuperación del grafo desde el diario de modificaciones"""
+    print("="*60)
+    print("PRUEBA DEL DIARIO DE MODIFICACIONES")
+    print("="*60)
+    
+    # Diario de modificaciones: recuperar tras una caída (sin cerrar el diario)
+    with tempfile.TemporaryDirectory() as carpeta:
+        diario = DiarioGrafo(carpeta)
+        diario.grafo.agregar_modulos_lote(["X", "Y", "Z"])
+        diario.grafo.agregar_dependencia("X", "Y")
+        diario.grafo.establecer_costo("X", 3.0)
+        diario.compactar()
+        diario.grafo.agregar_dependencia("Y", "Z")
+        diario.grafo.establecer_costo("Z", 4.0)
+        diario.sincronizar()
+        recuperado = DiarioGrafo(carpeta)
+        assert recuperado.grafo.ordenamiento_topologico() == ["Z", "Y", "X"]
+        assert recuperado.grafo.modulos["Z"].costo == 4.0 and recuperado.recuperados == 2
+        assert recuperado.grafo.modulos["X"].costo == 3.0
+        recuperado.cerrar()
+        diario.cerrar()
+    print(" Diario: grafo recuperado desde la instantánea y el diario")
+    
+    # Diario: un lote interrumpido registra las aristas que llegó a aplicar
+    with tempfile.TemporaryDirectory() as carpeta:
+        diario = DiarioGrafo(carpeta)
+        diario.grafo.agregar_modulos_lote(["X", "Y", "Z"])
+        try:
+            diario.grafo.agregar_dependencias_lote([("X", "Y"), ("Y", "Z"), ("Z",)])
+            assert False, "Una tupla incompleta debe fallar"
+        except ValueError:
+            pass
+        diario.sincronizar()
+        recuperado = DiarioGrafo(carpeta)
+        assert recuperado.grafo.ordenamiento_topologico() == ["Z", "Y", "X"]
+        assert recuperado.grafo.total_dependencias == 2
+        recuperado.cerrar()
+        diario.cerrar()
+    print(" Diario: lote interrumpido recuperado con las aristas aplicadas")
+    
+    # Diario: nombres no textuales a través de la compactación y la recuperación
+    with tempfile.TemporaryDirectory() as carpeta:
+        diario = DiarioGrafo(carpeta)
+        diario.grafo.agregar_modulos_lote([0, 1, 2])
+        diario.grafo.agregar_dependencia(0, 1)
+        diario.compactar()
+        diario.grafo.agregar_dependencia(1, 2)
+        diario.grafo.establecer_costo(2, 5.0)
+        diario.cerrar()
+        recuperado = DiarioGrafo(carpeta)
+        assert list(recuperado.grafo.modulos) == [0, 1, 2]
+        assert recuperado.grafo.total_dependencias == 2
+        assert recuperado.grafo.modulos[2].costo == 5.0
+        recuperado.cerrar()
+        
+        # Un registro que no puede reproducirse aborta la recuperación
+        with open(os.path.join(carpeta, "diario.log"), "ab") as archivo:
+            archivo.write(DiarioGrafo._codificar(["agregar_dependencia", 7, 8]))
+        try:
+            DiarioGrafo(carpeta)
+            assert False, "La recuperación debe fallar si un registro no se aplica"
+        except ValueError:
+            pass
+    print(" Diario: nombres enteros recuperados tras compactar")
+    
+    print("\n PRUEBA DEL DIARIO COMPLETADA\n")
+
+
+def probar_grafo_concurrente():
+    """Prueba el modo concurrente y las versiones con copia en escritura"""
+    print("="*60)
+    print("PRUEBA DEL GRAFO CONCURRENTE")
+    print("="*60)
+    
+    concurrente = GrafoConcurrente()
+    concurrente.agregar_modulos_lote(["A", "B", "C"])
+    concurrente.agregar_dependencia("A", "B")
+    version = concurrente.instantanea()
+    
+    # Un escritor en otro hilo no cambia la versión ya tomada
+    escritor = threading.Thread(target=concurrente.agregar_dependencia, args=("B", "C"))
+    escritor.start()
+    escritor.join()
+    
+    assert version.ordenamiento_topologico() == ["B", "A", "C"]
+    assert concurrente.ordenamiento_topologico() == ["C", "B", "A"]
+    assert version.analisis_impacto("C") == [] and concurrente.analisis_impacto("C") == ["B", "A"]
+    print(f" Versión {version.version}: {version.obtener_estadisticas()['total_dependencias']} "
+          f"dependencias; grafo actual: {concurrente.obtener_estadisticas()['total_dependencias']}")
+    
+    try:
+        version.agregar_dependencia("C", "A")
+        print(" ERROR: La versión aceptó una modificación")
+    except TypeError:
+        print(" La versión es de solo lectura")
+    
+    
+    # Lectores en varios hilos mientras un escritor agrega y elimina aristas
+    concurrente = GrafoConcurrente()
+    nombres = [f"m{indice}" for indice in range(30)]
+    concurrente.agregar_modulos_lote(nombres)
+    concurrente.agregar_dependencias_lote(zip(nombres, nombres[1:]))
+    inicial = concurrente.instantanea()
+    esperado = (inicial.ordenamiento_topologico(), inicial.analisis_impacto("m29"))
+    terminado = threading.Event()
+    errores = []
+    
+    def escribir():
+        try:
+            for paso in range(300):
+                # Una arista que se queda y otra de la cadena que se quita y se repone
+                concurrente.agregar_dependencia(nombres[paso % 20], nombres[21 + paso % 9])
+                eslabon = (nombres[paso % 29], nombres[paso % 29 + 1])
+                concurrente.eliminar_dependencias_lote([eslabon])
+                time.sleep(0)
+                concurrente.agregar_dependencia(*eslabon)
+        except Exception as error:
+            errores.append(error)
+        finally:
+            terminado.set()
+    
+    def leer():
+        try:
+            while not terminado.is_set():
+                version = concurrente.instantanea()
+                primera = (version.ordenamiento_topologico(), version.analisis_impacto("m29"),
+                           version.detectar_ciclos())
+                assert version.total_dependencias == sum(
+                    len(deps) for deps in version.dependencias.values()
+                )
+                assert primera == (version.ordenamiento_topologico(), version.analisis_impacto("m29"),
+                                   version.detectar_ciclos())
+                with concurrente.lectura() as grafo:
+                    assert grafo.total_dependencias == sum(
+                        len(deps) for deps in grafo.dependencias.values()
+                    )
+                assert (inicial.ordenamiento_topologico(), inicial.analisis_impacto("m29")) == esperado
+        except Exception as error:
+            errores.append(error)
+    
+    hilos = [threading.Thread(target=leer) for _ in range(4)]
+    hilos.append(threading.Thread(target=escribir))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert not errores, errores
+    assert concurrente.obtener_estadisticas()["total_dependencias"] > 29
+    assert inicial.total_dependencias == sum(len(deps) for deps in inicial.dependencias.values()) == 29
+    assert (inicial.ordenamiento_topologico(), inicial.analisis_impacto("m29")) == esperado
+    print(" Lectores concurrentes: cada versión respondió igual durante las escrituras")
+    
+    print("\n PRUEBA DEL GRAFO CONCURRENTE COMPLETADA\n")
+
+
+def probar_ejecutor_compilacion():
+    """Prueba la compilación paralela con un módulo fallido y un ciclo"""
+    print("="*60)
+    print("PRUEBA DEL EJECUTOR DE COMPILACIÓN")
+    print("="*60)
+    
+    grafo = GrafoDependencias()
+    grafo.agregar_modulos_lote(["base", "util", "app", "falla", "cliente", "final", "x", "y", "z"])
+    grafo.agregar_dependencias_lote([
+        ("util", "base"), ("app", "util"),
+        ("cliente", "falla"), ("final", "cliente"), ("final", "util"),
+        ("x", "y"), ("y", "x"), ("z", "x")
+    ])
+    
+    def compilar(modulo):
+        time.sleep(0.01)
+        if modulo == "falla":
+            raise RuntimeError("Error de compilación")
+        return modulo.upper()
+    
+    reporte = EjecutorCompilacion(grafo, max_trabajadores=3).ejecutar(compilar)
+    assert reporte["exitosos"] == ["app", "base", "util"]
+    assert reporte["fallidos"] == ["falla"]
+    assert reporte["omitidos"] == ["cliente", "final"]
+    assert reporte["bloqueados"] == ["x", "y", "z"]
+    assert reporte["modulos"]["final"]["causa"] == "falla"
+    assert "eficiencia_paralela" in reporte
+    
+    # Ningún módulo termina antes que sus dependencias
+    posicion = {modulo: indice for indice, modulo in enumerate(reporte["orden_finalizacion"])}
+    for modulo in reporte["orden_finalizacion"]:
+        for dependencia in grafo.obtener_dependencias_directas(modulo):
+            assert posicion[dependencia] < posicion[modulo]
+    print(f" Orden de finalización: {reporte['orden_finalizacion']}")
+    print(f" Omitidos: {reporte['omitidos']}  Bloqueados: {reporte['bloqueados']}")
+    
+    print("\n PRUEBA DEL EJECUTOR DE COMPILACIÓN COMPLETADA\n")
+
+
 if __name__ == "__main__":
     try:
         probar_arbol()
         probar_grafo()
         probar_grafo_con_ciclos()
+        probar_operaciones_lote()
+        probar_persistencia()
+        probar_diario()
+        probar_grafo_concurrente()
+        probar_ejecutor_compilacion()
         
         print("="*60)
         print(" TODAS LAS PRUEBAS PASARON EXITOSAMENTE")
@@ -0,0 +1,284 @@
+# ArchivosGrafo.py
+"""Módulo para importar y exportar el grafo de dependencias como listas de módulos y de aristas.
+   Soporta CSV y JSON Lines. Los lectores y escritores trabajan con generadores y E/S con búfer,
+   por lo que procesan archivos de cualquier tamaño con memoria constante.
+"""
+import csv
+import json
+from itertools import islice
+
+# Tamaño del búfer de lectura/escritura de archivos (1 MiB)
+TAMANO_BUFER = 1 << 20
+
+# Encabezados de los archivos CSV (y claves de los objetos JSON Lines)
+ENCABEZADO_MODULOS = ["nombre", "descripcion", "costo"]
+ENCABEZADO_ARISTAS = ["origen", "destino"]
+
+
+# Clase ArchivosGrafo con métodos estáticos para leer y escribir archivos del grafo
+class ArchivosGrafo:
+    ### Método para leer módulos desde un archivo CSV
+    @staticmethod
+    def leer_modulos_csv(ruta):
+        """
+        Lee módulos de un CSV con columnas nombre,descripcion,costo (encabezado
+        opcional; descripcion y costo también lo son)
+        
+        Args:
+            ruta (str): Ruta del archivo
+        
+        Yields:
+            tuple: (nombre, descripcion, costo)
+        """
+        with open(ruta, "r", newline="", encoding="utf-8", buffering=TAMANO_BUFER) as archivo:
+            for fila in ArchivosGrafo._filas_csv(archivo, ENCABEZADO_MODULOS):
+                yield (
+                    fila[0],
+                    fila[1] if len(fila) > 1 else "",
+                    float(fila[2]) if len(fila) > 2 and fila[2] else 1.0
+                )
+    
+    ### Método para leer aristas desde un archivo CSV
+    @staticmethod
+    def leer_aristas_csv(ruta):
+        """
+        Lee dependencias de un CSV con columnas origen,destino (encabezado opcional)
+        
+        Args:
+            ruta (str): Ruta del archivo
+        
+        Yields:
+            tuple: (modulo_origen, modulo_destino)
+        """
+        with open(ruta, "r", newline="", encoding="utf-8", buffering=TAMANO_BUFER) as archivo:
+            for fila in ArchivosGrafo._filas_csv(archivo, ENCABEZADO_ARISTAS):
+                yield (fila[0], fila[1])
+    
+    ### Método para leer módulos desde un archivo JSON Lines
+    @staticmethod
+    def leer_modulos_jsonl(ruta):
+        """
+        Lee módulos de un archivo JSON Lines ({"nombre": ..., "descripcion": ...,
+        "costo": ...}; descripcion y costo son opcionales)
+        
+        Args:
+            ruta (str): Ruta del archivo
+        
+        Yields:
+            tuple: (nombre, descripcion, costo)
+        """
+        for registro in ArchivosGrafo._registros_jsonl(ruta):
+            yield (registro["nombre"], registro.get("descripcion", ""), registro.get("costo", 1.0))
+    
+    ### Método para leer aristas desde un archivo JSON Lines
+    @staticmethod
+    def leer_aristas_jsonl(ruta):
+        """
+        Lee dependencias de un archivo JSON Lines ({"origen": ..., "destino": ...})
+        
+        Args:
+            ruta (str): Ruta del archivo
+        
+        Yields:
+            tuple: (modulo_origen, modulo_destino)
+        """
+        for registro in ArchivosGrafo._registros_jsonl(ruta):
+            yield (registro["origen"], registro["destino"])
+    
+    ### Método para generar los módulos del grafo en orden determinista
+    @staticmethod
+    def generar_modulos(grafo):
+        """
+        Recorre los módulos del grafo en orden de inserción
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a recorrer
+        
+        Yields:
+            tuple: (nombre, descripcion, costo)
+        """
+        for nombre, modulo in grafo.modulos.items():
+            yield (nombre, modulo.descripcion, modulo.costo)
+    
+    ### Método para generar las aristas del grafo en orden determinista
+    @staticmethod
+    def generar_aristas(grafo):
+        """
+        Recorre las dependencias del grafo: módulos en orden de inserción y, para
+        cada uno, sus dependencias en el orden en que se agregaron
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a recorrer
+        
+        Yields:
+            tuple: (modulo_origen, modulo_destino)
+        """
+        for origen, deps in grafo.dependencias.items():
+            for destino in deps:
+                yield (origen, destino)
+    
+    ### Método para escribir filas en un archivo CSV
+    @staticmethod
+    def escribir_csv(filas, ruta, encabezado):
+        """
+        Escribe filas en un CSV fila por fila
+        
+        Args:
+            filas (iterable): Tuplas a escribir (por ejemplo, de generar_aristas)
+            ruta (str): Ruta del archivo
+            encabezado (list): Encabezado (ENCABEZADO_MODULOS o ENCABEZADO_ARISTAS)
+        
+        Returns:
+            int: Cantidad de filas escritas (sin contar el encabezado)
+        """
+        cantidad = 0
+        
+        with open(ruta, "w", newline="", encoding="utf-8", buffering=TAMANO_BUFER) as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(encabezado)
+            for fila in filas:
+                escritor.writerow(fila)
+                cantidad += 1
+        
+        return cantidad
+    
+    ### Método para escribir filas en un archivo JSON Lines
+    @staticmethod
+    def escribir_jsonl(filas, ruta, encabezado):
+        """
+        Escribe filas en un archivo JSON Lines, un objeto por línea
+        
+        Args:
+            filas (iterable): Tuplas a escribir
+            ruta (str): Ruta del archivo
+            encabezado (list): Claves de cada objeto (ENCABEZADO_MODULOS o ENCABEZADO_ARISTAS)
+        
+        Returns:
+            int: Cantidad de líneas escritas
+        """
+        cantidad = 0
+        
+        with open(ruta, "w", encoding="utf-8", buffering=TAMANO_BUFER) as archivo:
+            for fila in filas:
+                archivo.write(json.dumps(dict(zip(encabezado, fila)), ensure_ascii=False))
+                archivo.write("\n")
+                cantidad += 1
+        
+        return cantidad
+    
+    ### Método para exportar el grafo completo
+    @staticmethod
+    def exportar(grafo, ruta_modulos, ruta_aristas, formato="csv"):
+        """
+        Exporta los módulos y las dependencias del grafo sin armar la salida en memoria
+        
+        Args:
+            grafo (GrafoDependencias): Grafo a exportar
+            ruta_modulos (str): Archivo de módulos
+            ruta_aristas (str): Archivo de dependencias
+            formato (str): "csv" o "jsonl"
+        
+        Returns:
+            dict: Cantidad de módulos y de dependencias escritos
+        """
+        escribir = ArchivosGrafo._escritor(formato)
+        
+        return {
+            "modulos": escribir(ArchivosGrafo.generar_modulos(grafo), ruta_modulos, ENCABEZADO_MODULOS),
+            "dependencias": escribir(ArchivosGrafo.generar_aristas(grafo), ruta_aristas, ENCABEZADO_ARISTAS)
+        }
+    
+    ### Método para importar un grafo usando la inserción por lotes
+    @staticmethod
+    def importar(grafo, ruta_modulos, ruta_aristas, formato="csv", tamano_lote=10000):
+        """
+        Importa módulos y dependencias alimentando las operaciones por lotes del
+        grafo en bloques de tamano_lote, de modo que nunca se carga el archivo
+        completo en memoria
+        
+        Args:
+            grafo (GrafoDependencias): Grafo destino
+            ruta_modulos (str): Archivo de módulos (None para omitirlo)
+            ruta_aristas (str): Archivo de dependencias (None para omitirlo)
+            formato (str): "csv" o "jsonl"
+            tamano_lote (int): Cantidad de elementos por bloque
+        
+        Returns:
+            dict: Totales de módulos y dependencias agregados y rechazados
+        """
+        if formato == "csv":
+            leer_modulos, leer_aristas = ArchivosGrafo.leer_modulos_csv, ArchivosGrafo.leer_aristas_csv
+        elif formato == "jsonl":
+            leer_modulos, leer_aristas = ArchivosGrafo.leer_modulos_jsonl, ArchivosGrafo.leer_aristas_jsonl
+        else:
+            raise ValueError(f"Formato no soportado: {formato}")
+        
+        resumen = {
+            "modulos_agregados": 0,
+            "modulos_rechazados": 0,
+            "dependencias_agregadas": 0,
+            "dependencias_rechazadas": 0
+        }
+        
+        if ruta_modulos is not None:
+            for lote in ArchivosGrafo._lotes(leer_modulos(ruta_modulos), tamano_lote):
+                reporte = grafo.agregar_modulos_lote(lote)
+                resumen["modulos_agregados"] += reporte["exitosos"]
+                resumen["modulos_rechazados"] += reporte["fallidos"]
+        
+        if ruta_aristas is not None:
+            for lote in ArchivosGrafo._lotes(leer_aristas(ruta_aristas), tamano_lote):
+                reporte = grafo.agregar_dependencias_lote(lote)
+                resumen["dependencias_agregadas"] += reporte["exitosos"]
+                resumen["dependencias_rechazadas"] += reporte["fallidos"]
+        
+        return resumen
+    
+    ### Métodos auxiliares
+    @staticmethod
+    def _filas_csv(archivo, encabezado):
+        """
+        Recorre las filas no vacías de un CSV saltando el encabezado si existe.
+        Se acepta como encabezado un prefijo de dos o más columnas, para leer
+        archivos de módulos sin la columna de costo.
+        """
+        lector = csv.reader(archivo)
+        primera = True
+        
+        for fila in lector:
+            if not fila:
+                continue
+            if primera:
+                primera = False
+                columnas = [columna.strip().lower() for columna in fila]
+                if len(columnas) >= 2 and columnas == encabezado[:len(columnas)]:
+                    continue
+            yield fila
+    
+    @staticmethod
+    def _registros_jsonl(ruta):
+        """Recorre los objetos de un archivo JSON Lines ignorando líneas vacías"""
+        with open(ruta, "r", encoding="utf-8", buffering=TAMANO_BUFER) as archivo:
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+    
+    @staticmethod
+    def _escritor(formato):
+        """Retorna el método de escritura para el formato indicado"""
+        if formato == "csv":
+            return ArchivosGrafo.escribir_csv
+        if formato == "jsonl":
+            return ArchivosGrafo.escribir_jsonl
+        raise ValueError(f"Formato no soportado: {formato}")
+    
+    @staticmethod
+    def _lotes(elementos, tamano_lote):
+        """Agrupa un iterable en listas de a lo sumo tamano_lote elementos"""
+        iterador = iter(elementos)
+        
+        while True:
+            lote = list(islice(iterador, tamano_lote))
+            if not lote:
+                return
+            yield lote
@@ -0,0 +1,347 @@
+# DiarioGrafo.py
+"""Módulo que implementa un diario de escritura anticipada (write-ahead log) para el grafo de dependencias.
+   Cada modificación aplicada al grafo se agrega como una línea al final del diario. Las líneas se
+   escriben en grupo con un solo fsync (group commit) y, al abrir la carpeta, se reproducen sobre la
+   última instantánea binaria. Al compactar se guarda una instantánea nueva y el diario vuelve a empezar.
+   
+   Archivos de la carpeta:
+     diario.log            líneas "crc32 json"; la primera es ["generacion", n]
+     instantanea-<n>.bin   instantánea (InstantaneaGrafo) de la generación n (n > 0)
+"""
+import json
+import os
+import threading
+import zlib
+
+from models.Grafo import GrafoDependencias
+from utils.InstantaneaGrafo import InstantaneaGrafo
+
+ARCHIVO_DIARIO = "diario.log"
+PREFIJO_INSTANTANEA = "instantanea-"
+EXTENSION_INSTANTANEA = ".bin"
+
+# Operaciones del grafo que se registran y pueden reproducirse
+OPERACIONES = frozenset({
+    "agregar_modulo",
+    "agregar_dependencia",
+    "eliminar_dependencia",
+    "eliminar_modulo",
+    "establecer_costo",
+    "agregar_modulos_lote",
+    "agregar_dependencias_lote",
+    "eliminar_dependencias_lote",
+})
+# Operaciones cuyo argumento es una lista de tuplas
+LOTES = frozenset({"agregar_modulos_lote", "agregar_dependencias_lote", "eliminar_dependencias_lote"})
+
+
+class DiarioGrafo:
+    """Clase que registra las modificaciones de un grafo y lo recupera tras una caída"""
+    
+    def __init__(self, carpeta, tamano_lote=256, retraso_maximo=0.05, umbral_compactacion=100000):
+        """
+        Abre (o crea) el diario de la carpeta, recupera el grafo a partir de la
+        última instantánea y del diario, y empieza a registrar sus modificaciones
+        
+        Los registros se confirman (write + fsync) cuando se juntan tamano_lote,
+        cuando pasan retraso_maximo segundos desde el primero pendiente o al
+        llamar a sincronizar(); una caída puede perder solo los no confirmados.
+        
+        Args:
+            carpeta (str): Carpeta del diario y las instantáneas
+            tamano_lote (int): Registros pendientes que fuerzan una confirmación
+            retraso_maximo (float): Segundos máximos que un registro espera confirmación
+            umbral_compactacion (int): Registros en el diario que disparan una
+                                       compactación (None = solo manual)
+        """
+        self.carpeta = carpeta
+        self.tamano_lote = tamano_lote
+        self.retraso_maximo = retraso_maximo
+        self.umbral_compactacion = umbral_compactacion
+        # Estadísticas
+        self.registros = 0        # Registros en el diario actual (sin el encabezado)
+        self.confirmaciones = 0   # Cantidad de fsync de confirmación
+        self.compactaciones = 0
+        self.recuperados = 0      # Registros reproducidos al abrir
+        self.descartados = 0      # Bytes de una última línea incompleta o dañada
+        
+        os.makedirs(carpeta, exist_ok=True)
+        self.generacion = 0
+        self.grafo = self._recuperar()
+        self._archivo = open(self._ruta_diario(), "ab")
+        
+        # Registros codificados aún no confirmados
+        self._pendientes = []
+        self._condicion = threading.Condition()
+        # Se toma antes de sacar los pendientes para que se escriban en orden
+        self._bloqueo_archivo = threading.Lock()
+        self._cerrado = False
+        self._hilo = threading.Thread(target=self._confirmar_periodicamente, daemon=True)
+        self._hilo.start()
+        
+        self.grafo.diario = self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+    
+    def registrar(self, operacion, *argumentos):
+        """
+        Agrega una modificación al diario. Lo llama el grafo después de aplicarla.
+        
+        Args:
+            operacion (str): Nombre del método del grafo (ver OPERACIONES)
+            *argumentos: Argumentos con los que se aplicó
+        """
+        linea = self._codificar([operacion, *argumentos])
+        
+        with self._condicion:
+            self._pendientes.append(linea)
+            self.registros += 1
+            lleno = len(self._pendientes) >= self.tamano_lote
+            if len(self._pendientes) == 1:
+                self._condicion.notify()
+        
+        if lleno:
+            self._confirmar()
+        
+        if self.umbral_compactacion is not None and self.registros >= self.umbral_compactacion:
+            self.compactar()
+    
+    def sincronizar(self):
+        """Confirma en disco todos los registros pendientes"""
+        self._confirmar()
+    
+    def compactar(self):
+        """
+        Guarda una instantánea del grafo y reinicia el diario en una generación
+        nueva. El diario nuevo reemplaza al anterior con un renombrado atómico,
+        así que una caída en medio deja la generación anterior intacta. No debe
+        modificarse el grafo mientras se compacta.
+        
+        Returns:
+            int: Generación nueva
+        """
+        with self._bloqueo_archivo:
+            self._escribir_pendientes()
+            
+            nueva = self.generacion + 1
+            InstantaneaGrafo.guardar(self.grafo, self._ruta_instantanea(nueva))
+            
+            temporal = self._ruta_diario() + ".tmp"
+            with open(temporal, "wb") as archivo:
+                archivo.write(self._codificar(["generacion", nueva]))
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            
+            self._archivo.close()
+            os.replace(temporal, self._ruta_diario())
+            self._sincronizar_carpeta()
+            self._archivo = open(self._ruta_diario(), "ab")
+            
+            anterior = self._ruta_instantanea(self.generacion)
+            if self.generacion > 0 and os.path.exists(anterior):
+                os.remove(anterior)
+            
+            self.generacion = nueva
+            self.registros = 0
+            self.compactaciones += 1
+        
+        return nueva
+    
+    def cerrar(self):
+        """Confirma los registros pendientes, detiene el hilo y deja de registrar"""
+        if self._cerrado:
+            return
+        
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+        
+        self._confirmar()
+        self._archivo.close()
+        if self.grafo.diario is self:
+            self.grafo.diario = None
+    
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del diario
+        
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        return {
+            "generacion": self.generacion,
+            "registros": self.registros,
+            "pendientes": len(self._pendientes),
+            "confirmaciones": self.confirmaciones,
+            "compactaciones": self.compactaciones,
+            "recuperados": self.recuperados,
+            "bytes_descartados": self.descartados
+        }
+    
+    def _recuperar(self):
+        """
+        Carga la instantánea de la generación indicada por el diario y reproduce
+        sus registros. Una última línea incompleta o con CRC inválido (escritura
+        interrumpida) se descarta y se trunca el archivo.
+        
+        Returns:
+            GrafoDependencias: Grafo recuperado
+        
+        Raises:
+            ValueError: Si el diario existe pero su encabezado está dañado o
+                        algún registro no puede reproducirse
+        """
+        ruta = self._ruta_diario()
+        registros = []
+        valido = 0
+        
+        if os.path.exists(ruta):
+            with open(ruta, "rb") as archivo:
+                for linea in archivo:
+                    registro = self._decodificar(linea)
+                    if registro is None:
+                        break
+                    registros.append(registro)
+                    valido += len(linea)
+                self.descartados = archivo.seek(0, os.SEEK_END) - valido
+        
+        if registros and registros[0][0] == "generacion":
+            self.generacion = registros[0][1]
+            registros = registros[1:]
+        elif valido == 0 and not self.descartados:
+            # Diario nuevo: generación 0, grafo vacío
+            self._crear_diario()
+        else:
+            raise ValueError("El diario no comienza con un encabezado de generación válido")
+        
+        if self.generacion > 0:
+            grafo = InstantaneaGrafo.cargar_grafo(self._ruta_instantanea(self.generacion))
+        else:
+            grafo = GrafoDependencias()
+        
+        # Cada registro se aplicó con éxito al escribirse: si al reproducirlo no
+        # se aplica, el grafo recuperado sería distinto y se aborta
+        for numero, (operacion, *argumentos) in enumerate(registros, 1):
+            if operacion in LOTES:
+                argumentos = [[tuple(elemento) for elemento in argumentos[0]]]
+            resultado = getattr(grafo, operacion)(*argumentos)
+            if operacion in LOTES:
+                aplicado = resultado["exitosos"] == len(argumentos[0])
+            else:
+                aplicado = resultado is True
+            if not aplicado:
+                raise ValueError(
+                    f"El registro {numero} del diario ({operacion} {argumentos!r}) "
+                    f"no pudo reproducirse sobre la generación {self.generacion}"
+                )
+        
+        if self.descartados:
+            os.truncate(ruta, valido)
+        
+        self.recuperados = len(registros)
+        self.registros = len(registros)
+        self._limpiar_carpeta()
+        
+        return grafo
+    
+    def _crear_diario(self):
+        """Crea un diario vacío de generación 0"""
+        with open(self._ruta_diario(), "wb") as archivo:
+            archivo.write(self._codificar(["generacion", 0]))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        self._sincronizar_carpeta()
+    
+    def _limpiar_carpeta(self):
+        """Elimina archivos temporales e instantáneas de otras generaciones"""
+        vigente = os.path.basename(self._ruta_instantanea(self.generacion))
+        
+        for nombre in os.listdir(self.carpeta):
+            obsoleta = (
+                nombre.startswith(PREFIJO_INSTANTANEA) and nombre != vigente
+                and nombre.endswith((EXTENSION_INSTANTANEA, ".tmp"))
+            )
+            if obsoleta or nombre == ARCHIVO_DIARIO + ".tmp":
+                os.remove(os.path.join(self.carpeta, nombre))
+    
+    def _confirmar_periodicamente(self):
+        """Hilo que confirma los registros que esperan más de retraso_maximo"""
+        while True:
+            with self._condicion:
+                while not self._pendientes and not self._cerrado:
+                    self._condicion.wait()
+                if self._cerrado:
+                    return
+                # Esperar a que se junten más registros en el mismo fsync
+                self._condicion.wait(self.retraso_maximo)
+            self._confirmar()
+    
+    def _confirmar(self):
+        """Escribe y sincroniza los registros pendientes"""
+        with self._bloqueo_archivo:
+            self._escribir_pendientes()
+    
+    def _escribir_pendientes(self):
+        """Escribe los pendientes con un solo write + fsync (requiere _bloqueo_archivo)"""
+        with self._condicion:
+            lineas = self._pendientes
+            self._pendientes = []
+        
+        if not lineas:
+            return
+        
+        self._archivo.write(b"".join(lineas))
+        self._archivo.flush()
+        os.fsync(self._archivo.fileno())
+        self.confirmaciones += 1
+    
+    def _sincronizar_carpeta(self):
+        """Sincroniza la carpeta para que los renombrados sean persistentes"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        descriptor = os.open(self.carpeta, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+    
+    def _ruta_diario(self):
+        return os.path.join(self.carpeta, ARCHIVO_DIARIO)
+    
+    def _ruta_instantanea(self, generacion):
+        return os.path.join(self.carpeta, f"{PREFIJO_INSTANTANEA}{generacion}{EXTENSION_INSTANTANEA}")
+    
+    @staticmethod
+    def _codificar(registro):
+        """Codifica un registro como línea "crc32 json" en UTF-8"""
+        datos = json.dumps(registro, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"%08x %s\n" % (zlib.crc32(datos), datos)
+    
+    @staticmethod
+    def _decodificar(linea):
+        """
+        Decodifica una línea del diario
+        
+        Returns:
+            list: Registro [operacion, *argumentos], o None si la línea está
+                  incompleta, dañada o contiene una operación desconocida
+        """
+        if not linea.endswith(b"\n") or len(linea) < 10:
+            return None
+        
+        datos = linea[9:-1]
+        try:
+            if int(linea[:8], 16) != zlib.crc32(datos):
+                return None
+            registro = json.loads(datos)
+        except ValueError:
+            return None
+        
+        if not registro or (registro[0] not in OPERACIONES and registro[0] != "generacion"):
+            return None
+        return registro
@@ -0,0 +1,369 @@
+# InstantaneaGrafo.py
+"""Módulo para guardar y cargar instantáneas binarias del grafo de dependencias.
+   El archivo contiene la tabla de nombres, las descripciones, los costos y los arreglos
+   CSR de aristas directas e inversas. Al cargarlo con mmap las tablas se usan directamente
+   desde el archivo, así que las primeras consultas se responden sin leerlo completo.
+   
+   Formato (versión 3, little-endian):
+     encabezado: firma b"GDEP", versión (uint16), reservado (uint16),
+                 cantidad de módulos (uint64), cantidad de aristas (uint64) y,
+                 por cada sección, desplazamiento y longitud en bytes (uint64)
+     secciones (alineadas a 8 bytes, en el orden de SECCIONES)
+   
+   Cada versión agrega secciones al final de las anteriores, así que se siguen
+   leyendo las instantáneas de versiones previas (versión 1: sin costos; versiones 1
+   y 2: sin tipos de nombre, todos los nombres son texto).
+   
+   Los nombres de módulo pueden ser str o int: se guardan como texto junto con una
+   etiqueta de tipo por módulo (NOMBRE_TEXTO o NOMBRE_ENTERO).
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from models.Grafo import GrafoDependencias
+from models.GrafoCompacto import GrafoCompacto
+
+FIRMA = b"GDEP"
+VERSION = 3
+
+# Secciones del archivo y tipo de elemento de cada una (None = bytes UTF-8)
+SECCIONES = (
+    ("nombres_desplazamientos", "q"),
+    ("nombres_datos", None),
+    ("descripciones_desplazamientos", "q"),
+    ("descripciones_datos", None),
+    ("desplazamientos", "q"),
+    ("destinos", "i"),
+    ("desplazamientos_inv", "q"),
+    ("origenes", "i"),
+    ("rango", "i"),
+    ("por_rango", "i"),
+    ("costos", "d"),
+    ("nombres_tipos", "b"),
+)
+# Cantidad de secciones de cada versión del formato
+SECCIONES_POR_VERSION = {1: 10, 2: 11, 3: 12}
+
+# Etiquetas de tipo de los nombres de módulo
+NOMBRE_TEXTO = 0
+NOMBRE_ENTERO = 1
+
+FORMATO_ENCABEZADO = "<4sHHQQ" + "QQ" * len(SECCIONES)
+TAMANO_ENCABEZADO = struct.calcsize(FORMATO_ENCABEZADO)
+FORMATO_FIRMA = "<4sH"
+
+
+# Secuencia de textos que se decodifican solo al accederlos
+class _TablaTextos:
+    """Tabla de solo lectura identificador -> texto sobre bytes UTF-8 concatenados"""
+    
+    def __init__(self, desplazamientos, datos):
+        self.desplazamientos = desplazamientos
+        self.datos = datos
+    
+    def __len__(self):
+        return len(self.desplazamientos) - 1
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fuera de rango")
+        return str(self.datos[self.desplazamientos[indice]:self.desplazamientos[indice + 1]], "utf-8")
+    
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+
+# Tabla de nombres que restaura el tipo original de cada uno
+class _TablaNombres(_TablaTextos):
+    """Tabla de solo lectura identificador -> nombre (str o int según su etiqueta)"""
+    
+    def __init__(self, desplazamientos, datos, tipos):
+        super().__init__(desplazamientos, datos)
+        # None en instantáneas anteriores a la versión 3 (todos los nombres son texto)
+        self.tipos = tipos
+    
+    def __getitem__(self, indice):
+        nombre = super().__getitem__(indice)
+        if isinstance(indice, slice) or self.tipos is None:
+            return nombre
+        if self.tipos[indice] == NOMBRE_ENTERO:
+            return int(nombre)
+        return nombre
+    
+    def clave(self, indice):
+        """Clave de orden (etiqueta, nombre) del módulo indicado"""
+        nombre = self[indice]
+        return (NOMBRE_ENTERO if type(nombre) is int else NOMBRE_TEXTO, nombre)
+
+
+# Índice nombre -> identificador por búsqueda binaria en el orden de los nombres
+class _IndiceNombres:
+    """Índice de solo lectura nombre -> identificador en O(log V), sin construir un diccionario"""
+    
+    def __init__(self, nombres, por_rango):
+        self.nombres = nombres
+        self.por_rango = por_rango
+    
+    def _buscar(self, nombre):
+        """Retorna el identificador del nombre o -1 si no existe"""
+        etiqueta = _etiqueta_nombre(nombre)
+        if etiqueta is None:
+            return -1
+        
+        # Se compara primero la etiqueta, así nunca se comparan textos con enteros
+        clave = (etiqueta, nombre)
+        inferior, superior = 0, len(self.por_rango)
+        while inferior < superior:
+            medio = (inferior + superior) // 2
+            if self.nombres.clave(self.por_rango[medio]) < clave:
+                inferior = medio + 1
+            else:
+                superior = medio
+        
+        if inferior < len(self.por_rango) and self.nombres.clave(self.por_rango[inferior]) == clave:
+            return self.por_rango[inferior]
+        return -1
+    
+    def __contains__(self, nombre):
+        return self._buscar(nombre) >= 0
+    
+    def __getitem__(self, nombre):
+        id_modulo = self._buscar(nombre)
+        if id_modulo < 0:
+            raise KeyError(nombre)
+        return id_modulo
+    
+    def __len__(self):
+        return len(self.por_rango)
+
+
+def _etiqueta_nombre(nombre):
+    """Etiqueta de tipo de un nombre de módulo, o None si no puede guardarse"""
+    if type(nombre) is str:
+        return NOMBRE_TEXTO
+    if type(nombre) is int:
+        return NOMBRE_ENTERO
+    return None
+
+
+# Clase InstantaneaGrafo con métodos estáticos para guardar y cargar instantáneas
+class InstantaneaGrafo:
+    ### Método para guardar una instantánea binaria
+    @staticmethod
+    def guardar(grafo, ruta):
+        """
+        Guarda el grafo en formato binario. Se escribe en un archivo temporal
+        que luego reemplaza al destino, para no dejar archivos a medias.
+        Los nombres de los módulos se guardan como texto con su etiqueta de tipo.
+        
+        Args:
+            grafo (GrafoDependencias o GrafoCompacto): Grafo a guardar
+            ruta (str): Ruta del archivo
+        
+        Returns:
+            int: Tamaño del archivo en bytes
+        
+        Raises:
+            ValueError: Si algún nombre de módulo no es str ni int
+        """
+        compacto = grafo if isinstance(grafo, GrafoCompacto) else grafo.congelar()
+        
+        tipos = array("b")
+        for nombre in compacto.nombres:
+            etiqueta = _etiqueta_nombre(nombre)
+            if etiqueta is None:
+                raise ValueError(
+                    f"La instantánea solo admite nombres str o int: {nombre!r} es {type(nombre).__name__}"
+                )
+            tipos.append(etiqueta)
+        
+        # Orden por (etiqueta, nombre): el mismo que usa _IndiceNombres al buscar
+        claves = [(tipos[id_modulo], nombre) for id_modulo, nombre in enumerate(compacto.nombres)]
+        por_rango = array("i", sorted(range(len(claves)), key=claves.__getitem__))
+        rango = array("i", bytes(4 * len(claves)))
+        for posicion, id_modulo in enumerate(por_rango):
+            rango[id_modulo] = posicion
+        
+        nombres = [str(nombre) for nombre in compacto.nombres]
+        nombres_desplazamientos, nombres_datos = InstantaneaGrafo._codificar_textos(nombres)
+        descripciones_desplazamientos, descripciones_datos = InstantaneaGrafo._codificar_textos(
+            compacto.descripciones
+        )
+        contenido = (
+            nombres_desplazamientos, nombres_datos,
+            descripciones_desplazamientos, descripciones_datos,
+            compacto.desplazamientos, compacto.destinos,
+            compacto.desplazamientos_inv, compacto.origenes,
+            rango, por_rango,
+            compacto.costos, tipos,
+        )
+        
+        # Calcular la ubicación de cada sección
+        ubicaciones = []
+        posicion = TAMANO_ENCABEZADO
+        for datos in contenido:
+            posicion = InstantaneaGrafo._alinear(posicion)
+            longitud = len(datos) * (datos.itemsize if isinstance(datos, array) else 1)
+            ubicaciones.extend((posicion, longitud))
+            posicion += longitud
+        
+        encabezado = struct.pack(
+            FORMATO_ENCABEZADO, FIRMA, VERSION, 0,
+            len(nombres), len(compacto.destinos), *ubicaciones
+        )
+        
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(encabezado)
+            for indice, datos in enumerate(contenido):
+                relleno = ubicaciones[2 * indice] - archivo.tell()
+                archivo.write(b"\0" * relleno)
+                archivo.write(InstantaneaGrafo._a_bytes(datos))
+            tamano = archivo.tell()
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+        
+        return tamano
+    
+    ### Método para cargar una instantánea como GrafoCompacto
+    @staticmethod
+    def cargar(ruta, usar_mmap=True):
+        """
+        Carga una instantánea como GrafoCompacto. Con mmap las tablas son vistas
+        sobre el archivo: el sistema operativo lee cada página al usarla.
+        
+        Args:
+            ruta (str): Ruta del archivo
+            usar_mmap (bool): False para leer el archivo completo en memoria
+        
+        Returns:
+            GrafoCompacto: Instantánea de solo lectura
+        
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida o su versión
+                        no es compatible
+        """
+        with open(ruta, "rb") as archivo:
+            if usar_mmap:
+                datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                datos = archivo.read()
+        
+        if len(datos) < struct.calcsize(FORMATO_FIRMA):
+            raise ValueError("El archivo no es una instantánea del grafo")
+        
+        firma, version = struct.unpack_from(FORMATO_FIRMA, datos, 0)
+        if firma != FIRMA:
+            raise ValueError("El archivo no es una instantánea del grafo")
+        if version not in SECCIONES_POR_VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version}")
+        
+        cantidad_secciones = SECCIONES_POR_VERSION[version]
+        formato = "<4sHHQQ" + "QQ" * cantidad_secciones
+        if len(datos) < struct.calcsize(formato):
+            raise ValueError("La instantánea está incompleta")
+        campos = struct.unpack_from(formato, datos, 0)
+        
+        vista = memoryview(datos)
+        # Las secciones que la versión no tiene toman su valor por defecto
+        secciones = dict.fromkeys(nombre for nombre, _ in SECCIONES)
+        for indice, (nombre, tipo) in enumerate(SECCIONES[:cantidad_secciones]):
+            inicio, longitud = campos[5 + 2 * indice], campos[6 + 2 * indice]
+            if inicio + longitud > len(datos):
+                raise ValueError("La instantánea está incompleta")
+            secciones[nombre] = InstantaneaGrafo._leer_seccion(vista[inicio:inicio + longitud], tipo)
+        
+        nombres = _TablaNombres(
+            secciones["nombres_desplazamientos"], secciones["nombres_datos"], secciones["nombres_tipos"]
+        )
+        descripciones = _TablaTextos(
+            secciones["descripciones_desplazamientos"], secciones["descripciones_datos"]
+        )
+        
+        return GrafoCompacto.desde_arreglos(
+            nombres,
+            _IndiceNombres(nombres, secciones["por_rango"]),
+            descripciones,
+            secciones["desplazamientos"],
+            secciones["destinos"],
+            secciones["desplazamientos_inv"],
+            secciones["origenes"],
+            secciones["rango"],
+            secciones["por_rango"],
+            secciones["costos"],
+        )
+    
+    ### Método para reconstruir un grafo modificable desde una instantánea
+    @staticmethod
+    def cargar_grafo(ruta):
+        """
+        Reconstruye un GrafoDependencias desde una instantánea usando la
+        inserción por lotes
+        
+        Args:
+            ruta (str): Ruta del archivo
+        
+        Returns:
+            GrafoDependencias: Grafo con los módulos y dependencias guardados
+        """
+        compacto = InstantaneaGrafo.cargar(ruta)
+        nombres = list(compacto.nombres)
+        grafo = GrafoDependencias()
+        
+        grafo.agregar_modulos_lote(zip(nombres, compacto.descripciones, compacto.costos))
+        grafo.agregar_dependencias_lote(
+            (nombres[origen], nombres[compacto.destinos[posicion]])
+            for origen in range(len(nombres))
+            for posicion in range(compacto.desplazamientos[origen], compacto.desplazamientos[origen + 1])
+        )
+        
+        return grafo
+    
+    ### Métodos auxiliares
+    @staticmethod
+    def _codificar_textos(textos):
+        """Concatena textos en UTF-8 y retorna (desplazamientos, datos)"""
+        desplazamientos = array("q", [0])
+        datos = bytearray()
+        
+        for texto in textos:
+            datos += texto.encode("utf-8")
+            desplazamientos.append(len(datos))
+        
+        return (desplazamientos, datos)
+    
+    @staticmethod
+    def _alinear(posicion):
+        """Redondea una posición al siguiente múltiplo de 8"""
+        return (posicion + 7) & ~7
+    
+    @staticmethod
+    def _a_bytes(datos):
+        """Convierte una sección a bytes little-endian"""
+        if isinstance(datos, array):
+            if sys.byteorder == "big":
+                datos = array(datos.typecode, datos)
+                datos.byteswap()
+            return datos.tobytes()
+        return bytes(datos)
+    
+    @staticmethod
+    def _leer_seccion(vista, tipo):
+        """Interpreta una sección: sin copiar si el orden de bytes coincide"""
+        if tipo is None:
+            return vista
+        if sys.byteorder == "little":
+            return vista.cast(tipo)
+        
+        arreglo = array(tipo, vista.tobytes())
+        arreglo.byteswap()
+        return arreglo
@@ -0,0 +1,84 @@
+# ReporteMemoria.py
+"""Módulo para medir la memoria que ocupa el grafo de dependencias por módulo y por arista.
+   Construye un grafo sintético como lo haría una importación real (cada aparición de un nombre
+   llega como una cadena nueva) y mide con tracemalloc lo que retiene cada fase.
+   
+   Uso: python -m utils.ReporteMemoria [cantidad_modulos] [dependencias_por_modulo]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from models.Grafo import GrafoDependencias
+
+
+# Clase ReporteMemoria con métodos estáticos para medir el grafo
+class ReporteMemoria:
+    ### Método para medir un grafo sintético
+    @staticmethod
+    def medir(cantidad_modulos=200000, dependencias_por_modulo=4, semilla=0):
+        """
+        Construye un grafo sintético acíclico y mide la memoria retenida por
+        los módulos y por las dependencias
+        
+        Args:
+            cantidad_modulos (int): Cantidad de módulos del grafo
+            dependencias_por_modulo (int): Dependencias (como máximo) de cada módulo
+            semilla (int): Semilla del generador de aristas
+        
+        Returns:
+            dict: Diccionario con el total de módulos y aristas, los bytes de
+                  cada fase y los bytes por módulo y por arista
+        """
+        aleatorio = random.Random(semilla)
+        grafo = GrafoDependencias()
+        
+        gc.collect()
+        tracemalloc.start()
+        try:
+            inicio = tracemalloc.get_traced_memory()[0]
+            for indice in range(cantidad_modulos):
+                grafo.agregar_modulo(ReporteMemoria._nombre(indice))
+            gc.collect()
+            con_modulos = tracemalloc.get_traced_memory()[0]
+            
+            for indice in range(1, cantidad_modulos):
+                for _ in range(dependencias_por_modulo):
+                    grafo.agregar_dependencia(
+                        ReporteMemoria._nombre(indice),
+                        ReporteMemoria._nombre(aleatorio.randrange(indice))
+                    )
+            gc.collect()
+            con_aristas = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        
+        bytes_modulos = con_modulos - inicio
+        bytes_aristas = con_aristas - con_modulos
+        total_aristas = grafo.total_dependencias
+        
+        return {
+            "total_modulos": cantidad_modulos,
+            "total_dependencias": total_aristas,
+            "bytes_modulos": bytes_modulos,
+            "bytes_dependencias": bytes_aristas,
+            "bytes_por_modulo": bytes_modulos / cantidad_modulos if cantidad_modulos else 0.0,
+            "bytes_por_arista": bytes_aristas / total_aristas if total_aristas else 0.0
+        }
+    
+    ### Método auxiliar
+    @staticmethod
+    def _nombre(indice):
+        """Crea una cadena nueva para el nombre del módulo, como al leerlo de un archivo"""
+        return "".join(("paquete/modulo_", str(indice)))
+
+
+if __name__ == "__main__":
+    modulos = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    dependencias = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    reporte = ReporteMemoria.medir(modulos, dependencias)
+    
+    print(f"Módulos: {reporte['total_modulos']}  Dependencias: {reporte['total_dependencias']}")
+    print(f"Bytes por módulo: {reporte['bytes_por_modulo']:.1f}")
+    print(f"Bytes por arista: {reporte['bytes_por_arista']:.1f}")